@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { getMessages, markMessageRead, deleteMessage } from '../services/Api.js';
+import { getMessages, markMessageRead, markMessagesRead, deleteMessage, deleteMessages } from '../services/Api.js';
 import './Manager.css';
 
 export default function MessagesManager() {
@@ -54,6 +54,36 @@ export default function MessagesManager() {
     }
   };
 
+  const handleMarkAllRead = async () => {
+    const unreadIds = messages.filter(msg => !msg.read).map(msg => msg._id);
+    if (unreadIds.length === 0) return;
+
+    try {
+      await markMessagesRead(unreadIds);
+      showMessage('success', `${unreadIds.length} Message(s) Marked As Read`);
+      loadMessages();
+    } catch (error) {
+      console.error('Bulk Mark Read Error:', error);
+      showMessage('error', 'Failed To Mark Messages As Read');
+    }
+  };
+
+  const handleDeleteRead = async () => {
+    const readIds = messages.filter(msg => msg.read).map(msg => msg._id);
+    if (readIds.length === 0) return;
+    if (!window.confirm(`Delete All ${readIds.length} Read Message(s)?`)) return;
+
+    try {
+      await deleteMessages(readIds);
+      showMessage('success', `${readIds.length} Message(s) Deleted`);
+      setSelectedMessage(null);
+      loadMessages();
+    } catch (error) {
+      console.error('Bulk Delete Error:', error);
+      showMessage('error', 'Failed To Delete Messages');
+    }
+  };
+
   const openMessage = async (msg) => {
     setSelectedMessage(msg);
     if (!msg.read) {
@@ -115,6 +145,12 @@ export default function MessagesManager() {
           >
             Read ({messages.length - unreadCount})
           </button>
+          <button className="filter-btn" onClick={handleMarkAllRead} disabled={unreadCount === 0}>
+            Mark All Read
+          </button>
+          <button className="filter-btn" onClick={handleDeleteRead} disabled={messages.length === unreadCount}>
+            Delete Read
+          </button>
         </div>
       </div>
 
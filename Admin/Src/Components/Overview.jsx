@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { MdPhotoCamera, MdMovie, MdContentCut, MdEmail, MdAdd, MdEdit, MdBarChart } from 'react-icons/md';
-import { getPhotos, getVideos, getEdits, getMessages, getAnalyticsStats, getRealtimeVisitors } from '../services/Api.js';
+import { getPhotos, getVideos, getEdits, getMessages, getMessageStats, getAnalyticsStats, getRealtimeVisitors } from '../services/Api.js';
 import './Manager.css';
 
 export default function Overview() {
@@ -66,11 +66,12 @@ export default function Overview() {
 
   const loadStats = async () => {
     try {
-      const [photosRes, videosRes, editsRes, messagesRes] = await Promise.all([
+      const [photosRes, videosRes, editsRes, messagesRes, inboxRes] = await Promise.all([
         getPhotos().catch(() => ({ data: [] })),
         getVideos().catch(() => ({ data: [] })),
         getEdits().catch(() => ({ data: [] })),
-        getMessages().catch(() => ({ data: [] }))
+        getMessages({ limit: 5 }).catch(() => ({ data: [] })),
+        getMessageStats().catch(() => ({ data: {} }))
       ]);
 
       const messages = messagesRes.data || [];
@@ -79,8 +80,8 @@ export default function Overview() {
         photos: photosRes.data?.length || 0,
         videos: videosRes.data?.length || 0,
         edits: editsRes.data?.length || 0,
-        messages: messages.length,
-        unreadMessages: messages.filter(m => !m.read).length
+        messages: inboxRes.data?.total || 0,
+        unreadMessages: inboxRes.data?.unread || 0
       });
 
       setRecentMessages(messages.slice(0, 5));
@@ -31,6 +31,8 @@ export default function PhotosManager() {
     category: '',
     image_url: '',
     thumbnail_url: '',
+    variants: [],
+    srcset: {},
     tags: [],
     published: true,
     order: 0
@@ -68,6 +70,8 @@ export default function PhotosManager() {
       category: '',
       image_url: '',
       thumbnail_url: '',
+      variants: [],
+      srcset: {},
       tags: [],
       published: true,
       order: 0
@@ -85,6 +89,8 @@ export default function PhotosManager() {
         category: photo.category || '',
         image_url: photo.image_url || '',
         thumbnail_url: photo.thumbnail_url || '',
+        variants: photo.variants || [],
+        srcset: photo.srcset || {},
         tags: photo.tags || [],
         published: photo.published !== undefined ? photo.published : true,
         order: photo.order || 0
@@ -187,7 +193,21 @@ export default function PhotosManager() {
       });
       if (!res.ok) throw new Error('Image Upload Failed');
       const data = await res.json();
-      setFormData(prev => ({ ...prev, image_url: data.image_url }));
+      setFormData(prev => ({
+        ...prev,
+        image_url: data.image_url,
+        thumbnail_url: data.thumbnail_url || prev.thumbnail_url,
+        variants: data.variants || [],
+        srcset: data.srcset || {},
+        width: data.width,
+        height: data.height,
+        dominant_color: data.dominant_color,
+        placeholder: data.placeholder,
+        orientation: data.orientation,
+        captured_at: data.captured_at,
+        camera: data.camera,
+        lens: data.lens
+      }));
       showMessage('success', 'Photo Image Uploaded!');
     } catch (err) {
       showMessage('error', 'Failed To Upload Image');
@@ -204,7 +204,14 @@ export default function VideosManager() {
       });
       if (!res.ok) throw new Error('Video Upload Failed');
       const data = await res.json();
-      setFormData(prev => ({ ...prev, video_url: data.video_url }));
+      setFormData(prev => ({
+        ...prev,
+        video_url: data.video_url,
+        duration: data.duration,
+        width: data.width,
+        height: data.height,
+        orientation: data.orientation
+      }));
       showMessage('success', 'Video Uploaded!');
     } catch (err) {
       showMessage('error', 'Failed To Upload Video');
@@ -7,13 +7,20 @@ import PhotosManager from '../Components/PhotosManager.jsx';
 import VideosManager from '../Components/VideosManager.jsx';
 import EditsManager from '../Components/EditsManager.jsx';
 import MessagesManager from '../Components/MessagesManager.jsx';
+import { logout } from '../services/Api.js';
 import './Dashboard.css';
 
 export default function Dashboard({ setIsAuthenticated }) {
   const location = useLocation();
   const navigate = useNavigate();
 
-  const handleLogout = () => {
+  const handleLogout = async () => {
+    try {
+      // Revoke The Token Server-Side So It Stops Working Immediately
+      await logout();
+    } catch (error) {
+      console.error('Error Logging Out:', error);
+    }
     localStorage.removeItem('admin_token');
     setIsAuthenticated(false);
     navigate('/login');
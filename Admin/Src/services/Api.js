@@ -73,6 +73,9 @@ export const login = (email, password) =>
 export const verifyToken = () => 
   api.get('/api/auth/verify');
 
+export const logout = () => 
+  api.post('/api/auth/logout');
+
 // Profile
 export const getProfile = () => api.get('/api/profile');
 export const updateProfile = (data) => api.put('/api/profile', data);
@@ -101,9 +104,12 @@ export const getEditCategories = () => api.get('/api/edits/categories');
 export const getFeaturedEdit = () => api.get('/api/edits/featured');
 
 // Messages
-export const getMessages = () => api.get('/api/contact');
+export const getMessages = (params) => api.get('/api/contact', { params });
+export const getMessageStats = () => api.get('/api/contact/stats');
 export const markMessageRead = (id) => api.put(`/api/contact/${id}/read`);
+export const markMessagesRead = (ids) => api.put('/api/contact/bulk/read', { ids });
 export const deleteMessage = (id) => api.delete(`/api/contact/${id}`);
+export const deleteMessages = (ids) => api.post('/api/contact/bulk/delete', { ids });
 
 // Analytics
 export const getAnalyticsStats = () => api.get('/api/analytics/stats');
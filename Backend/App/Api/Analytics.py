@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Request
 from App.Core.Database import get_database
+from App.Core.Deadlines import is_timeout
 from datetime import datetime, timedelta
 from typing import Optional
 import logging
@@ -26,6 +27,8 @@ async def track_visit(request: Request):
         await db.analytics.insert_one(visit_data)
         return {"status": "tracked"}
     except Exception as e:
+        if is_timeout(e):
+            raise  # Surfaces As 503/504 From The Request Budget
         logger.error(f"Error Tracking Visit: {e}")
         return {"status": "error", "message": str(e)}
 
@@ -100,6 +103,8 @@ async def get_analytics_stats(hours: int = 24):
             "topPages": top_pages
         }
     except Exception as e:
+        if is_timeout(e):
+            raise  # Surfaces As 503/504 From The Request Budget
         logger.error(f"Error Getting Analytics: {e}")
         # Return Empty Data If DB Not Available
         return {
@@ -121,5 +126,7 @@ async def get_realtime_visitors():
         
         return {"activeNow": count}
     except Exception as e:
+        if is_timeout(e):
+            raise  # Surfaces As 503/504 From The Request Budget
         logger.error(f"Error Getting Realtime: {e}")
         return {"activeNow": 0}
\ No newline at end of file
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from App.Models.Schemas import UserLogin, Token
-from App.Core.Security import verify_password, create_access_token, decode_access_token, get_password_hash
+from App.Core.Security import verify_password, create_access_token, decode_access_token, get_password_hash, revoke_token
 from App.Core.Config import settings
 from datetime import timedelta
 
@@ -33,7 +33,7 @@ async def login(user: UserLogin):
     return {"access_token": access_token, "token_type": "bearer"}
 
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+async def get_token_payload(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     token = credentials.credentials
     payload = decode_access_token(token)
     
@@ -50,9 +50,31 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             detail="Could Not Validate Credentials"
         )
     
-    return email
+    return payload
+
+
+async def get_current_user(payload: dict = Depends(get_token_payload)):
+    return payload["sub"]
 
 
 @router.get("/verify")
 async def verify_token(current_user: str = Depends(get_current_user)):
-    return {"email": current_user, "authenticated": True}
\ No newline at end of file
+    return {"email": current_user, "authenticated": True}
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh_token(payload: dict = Depends(get_token_payload)):
+    # Rotate: Issue A Fresh Token And Revoke The One Presented
+    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    access_token = create_access_token(
+        data={"sub": payload["sub"]}, expires_delta=access_token_expires
+    )
+    await revoke_token(payload)
+    
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.post("/logout")
+async def logout(payload: dict = Depends(get_token_payload)):
+    await revoke_token(payload)
+    return {"message": "Logged Out Successfully"}
\ No newline at end of file
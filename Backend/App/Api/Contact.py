@@ -1,15 +1,46 @@
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List
 from bson import ObjectId
-from App.Models.Schemas import ContactMessage, ContactMessageCreate
+from App.Models.Schemas import ContactMessage, ContactMessageCreate, ContactMessageIds
+from App.Core.Config import settings
 from App.Core.Database import get_database
 from App.Api.Auth import get_current_user
+from App.Core.Notifications import notify_contact_message
+from App.Core.Deadlines import is_timeout
 from datetime import datetime
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Inbox Counters, Loaded At Startup And Kept Current By The Write Paths Below. Other
+# Workers' Writes Aren't Seen Here, So /stats Recounts Once They Are Older Than
+# inbox_counts_ttl_seconds
+inbox_counts = {"total": 0, "unread": 0}
+_inbox_counted_at = None
+
+
+async def load_inbox_counts():
+    """Count Messages; Until The Next Recount Every Insert/Read/Delete Adjusts The Counters"""
+    global _inbox_counted_at
+    try:
+        db = get_database()
+        inbox_counts["total"] = await db.contact_messages.count_documents({})
+        inbox_counts["unread"] = await db.contact_messages.count_documents({"read": False})
+    except Exception as e:
+        logger.warning(f"Could Not Count Inbox Messages: {e}")
+        return
+    _inbox_counted_at = time.monotonic()
+    logger.info(f"Inbox: {inbox_counts['total']} Message(s), {inbox_counts['unread']} Unread")
+
+
+def _parse_ids(ids: List[str]) -> List[ObjectId]:
+    invalid = [message_id for message_id in ids if not ObjectId.is_valid(message_id)]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid Message ID(s): {', '.join(invalid)}")
+    return [ObjectId(message_id) for message_id in set(ids)]
+
 
 @router.post("")
 async def create_contact_message(message: ContactMessageCreate):
@@ -22,9 +53,11 @@ async def create_contact_message(message: ContactMessageCreate):
         message_dict["read"] = False
         
         result = await db.contact_messages.insert_one(message_dict)
+        inbox_counts["total"] += 1
+        inbox_counts["unread"] += 1
         
-        # TODO: Send Email Notification
-        # This Would Integrate With SMTP Settings
+        # Email Is Sent By The Background Notification Worker
+        notify_contact_message(message_dict)
         
         logger.info(f"Contact Message Created : {result.inserted_id}")
         return {
@@ -32,6 +65,8 @@ async def create_contact_message(message: ContactMessageCreate):
             "id": str(result.inserted_id)
         }
     except Exception as e:
+        if is_timeout(e):
+            raise  # Surfaces As 503/504 From The Request Budget
         logger.error(f"Error Creating Contact Message: {e}")
         raise HTTPException(status_code=500, detail="Failed To Send Message")
 
@@ -55,6 +90,56 @@ async def get_contact_messages(
     return messages
 
 
+@router.get("/stats")
+async def get_inbox_stats(
+    refresh: bool = False,
+    current_user: str = Depends(get_current_user)
+):
+    """Unread And Total Counts From Memory, Recounted When Stale; refresh=true Always Recounts"""
+    if refresh or _inbox_counted_at is None or time.monotonic() - _inbox_counted_at >= settings.inbox_counts_ttl_seconds:
+        await load_inbox_counts()
+    return {
+        "total": inbox_counts["total"],
+        "unread": inbox_counts["unread"],
+        "read": inbox_counts["total"] - inbox_counts["unread"],
+    }
+
+
+@router.put("/bulk/read")
+async def mark_messages_read(
+    payload: ContactMessageIds,
+    current_user: str = Depends(get_current_user)
+):
+    db = get_database()
+    ids = _parse_ids(payload.ids)
+    
+    result = await db.contact_messages.update_many(
+        {"_id": {"$in": ids}, "read": False},
+        {"$set": {"read": True}}
+    )
+    inbox_counts["unread"] -= result.modified_count
+    
+    return {"message": "Messages Marked As Read", "updated": result.modified_count}
+
+
+@router.post("/bulk/delete")
+async def delete_contact_messages(
+    payload: ContactMessageIds,
+    current_user: str = Depends(get_current_user)
+):
+    db = get_database()
+    ids = _parse_ids(payload.ids)
+    
+    # A Message Marked Read In Between Skews The Counters Until The Next Recount
+    unread = await db.contact_messages.count_documents({"_id": {"$in": ids}, "read": False})
+    result = await db.contact_messages.delete_many({"_id": {"$in": ids}})
+    deleted = result.deleted_count
+    inbox_counts["unread"] -= min(unread, deleted)
+    inbox_counts["total"] -= deleted
+    
+    return {"message": "Messages Deleted Successfully", "deleted": deleted}
+
+
 @router.get("/{message_id}", response_model=ContactMessage)
 async def get_contact_message(
     message_id: str,
@@ -90,6 +175,7 @@ async def mark_message_read(
     
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Message Not Found")
+    inbox_counts["unread"] -= result.modified_count
     
     return {"message": "Message Marked As Read"}
 
@@ -104,9 +190,15 @@ async def delete_contact_message(
     if not ObjectId.is_valid(message_id):
         raise HTTPException(status_code=400, detail="Invalid Message ID")
     
-    result = await db.contact_messages.delete_one({"_id": ObjectId(message_id)})
+    deleted = await db.contact_messages.find_one_and_delete(
+        {"_id": ObjectId(message_id)},
+        projection={"read": 1}
+    )
     
-    if result.deleted_count == 0:
+    if not deleted:
         raise HTTPException(status_code=404, detail="Message Not Found")
+    inbox_counts["total"] -= 1
+    if not deleted.get("read"):
+        inbox_counts["unread"] -= 1
     
     return {"message": "Message Deleted Successfully"}
\ No newline at end of file
@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from App.Core.Config import settings
+from App.Core.Database import db_breaker
+from App.Core.Metrics import mongo_pool_stats
+from App.Core.SlowQueries import slow_query_log
+from App.Core.LoopMonitor import loop_monitor
+from App.Core.Profiler import get_profile, list_profiles
+from App.Api.Auth import get_current_user
+
+router = APIRouter()
+
+SLOW_QUERY_SORT_FIELDS = ("total_ms", "max_ms", "count")
+
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    limit: int = 10,
+    sort_by: str = "total_ms",
+    current_user: str = Depends(get_current_user)
+):
+    """Slowest Query Shapes Since Startup, With Their Latest explain Summary"""
+    if sort_by not in SLOW_QUERY_SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"sort_by Must Be One Of: {', '.join(SLOW_QUERY_SORT_FIELDS)}")
+    return slow_query_log.top(limit, sort_by)
+
+
+@router.delete("/slow-queries")
+async def reset_slow_queries(current_user: str = Depends(get_current_user)):
+    slow_query_log.reset()
+    return {"message": "Slow Query Log Cleared"}
+
+
+@router.get("/database")
+async def get_database_status(current_user: str = Depends(get_current_user)):
+    """Circuit Breaker State With The Last Error, And Connection Pool Counters Per Server"""
+    return {
+        "breaker": db_breaker.snapshot(),
+        "mongo_pool": {
+            "max_size": settings.mongo_max_pool_size,
+            "min_size": settings.mongo_min_pool_size,
+            "servers": mongo_pool_stats.snapshot(),
+        },
+    }
+
+
+@router.get("/loop-stalls")
+async def get_loop_stalls(current_user: str = Depends(get_current_user)):
+    """Recent Event Loop Stalls (Newest First) With The Stack That Was Blocking"""
+    return loop_monitor.recent_stalls()
+
+
+@router.get("/profiles")
+async def get_profiles(current_user: str = Depends(get_current_user)):
+    """Recently Profiled Requests (Newest First)"""
+    return list_profiles()
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile_stacks(
+    profile_id: int,
+    current_user: str = Depends(get_current_user)
+):
+    """Folded Stacks For One Profile, Ready For flamegraph.pl Or speedscope"""
+    profile = get_profile(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile Not Found")
+    return PlainTextResponse(profile["folded"])
@@ -2,25 +2,31 @@ from fastapi import APIRouter, Depends, HTTPException
 from typing import List
 from bson import ObjectId
 from App.Models.Schemas import EditProject, EditProjectCreate, EditProjectUpdate
-from App.Core.Database import get_database
+from App.Core.Database import get_database, get_read_database
 from App.Api.Auth import get_current_user
+from App.Core.Config import settings
+from App.Core.MediaJobs import enqueue_upload
+from App.Core.Snapshots import StaleWhileUnavailable, site_reads
+from App.Core.StaticExport import register_static_collection, schedule_export
+from App.Core.UploadService import upload_video
 from datetime import datetime
 
 router = APIRouter()
+
+# Defaults Of get_edits Other Than category
+edit_reads = StaleWhileUnavailable("edits", pinned=site_reads(True, 0, 100))
+
 # Cloudinary Upload Endpoint For Video Edits
 from fastapi import UploadFile, File
 @router.post("/upload-video")
 async def upload_edit_video(
     file: UploadFile = File(...),
+    background: bool = False,
     current_user: str = Depends(get_current_user)
 ):
-    from App.Core.CloudinaryUtil import cloudinary
-    result = cloudinary.uploader.upload(
-        await file.read(),
-        folder="edit_videos",
-        resource_type="video"
-    )
-    return {"video_url": result["secure_url"]}
+    if background:
+        return await enqueue_upload(file, "edit_videos", "video", "video_url", settings.max_video_upload_size)
+    return await upload_video(file, folder="edit_videos")
 
 
 @router.get("", response_model=List[EditProject])
@@ -30,8 +36,6 @@ async def get_edits(
     skip: int = 0,
     limit: int = 100
 ):
-    db = get_database()
-    
     query = {}
     if published_only:
         query["published"] = True
@@ -39,28 +43,32 @@ async def get_edits(
     if category:
         query["category"] = category
     
-    cursor = db.edit_projects.find(query).sort("order", 1).skip(skip).limit(limit)
-    edits = await cursor.to_list(length=limit)
+    async def find_edits():
+        cursor = get_read_database().edit_projects.find(query).sort("order", 1).skip(skip).limit(limit)
+        return await cursor.to_list(length=limit)
+    
+    edits = await edit_reads.do(("list", published_only, category, skip, limit), find_edits)
     
     return edits
 
 
 @router.get("/categories", response_model=dict)
 async def get_edit_categories():
-    db = get_database()
-    categories = await db.edit_projects.distinct("category")
+    categories = await edit_reads.do(("categories",), lambda: get_read_database().edit_projects.distinct("category"))
     return {"categories": categories}
 
 
 @router.get("/featured", response_model=EditProject)
 async def get_featured_edit():
-    db = get_database()
+    async def find_featured():
+        db = get_read_database()
+        edit = await db.edit_projects.find_one({"is_featured": True, "published": True})
+        if not edit:
+            # Return First Published Edit If No Featured
+            edit = await db.edit_projects.find_one({"published": True})
+        return edit
     
-    edit = await db.edit_projects.find_one({"is_featured": True, "published": True})
-    
-    if not edit:
-        # Return First Published Edit If No Featured
-        edit = await db.edit_projects.find_one({"published": True})
+    edit = await edit_reads.do(("featured",), find_featured)
     
     if not edit:
         raise HTTPException(status_code=404, detail="No Featured Edit Found")
@@ -70,12 +78,10 @@ async def get_featured_edit():
 
 @router.get("/{edit_id}", response_model=EditProject)
 async def get_edit(edit_id: str):
-    db = get_database()
-    
     if not ObjectId.is_valid(edit_id):
         raise HTTPException(status_code=400, detail="Invalid Edit ID")
     
-    edit = await db.edit_projects.find_one({"_id": ObjectId(edit_id)})
+    edit = await edit_reads.do(("detail", edit_id), lambda: get_read_database().edit_projects.find_one({"_id": ObjectId(edit_id)}))
     
     if not edit:
         raise HTTPException(status_code=404, detail="Edit Not Found")
@@ -103,6 +109,8 @@ async def create_edit(
     
     result = await db.edit_projects.insert_one(edit_dict)
     created_edit = await db.edit_projects.find_one({"_id": result.inserted_id})
+    # Featuring One Edit Unfeatures Others, Which Can Sit In Any Category's List
+    schedule_export("edits", edit_dict.get("category"), everything=edit.is_featured)
     
     return created_edit
 
@@ -129,15 +137,16 @@ async def update_edit(
     
     edit_dict["updated_at"] = datetime.utcnow()
     
-    result = await db.edit_projects.update_one(
+    previous = await db.edit_projects.find_one_and_update(
         {"_id": ObjectId(edit_id)},
         {"$set": edit_dict}
     )
     
-    if result.matched_count == 0:
+    if previous is None:
         raise HTTPException(status_code=404, detail="Edit Not Found")
     
     updated_edit = await db.edit_projects.find_one({"_id": ObjectId(edit_id)})
+    schedule_export("edits", previous.get("category"), edit_dict.get("category"), everything=bool(edit_dict.get("is_featured")))
     return updated_edit
 
 
@@ -151,9 +160,15 @@ async def delete_edit(
     if not ObjectId.is_valid(edit_id):
         raise HTTPException(status_code=400, detail="Invalid Edit ID")
     
-    result = await db.edit_projects.delete_one({"_id": ObjectId(edit_id)})
+    deleted = await db.edit_projects.find_one_and_delete({"_id": ObjectId(edit_id)})
     
-    if result.deleted_count == 0:
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Edit Not Found")
     
-    return {"message": "Edit Deleted Successfully"}
\ No newline at end of file
+    schedule_export("edits", deleted.get("category"))
+    
+    return {"message": "Edit Deleted Successfully"}
+
+
+# Public Views Rendered To Static Files For nginx (See App/Core/StaticExport.py)
+register_static_collection("edits", EditProject, get_edits, get_edit_categories, extras={"featured": get_featured_edit})
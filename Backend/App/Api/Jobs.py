@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, HTTPException
+from bson import ObjectId
+from App.Core.Config import settings
+from App.Core.Jobs import enqueue_job, get_job
+from App.Api.Auth import get_current_user
+
+router = APIRouter()
+
+
+@router.post("/static-export", status_code=202)
+async def start_static_export(current_user: str = Depends(get_current_user)):
+    """Queue A Full Render Of The Public API Into The Static Export Directory"""
+    if not settings.static_export_enabled:
+        raise HTTPException(status_code=409, detail="Static Export Is Disabled (Set STATIC_EXPORT_ENABLED)")
+    job_id = await enqueue_job("static_export", {})
+    return {"job_id": job_id, "status": "queued", "status_url": f"/api/jobs/{job_id}"}
+
+
+@router.get("/{job_id}")
+async def get_job_status(
+    job_id: str,
+    current_user: str = Depends(get_current_user)
+):
+    if not ObjectId.is_valid(job_id):
+        raise HTTPException(status_code=400, detail="Invalid Job ID")
+
+    job = await get_job(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job Not Found")
+
+    return job
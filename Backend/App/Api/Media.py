@@ -0,0 +1,25 @@
+import anyio.to_thread
+from fastapi import APIRouter, HTTPException, Request
+from App.Core.Config import settings
+from App.Core.FileServing import file_response
+from App.Core.Storage import LocalStorage
+
+router = APIRouter()
+
+# Files Written By The Local Storage Backend Are Served From The Same Root. Under
+# Uvicorn Bodies Are Read In Chunks By Python; Put nginx In Front For sendfile.
+local_media = LocalStorage(settings.media_root, settings.media_url_prefix)
+
+
+@router.api_route("/{media_path:path}", methods=["GET", "HEAD"])
+async def serve_media(media_path: str, request: Request):
+    try:
+        # Resolving Symlinks And Stat-ing Touch The Disk, So Neither Runs On The Event Loop
+        path = await anyio.to_thread.run_sync(local_media.resolve, media_path)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Media Not Found")
+
+    try:
+        return await file_response(request, str(path))
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail="Media Not Found")
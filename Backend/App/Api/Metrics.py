@@ -0,0 +1,24 @@
+import hmac
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from App.Core.Config import settings
+from App.Core.Metrics import render_metrics
+from App.Api.Auth import get_token_payload
+
+router = APIRouter()
+bearer = HTTPBearer(auto_error=False)
+
+
+async def require_metrics_access(credentials: HTTPAuthorizationCredentials = Depends(bearer)):
+    """Accept The Dedicated Scrape Token Or A Regular Admin Token"""
+    if credentials is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not Authenticated")
+    if settings.metrics_token and hmac.compare_digest(credentials.credentials, settings.metrics_token):
+        return
+    await get_token_payload(credentials)
+
+
+@router.get("", response_class=PlainTextResponse)
+async def get_metrics(_: None = Depends(require_metrics_access)):
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -1,61 +1,93 @@
-
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from typing import List, Optional
 from bson import ObjectId
 from App.Models.Schemas import PhotoProject, PhotoProjectCreate, PhotoProjectUpdate
-from App.Core.Database import get_database
+from App.Core.Database import get_database, get_read_database
 from App.Api.Auth import get_current_user
-from App.Core.CloudinaryUtil import upload_image_to_cloudinary
+from App.Core.Config import settings
+from App.Core.ImageProcessing import process_photo
+from App.Core.MediaJobs import enqueue_upload
+from App.Core.Snapshots import StaleWhileUnavailable, site_reads
+from App.Core.StaticExport import register_static_collection, schedule_export
+from App.Core.Streaming import spool_upload
 from datetime import datetime
 
 router = APIRouter()
 
-# Cloudinary Upload Endpoint For Photo Images
+# Defaults Of get_photos Other Than category
+photo_reads = StaleWhileUnavailable("photos", pinned=site_reads(True, None, None, None, None, "order", False, 0, 100))
+
+PHOTO_SORT_FIELDS = ("order", "captured_at", "created_at")
+
+# Cloudinary Upload Endpoint For Photo Images (Original Plus Responsive Variants)
 @router.post("/upload-image")
 async def upload_photo_image(
     file: UploadFile = File(...),
+    background: bool = False,
     current_user: str = Depends(get_current_user)
 ):
-    url = upload_image_to_cloudinary(await file.read(), folder="photo_images")
-    return {"image_url": url}
+    if background:
+        return await enqueue_upload(file, "photo_images", "image", "image_url", settings.max_image_upload_size, kind="photo")
+    with await spool_upload(file, settings.max_image_upload_size) as spooled:
+        return await process_photo(spooled, folder="photo_images")
 
 
 @router.get("", response_model=List[PhotoProject])
 async def get_photos(
     published_only: bool = True,
     category: Optional[str] = None,
+    camera: Optional[str] = None,
+    orientation: Optional[str] = None,
+    captured_after: Optional[datetime] = None,
+    captured_before: Optional[datetime] = None,
+    sort_by: str = "order",
+    descending: bool = False,
     skip: int = 0,
     limit: int = 100
 ):
-    db = get_database()
+    if sort_by not in PHOTO_SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Invalid Sort Field. Allowed: {', '.join(PHOTO_SORT_FIELDS)}")
     
     query = {}
     if published_only:
         query["published"] = True
     if category:
         query["category"] = category
-    
-    cursor = db.photo_projects.find(query).sort("order", 1).skip(skip).limit(limit)
-    photos = await cursor.to_list(length=limit)
+    if camera:
+        query["camera"] = camera
+    if orientation:
+        query["orientation"] = orientation
+    if captured_after or captured_before:
+        query["captured_at"] = {}
+        if captured_after:
+            query["captured_at"]["$gte"] = captured_after
+        if captured_before:
+            query["captured_at"]["$lte"] = captured_before
+    
+    direction = -1 if descending else 1
+    
+    async def find_photos():
+        cursor = get_read_database().photo_projects.find(query).sort([(sort_by, direction), ("_id", direction)]).skip(skip).limit(limit)
+        return await cursor.to_list(length=limit)
+    
+    key = ("list", published_only, category, camera, orientation, captured_after, captured_before, sort_by, descending, skip, limit)
+    photos = await photo_reads.do(key, find_photos)
     
     return photos
 
 
 @router.get("/categories")
 async def get_photo_categories():
-    db = get_database()
-    categories = await db.photo_projects.distinct("category")
+    categories = await photo_reads.do(("categories",), lambda: get_read_database().photo_projects.distinct("category"))
     return {"categories": categories}
 
 
 @router.get("/{photo_id}", response_model=PhotoProject)
 async def get_photo(photo_id: str):
-    db = get_database()
-    
     if not ObjectId.is_valid(photo_id):
         raise HTTPException(status_code=400, detail="Invalid Photo ID")
     
-    photo = await db.photo_projects.find_one({"_id": ObjectId(photo_id)})
+    photo = await photo_reads.do(("detail", photo_id), lambda: get_read_database().photo_projects.find_one({"_id": ObjectId(photo_id)}))
     
     if not photo:
         raise HTTPException(status_code=404, detail="Photo Not Found")
@@ -74,6 +106,7 @@ async def create_photo(
     photo_dict["updated_at"] = datetime.utcnow()
     result = await db.photo_projects.insert_one(photo_dict)
     created_photo = await db.photo_projects.find_one({"_id": result.inserted_id})
+    schedule_export("photos", photo_dict.get("category"))
     return created_photo
 
 
@@ -91,15 +124,16 @@ async def update_photo(
     photo_dict = {k: v for k, v in photo.dict().items() if v is not None}
     photo_dict["updated_at"] = datetime.utcnow()
     
-    result = await db.photo_projects.update_one(
+    previous = await db.photo_projects.find_one_and_update(
         {"_id": ObjectId(photo_id)},
         {"$set": photo_dict}
     )
     
-    if result.matched_count == 0:
+    if previous is None:
         raise HTTPException(status_code=404, detail="Photo Not Found")
     
     updated_photo = await db.photo_projects.find_one({"_id": ObjectId(photo_id)})
+    schedule_export("photos", previous.get("category"), photo_dict.get("category"))
     return updated_photo
 
 
@@ -113,9 +147,15 @@ async def delete_photo(
     if not ObjectId.is_valid(photo_id):
         raise HTTPException(status_code=400, detail="Invalid Photo ID")
     
-    result = await db.photo_projects.delete_one({"_id": ObjectId(photo_id)})
+    deleted = await db.photo_projects.find_one_and_delete({"_id": ObjectId(photo_id)})
     
-    if result.deleted_count == 0:
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Photo Not Found")
     
-    return {"message": "Photo Deleted Successfully"}
\ No newline at end of file
+    schedule_export("photos", deleted.get("category"))
+    
+    return {"message": "Photo Deleted Successfully"}
+
+
+# Public Views Rendered To Static Files For nginx (See App/Core/StaticExport.py)
+register_static_collection("photos", PhotoProject, get_photos, get_photo_categories)
@@ -1,13 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request
+from typing import List, Optional
 from bson import ObjectId
 from App.Models.Schemas import Profile, ProfileCreate, ProfileUpdate
-from App.Core.CloudinaryUtil import upload_image_to_cloudinary
+from App.Core.UploadService import upload_image
 from App.Core.Database import get_database
 from App.Api.Auth import get_current_user
+from App.Core.Config import settings
+from App.Core.Compression import PrecompressedBody
+from App.Core.Singleflight import SingleFlight
+from App.Core.Snapshots import MISSING, snapshots
+from App.Core.StaticExport import register_static_document, schedule_export
+import logging
+import time
 from datetime import datetime
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# The Public Site Reads The Profile On Every Page; It Is Held Here Already Encoded
+# And Compressed. Loaded At Startup And Replaced By Every Write Below (Write-Through).
+# Writes Through Other Workers Are Picked Up By Comparing updated_at Once The Cache
+# Is profile_cache_ttl_seconds Old.
+profile_cache = {"body": PrecompressedBody(b"{}"), "updated_at": None, "checked_at": 0.0}
+profile_checks = SingleFlight("profile_check")
+
+
+def _default_profile() -> dict:
+    return {
+        "_id": str(ObjectId()),
+        "full_name": "Pranjal",
+        "tagline": "Visual Storyteller",
+        "bio": "Passionate About Capturing Life's Fleeting Moments And Weaving Compelling Narratives Through The Art Of Photography, Videography, And Video Editing. With Years Of Experience In Visual Storytelling, I Specialize In Creating Content That Not Only Looks Stunning But Also Resonates Deeply With Audiences. From Intimate Portraits And Dynamic Event Coverage To Cinematic Video Edits, I Bring Creativity, Technical Expertise, And A Keen Eye For Detail To Every Project, Ensuring Your Vision Comes To Life In The Most Impactful Way.",
+        "skills": ["Photography", "Videography", "Video Editing", "Color Grading", "Sound Design"],
+        "experience": "3+ Years Experience",
+        "brands": ["Chetmani", "OBraba", "Taj Estate", "Many Other Businesses"],
+        "software": ["Premiere Pro", "Capcut"],
+        "profile_image": None,
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow()
+    }
+
+
+def cache_profile(profile: Optional[dict]):
+    """Encode The Profile (Or The Default When None Exists) Once For All GET Requests"""
+    body = Profile.model_validate(profile or _default_profile()).model_dump_json(by_alias=True).encode()
+    profile_cache["body"] = PrecompressedBody(body)
+    profile_cache["updated_at"] = profile.get("updated_at") if profile else None
+    profile_cache["checked_at"] = time.monotonic()
+    if profile:
+        snapshots.put("profile", "profile", profile, pinned=True)
+    schedule_export("profile")
+
+
+register_static_document("profile", lambda: profile_cache["body"].identity)
+
+
+async def load_profile_cache():
+    """Load From MongoDB, Or From The Last-Known-Good Snapshot While It Is Unavailable"""
+    try:
+        profile = await get_database().profiles.find_one()
+    except Exception as e:
+        profile = snapshots.get("profile", "profile")
+        if profile is MISSING:
+            profile = None
+        logger.warning(f"Could Not Load Profile From MongoDB, Serving {'Snapshot' if profile else 'Default'}: {e}")
+    cache_profile(profile)
+
+
+async def _check_profile_cache():
+    """Reload The Cache If The Stored Profile Changed Since It Was Built"""
+    try:
+        current = await get_database().profiles.find_one({}, {"updated_at": 1})
+    except Exception as e:
+        # Keep Serving What We Have; Try Again After Another TTL
+        logger.warning(f"Could Not Check Profile For Changes: {e}")
+        profile_cache["checked_at"] = time.monotonic()
+        return
+    if (current or {}).get("updated_at") != profile_cache["updated_at"]:
+        await load_profile_cache()
+    else:
+        profile_cache["checked_at"] = time.monotonic()
 
 
 @router.post("/upload-image", response_model=Profile)
@@ -21,45 +93,23 @@ async def upload_profile_image(
         raise HTTPException(status_code=404, detail="Profile Not Found. Create Profile First.")
 
     # Upload To Cloudinary
-    image_url = upload_image_to_cloudinary(await file.read())
+    image_url = await upload_image(file)
 
     # Update profile_image Field
     await db.profiles.update_one({"_id": existing["_id"]}, {"$set": {"profile_image": image_url, "updated_at": datetime.utcnow()}})
     updated_profile = await db.profiles.find_one({"_id": existing["_id"]})
     if updated_profile and "_id" in updated_profile:
         updated_profile["_id"] = str(updated_profile["_id"])
+    cache_profile(updated_profile)
     return updated_profile
 
 
 @router.get("", response_model=Profile)
-async def get_profile():
-    db = get_database()
-    profile = await db.profiles.find_one()
-
-    def _serialize(doc):
-        if not doc:
-            return None
-        if "_id" in doc:
-            doc["_id"] = str(doc["_id"])
-        return doc
-    
-    if not profile:
-        # Return Default Profile If None Exists
-        return {
-            "_id": str(ObjectId()),
-            "full_name": "Pranjal",
-            "tagline": "Visual Storyteller",
-            "bio": "Passionate About Capturing Life's Fleeting Moments And Weaving Compelling Narratives Through The Art Of Photography, Videography, And Video Editing. With Years Of Experience In Visual Storytelling, I Specialize In Creating Content That Not Only Looks Stunning But Also Resonates Deeply With Audiences. From Intimate Portraits And Dynamic Event Coverage To Cinematic Video Edits, I Bring Creativity, Technical Expertise, And A Keen Eye For Detail To Every Project, Ensuring Your Vision Comes To Life In The Most Impactful Way.",
-            "skills": ["Photography", "Videography", "Video Editing", "Color Grading", "Sound Design"],
-            "experience": "3+ Years Experience",
-            "brands": ["Chetmani", "OBraba", "Taj Estate", "Many Other Businesses"],
-            "software": ["Premiere Pro", "Capcut"],
-            "profile_image": None,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        }
-    
-    return _serialize(profile)
+async def get_profile(request: Request):
+    """Served From The In-Memory Cache; Only A Stale Cache Touches The Database (updated_at Only)"""
+    if time.monotonic() - profile_cache["checked_at"] >= settings.profile_cache_ttl_seconds:
+        await profile_checks.do("profile", _check_profile_cache)
+    return profile_cache["body"].response(request, headers={"Cache-Control": "no-cache"})
 
 
 @router.post("", response_model=Profile)
@@ -82,6 +132,7 @@ async def create_profile(
     created_profile = await db.profiles.find_one({"_id": result.inserted_id})
     if created_profile and "_id" in created_profile:
         created_profile["_id"] = str(created_profile["_id"])
+    cache_profile(created_profile)
     
     return created_profile
 
@@ -99,23 +150,19 @@ async def update_profile(
     profile_dict = profile.model_dump(exclude_unset=False)
     profile_dict["updated_at"] = datetime.utcnow()
     
-    print(f"DEBUG: Updating Profile With Data: {profile_dict}")
-    print(f"DEBUG: Existing Profile ID: {existing['_id'] if existing else 'None'}")
-    
     if existing:
         await db.profiles.update_one(
             {"_id": existing["_id"]},
             {"$set": profile_dict}
         )
         updated_profile = await db.profiles.find_one({"_id": existing["_id"]})
-        print(f"DEBUG: Updated Profile From DB: {updated_profile}")
     else:
         profile_dict["created_at"] = datetime.utcnow()
         result = await db.profiles.insert_one(profile_dict)
         updated_profile = await db.profiles.find_one({"_id": result.inserted_id})
-        print(f"DEBUG: Created New Profile: {updated_profile}")
     
     if updated_profile and "_id" in updated_profile:
         updated_profile["_id"] = str(updated_profile["_id"])
+    cache_profile(updated_profile)
 
     return updated_profile
\ No newline at end of file
@@ -1,17 +1,34 @@
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException
 from typing import List
-import os
-import aiofiles
 from pathlib import Path
-import uuid
+import asyncio
+import logging
 from App.Core.Config import settings
+from App.Core.ImageProcessing import InvalidImageError, process_photo
+from App.Core.MediaJobs import enqueue_upload
+from App.Core.Storage import MediaUploadError
+from App.Core.Streaming import UploadTooLargeError, spool_upload
+from App.Core.UploadService import upload_spooled, upload_image as store_image, upload_video as store_video
 from App.Api.Auth import get_current_user
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".webm"}
 
+# Batch Upload Purpose -> (File Type, Storage Folder, URL Key), Matching The Single-File
+# Endpoints (/api/photos/upload-image, /api/videos/upload-thumbnail, /api/videos/upload-video)
+UPLOAD_PURPOSES = {
+    "photo": ("image", "photo_images", "image_url"),
+    "thumbnail": ("image", "video_thumbnails", "thumbnail_url"),
+    "video": ("video", "video_files", "video_url"),
+}
+
+
+class UploadRejected(Exception):
+    """A Batch File That Was Refused Before Any Storage Work"""
+
 
 def get_file_extension(filename: str) -> str:
     return Path(filename).suffix.lower()
@@ -26,9 +43,26 @@ def is_allowed_file(filename: str, file_type: str) -> bool:
     return False
 
 
+def max_upload_size(file_type: str) -> int:
+    return settings.max_video_upload_size if file_type == "video" else settings.max_image_upload_size
+
+
+async def store_upload(file: UploadFile, file_type: str, folder: str) -> dict:
+    """Stream An Upload To Disk And Store It Through The Configured Backend"""
+    with await spool_upload(file, max_upload_size(file_type)) as spooled:
+        url = await upload_spooled(spooled, folder, file_type)
+        return {
+            "filename": Path(url).name,
+            "url": url,
+            "size": spooled.size,
+            "type": file_type
+        }
+
+
 @router.post("/image")
 async def upload_image(
     file: UploadFile = File(...),
+    background: bool = False,
     current_user: str = Depends(get_current_user)
 ):
     if not is_allowed_file(file.filename, "image"):
@@ -36,37 +70,16 @@ async def upload_image(
             status_code=400,
             detail=f"Invalid File Type. Allowed: {', '.join(ALLOWED_IMAGE_EXTENSIONS)}"
         )
-    
-    # Generate Unique Filename
-    ext = get_file_extension(file.filename)
-    unique_filename = f"{uuid.uuid4()}{ext}"
-    file_path = os.path.join(settings.upload_directory, unique_filename)
-    
-    # Save File
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        content = await file.read()
-        
-        # Check File Size
-        if len(content) > settings.max_file_size:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File Too Large. Max Size: {settings.max_file_size} Bytes"
-            )
-        
-        await out_file.write(content)
-    
-    # Return URL
-    file_url = f"/Uploads/{unique_filename}"
-    return {
-        "filename": unique_filename,
-        "url": file_url,
-        "size": len(content)
-    }
+
+    if background:
+        return await enqueue_upload(file, "images", "image", "url", max_upload_size("image"))
+    return await store_upload(file, "image", "images")
 
 
 @router.post("/video")
 async def upload_video(
     file: UploadFile = File(...),
+    background: bool = False,
     current_user: str = Depends(get_current_user)
 ):
     if not is_allowed_file(file.filename, "video"):
@@ -74,70 +87,65 @@ async def upload_video(
             status_code=400,
             detail=f"Invalid File Type. Allowed: {', '.join(ALLOWED_VIDEO_EXTENSIONS)}"
         )
-    
-    # Generate Unique Filename
-    ext = get_file_extension(file.filename)
-    unique_filename = f"{uuid.uuid4()}{ext}"
-    file_path = os.path.join(settings.upload_directory, unique_filename)
-    
-    # Save File
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        content = await file.read()
-        
-        # Check File Size
-        if len(content) > settings.max_file_size:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File Too Large. Max Size: {settings.max_file_size} Bytes"
-            )
-        
-        await out_file.write(content)
-    
-    # Return URL
-    file_url = f"/Uploads/{unique_filename}"
-    return {
-        "filename": unique_filename,
-        "url": file_url,
-        "size": len(content)
-    }
+
+    if background:
+        return await enqueue_upload(file, "videos", "video", "url", max_upload_size("video"))
+    return await store_upload(file, "video", "videos")
+
+
+async def store_for_purpose(file: UploadFile, purpose: str) -> dict:
+    """
+    Store One File Of A Batch Through Its Single-File Endpoint's Code Path, So The
+    Entry Has That Endpoint's Fields (Variants, Video Metadata), Plus "url" And "type"
+    """
+    file_type, folder, url_key = UPLOAD_PURPOSES[purpose]
+    if not is_allowed_file(file.filename, file_type):
+        allowed = ALLOWED_VIDEO_EXTENSIONS if file_type == "video" else ALLOWED_IMAGE_EXTENSIONS
+        raise UploadRejected(f"Invalid File Type. Allowed: {', '.join(sorted(allowed))}")
+
+    if purpose == "photo":
+        with await spool_upload(file, max_upload_size(file_type)) as spooled:
+            stored = await process_photo(spooled, folder=folder)
+    elif purpose == "video":
+        stored = await store_video(file, folder=folder)
+    else:
+        stored = {url_key: await store_image(file, folder=folder)}
+    return {**stored, "url": stored[url_key], "type": file_type}
 
 
 @router.post("/multiple")
 async def upload_multiple_files(
     files: List[UploadFile] = File(...),
+    purpose: str = Form("photo"),
     current_user: str = Depends(get_current_user)
 ):
-    uploaded_files = []
-    
-    for file in files:
-        # Determine File Type
-        ext = get_file_extension(file.filename)
-        if ext in ALLOWED_IMAGE_EXTENSIONS:
-            file_type = "image"
-        elif ext in ALLOWED_VIDEO_EXTENSIONS:
-            file_type = "video"
-        else:
-            continue  # Skip Invalid Files
-        
-        # Generate Unique Filename
-        unique_filename = f"{uuid.uuid4()}{ext}"
-        file_path = os.path.join(settings.upload_directory, unique_filename)
-        
-        # Save File
-        async with aiofiles.open(file_path, 'wb') as out_file:
-            content = await file.read()
-            
-            if len(content) > settings.max_file_size:
-                continue  # Skip Files That Are Too Large
-            
-            await out_file.write(content)
-        
-        file_url = f"/Uploads/{unique_filename}"
-        uploaded_files.append({
-            "filename": unique_filename,
-            "url": file_url,
-            "size": len(content),
-            "type": file_type
-        })
-    
-    return {"files": uploaded_files, "count": len(uploaded_files)}
\ No newline at end of file
+    """
+    Upload Many Files Concurrently (At Most settings.upload_concurrency At Once).
+    Every File Gets A Result Entry: ok, rejected (Type Or Size) Or failed (Storage Error).
+    """
+    if purpose not in UPLOAD_PURPOSES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid Purpose. Allowed: {', '.join(UPLOAD_PURPOSES)}"
+        )
+
+    semaphore = asyncio.Semaphore(settings.upload_concurrency)
+
+    async def process(file: UploadFile) -> dict:
+        result = {"filename": file.filename}
+        async with semaphore:
+            try:
+                stored = await store_for_purpose(file, purpose)
+                result = {**stored, "filename": file.filename, "status": "ok"}
+            except (UploadRejected, UploadTooLargeError, InvalidImageError) as e:
+                result.update(status="rejected", reason=str(e))
+            except MediaUploadError as e:
+                result.update(status="failed", reason=str(e))
+            except Exception as e:
+                logger.error(f"Unexpected Error Uploading {file.filename}: {e}")
+                result.update(status="failed", reason="Unexpected Error")
+        return result
+
+    results = await asyncio.gather(*(process(file) for file in files))
+    counts = {status: sum(1 for r in results if r["status"] == status) for status in ("ok", "rejected", "failed")}
+    return {"files": results, "count": counts["ok"], **counts}
@@ -1,36 +1,45 @@
-
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from typing import List
 from bson import ObjectId
 from App.Models.Schemas import VideoProject, VideoProjectCreate, VideoProjectUpdate
-from App.Core.Database import get_database
+from App.Core.Database import get_database, get_read_database
 from App.Api.Auth import get_current_user
-from App.Core.CloudinaryUtil import upload_image_to_cloudinary
+from App.Core.Config import settings
+from App.Core.MediaJobs import enqueue_upload
+from App.Core.Snapshots import StaleWhileUnavailable, site_reads
+from App.Core.StaticExport import register_static_collection, schedule_export
+from App.Core.UploadService import upload_image, upload_video
 from datetime import datetime
 
 router = APIRouter()
+
+# Defaults Of get_videos Other Than category
+video_reads = StaleWhileUnavailable("videos", pinned=site_reads(True, None, None, None, "order", False, 0, 100))
+
+VIDEO_SORT_FIELDS = ("order", "duration", "created_at")
+
+
 # Cloudinary Upload Endpoint For Videos
 @router.post("/upload-video")
 async def upload_video_file(
     file: UploadFile = File(...),
+    background: bool = False,
     current_user: str = Depends(get_current_user)
 ):
-    # Upload video to Cloudinary (resource_type="video")
-    from App.Core.CloudinaryUtil import cloudinary
-    result = cloudinary.uploader.upload(
-        await file.read(),
-        folder="video_files",
-        resource_type="video"
-    )
-    return {"video_url": result["secure_url"]}
+    if background:
+        return await enqueue_upload(file, "video_files", "video", "video_url", settings.max_video_upload_size)
+    return await upload_video(file, folder="video_files")
 
 # Cloudinary Upload Endpoint For Video Thumbnails
 @router.post("/upload-thumbnail")
 async def upload_video_thumbnail(
     file: UploadFile = File(...),
+    background: bool = False,
     current_user: str = Depends(get_current_user)
 ):
-    url = upload_image_to_cloudinary(await file.read(), folder="video_thumbnails")
+    if background:
+        return await enqueue_upload(file, "video_thumbnails", "image", "thumbnail_url", settings.max_image_upload_size)
+    url = await upload_image(file, folder="video_thumbnails")
     return {"thumbnail_url": url}
 
 
@@ -38,10 +47,16 @@ async def upload_video_thumbnail(
 async def get_videos(
     published_only: bool = True,
     category: str = None,
+    orientation: str = None,
+    min_duration: float = None,
+    max_duration: float = None,
+    sort_by: str = "order",
+    descending: bool = False,
     skip: int = 0,
     limit: int = 100
 ):
-    db = get_database()
+    if sort_by not in VIDEO_SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Invalid Sort Field. Allowed: {', '.join(VIDEO_SORT_FIELDS)}")
     
     query = {}
     if published_only:
@@ -50,27 +65,40 @@ async def get_videos(
     if category:
         query["category"] = category
     
-    cursor = db.video_projects.find(query).sort("order", 1).skip(skip).limit(limit)
-    videos = await cursor.to_list(length=limit)
+    if orientation:
+        query["orientation"] = orientation
+    
+    if min_duration is not None or max_duration is not None:
+        query["duration"] = {}
+        if min_duration is not None:
+            query["duration"]["$gte"] = min_duration
+        if max_duration is not None:
+            query["duration"]["$lte"] = max_duration
+    
+    direction = -1 if descending else 1
+    
+    async def find_videos():
+        cursor = get_read_database().video_projects.find(query).sort([(sort_by, direction), ("_id", direction)]).skip(skip).limit(limit)
+        return await cursor.to_list(length=limit)
+    
+    key = ("list", published_only, category, orientation, min_duration, max_duration, sort_by, descending, skip, limit)
+    videos = await video_reads.do(key, find_videos)
     
     return videos
 
 
 @router.get("/categories", response_model=dict)
 async def get_video_categories():
-    db = get_database()
-    categories = await db.video_projects.distinct("category")
+    categories = await video_reads.do(("categories",), lambda: get_read_database().video_projects.distinct("category"))
     return {"categories": categories}
 
 
 @router.get("/{video_id}", response_model=VideoProject)
 async def get_video(video_id: str):
-    db = get_database()
-    
     if not ObjectId.is_valid(video_id):
         raise HTTPException(status_code=400, detail="Invalid Video ID")
     
-    video = await db.video_projects.find_one({"_id": ObjectId(video_id)})
+    video = await video_reads.do(("detail", video_id), lambda: get_read_database().video_projects.find_one({"_id": ObjectId(video_id)}))
     
     if not video:
         raise HTTPException(status_code=404, detail="Video Not Found")
@@ -89,6 +117,7 @@ async def create_video(
     video_dict["updated_at"] = datetime.utcnow()
     result = await db.video_projects.insert_one(video_dict)
     created_video = await db.video_projects.find_one({"_id": result.inserted_id})
+    schedule_export("videos", video_dict.get("category"))
     return created_video
 
 
@@ -106,15 +135,16 @@ async def update_video(
     video_dict = {k: v for k, v in video.dict().items() if v is not None}
     video_dict["updated_at"] = datetime.utcnow()
     
-    result = await db.video_projects.update_one(
+    previous = await db.video_projects.find_one_and_update(
         {"_id": ObjectId(video_id)},
         {"$set": video_dict}
     )
     
-    if result.matched_count == 0:
+    if previous is None:
         raise HTTPException(status_code=404, detail="Video Not Found")
     
     updated_video = await db.video_projects.find_one({"_id": ObjectId(video_id)})
+    schedule_export("videos", previous.get("category"), video_dict.get("category"))
     return updated_video
 
 
@@ -128,9 +158,15 @@ async def delete_video(
     if not ObjectId.is_valid(video_id):
         raise HTTPException(status_code=400, detail="Invalid Video ID")
     
-    result = await db.video_projects.delete_one({"_id": ObjectId(video_id)})
+    deleted = await db.video_projects.find_one_and_delete({"_id": ObjectId(video_id)})
     
-    if result.deleted_count == 0:
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Video Not Found")
     
-    return {"message": "Video Deleted Successfully"}
\ No newline at end of file
+    schedule_export("videos", deleted.get("category"))
+    
+    return {"message": "Video Deleted Successfully"}
+
+
+# Public Views Rendered To Static Files For nginx (See App/Core/StaticExport.py)
+register_static_collection("videos", VideoProject, get_videos, get_video_categories)
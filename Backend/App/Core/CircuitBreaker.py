@@ -0,0 +1,73 @@
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+from App.Core.Metrics import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+_breakers: Dict[str, "CircuitBreaker"] = {}
+
+circuit_transitions = Counter("circuit_breaker_transitions_total", "Circuit Breaker State Changes", ("name", "state"))
+Gauge("circuit_breaker_open", "1 While The Circuit Is Open And Callers Fail Fast", ("name",),
+      callback=lambda: {(name,): int(breaker.is_open) for name, breaker in _breakers.items()})
+
+
+class ServiceUnavailableError(RuntimeError):
+    """Raised Instead Of Calling A Dependency While Its Circuit Is Open"""
+
+
+class CircuitBreaker:
+    """
+    Closed: Calls Go Through And Consecutive Failures Are Counted. Open: Once
+    failure_threshold Of Them Happen In A Row, check() Fails Fast Until Something
+    Outside The Request Path (A Background Probe) Sees The Dependency Recover And
+    Calls reset().
+    """
+
+    def __init__(self, name: str, failure_threshold: int):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.failures = 0
+        self.opened_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        _breakers[name] = self
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def check(self):
+        if self.opened_at is not None:
+            raise ServiceUnavailableError(f"{self.name} Unavailable Since {self.opened_at:%Y-%m-%d %H:%M:%S} UTC: {self.last_error}")
+
+    def record_success(self):
+        self.failures = 0
+
+    def record_failure(self, error: BaseException):
+        self.failures += 1
+        self.last_error = str(error)
+        if self.failures >= self.failure_threshold:
+            self.trip(error)
+
+    def trip(self, error: BaseException):
+        self.last_error = str(error)
+        if self.opened_at is None:
+            self.opened_at = datetime.utcnow()
+            circuit_transitions.inc(self.name, "open")
+            logger.error(f"Circuit {self.name} Opened, Failing Fast Until It Recovers: {error}")
+
+    def reset(self):
+        if self.opened_at is not None:
+            downtime = (datetime.utcnow() - self.opened_at).total_seconds()
+            circuit_transitions.inc(self.name, "closed")
+            logger.info(f"Circuit {self.name} Closed After {downtime:.0f}s")
+        self.opened_at = None
+        self.failures = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "state": "open" if self.is_open else "closed",
+            "opened_at": self.opened_at,
+            "consecutive_failures": self.failures,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,210 @@
+import gzip
+import hashlib
+import zlib
+from typing import Dict, Optional
+from fastapi import Request, Response
+from App.Core.Config import settings
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip Is Always Available
+    brotli = None
+
+# Media Is Already Compressed; Only These Types Are Worth The CPU
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def supported_encodings():
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick The Best Supported Coding From An Accept-Encoding Header (Brotli Preferred)"""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=settings.brotli_quality if level is None else level)
+    return gzip.compress(data, compresslevel=settings.gzip_level if level is None else level, mtime=0)
+
+
+class _StreamCompressor:
+    """Incremental Compressor That Flushes Each Chunk So Streamed Responses Keep Moving"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(settings.gzip_level, zlib.DEFLATED, 31)  # 31 = gzip Container
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def _is_compressible(headers) -> bool:
+    content_type = ""
+    for name, value in headers:
+        lowered = name.lower()
+        if lowered == b"content-encoding":
+            return False
+        if lowered == b"content-type":
+            content_type = value.decode("latin-1").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _rewrite_headers(headers, encoding: str, length: Optional[int]):
+    rewritten = []
+    vary = None
+    for name, value in headers:
+        lowered = name.lower()
+        if lowered == b"content-length":
+            continue
+        if lowered == b"etag" and not value.startswith(b"W/"):
+            # The Encoded Bytes Differ, So The Validator Becomes Weak
+            value = b"W/" + value
+        if lowered == b"vary":
+            vary = value
+            continue
+        rewritten.append((name, value))
+    rewritten.append((b"content-encoding", encoding.encode()))
+    rewritten.append((b"vary", vary + b", Accept-Encoding" if vary else b"Accept-Encoding"))
+    if length is not None:
+        rewritten.append((b"content-length", str(length).encode()))
+    return rewritten
+
+
+class CompressionMiddleware:
+    """
+    ASGI Middleware Compressing Text/JSON Responses With Brotli Or gzip.
+    Single-Message Bodies Under compression_min_size Are Sent As-Is; Streamed
+    Bodies Are Compressed Chunk By Chunk. Responses That Already Carry A
+    Content-Encoding (E.g. Precompressed Cache Entries) Pass Through Untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        accept_encoding = None
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        start_message = None
+        compressor = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, passthrough
+            if passthrough:
+                return await send(message)
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if status < 200 or status in (204, 206, 304) or not _is_compressible(message.get("headers", [])):
+                    passthrough = True
+                    return await send(message)
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                # Server Extensions (E.g. zerocopy) Bypass Compression
+                passthrough = True
+                await send(start_message)
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                if not more_body:
+                    if len(body) < settings.compression_min_size:
+                        passthrough = True
+                        await send(start_message)
+                        return await send(message)
+                    compressed = compress(body, encoding)
+                    await send({**start_message, "headers": _rewrite_headers(start_message["headers"], encoding, len(compressed))})
+                    return await send({"type": "http.response.body", "body": compressed})
+
+                compressor = _StreamCompressor(encoding)
+                await send({**start_message, "headers": _rewrite_headers(start_message["headers"], encoding, None)})
+
+            chunk = compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += compressor.finish()
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class PrecompressedBody:
+    """
+    A Response Body Encoded Once At Maximum Compression, For Cache Entries That
+    Are Served Many Times. Each Representation Gets Its Own Strong ETag.
+    """
+    __slots__ = ("identity", "encoded", "etag")
+
+    def __init__(self, body: bytes):
+        self.identity = body
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.encoded: Dict[str, bytes] = {}
+        if len(body) >= settings.compression_min_size:
+            for encoding in supported_encodings():
+                self.encoded[encoding] = compress(body, encoding, level=11 if encoding == "br" else 9)
+
+    def _etag_for(self, encoding: Optional[str]) -> str:
+        return f'"{self.etag}-{encoding}"' if encoding else f'"{self.etag}"'
+
+    def response(self, request: Request, media_type: str = "application/json", headers: Optional[dict] = None) -> Response:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        if encoding not in self.encoded:
+            encoding = None
+        response_headers = {**(headers or {}), "ETag": self._etag_for(encoding), "Vary": "Accept-Encoding"}
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if any(tag.strip().removeprefix("W/") == response_headers["ETag"] for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=response_headers)
+
+        if encoding:
+            response_headers["Content-Encoding"] = encoding
+            return Response(content=self.encoded[encoding], media_type=media_type, headers=response_headers)
+        return Response(content=self.identity, media_type=media_type, headers=response_headers)
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 import os
 
 
@@ -7,11 +7,22 @@ class Settings(BaseSettings):
     # MongoDB
     mongodb_url: str = "mongodb://localhost:27017"
     database_name: str = "pranjal_portfolio"
+    mongo_max_pool_size: int = 100
+    mongo_min_pool_size: int = 0  # Connections Kept Warm Even When Idle
+    mongo_max_idle_time_ms: int | None = None  # Close Pooled Connections Idle Longer Than This
+    mongo_compressors: List[str] = []  # Wire Compression In Preference Order: "zstd", "snappy", "zlib"
+    # Public GET Routes Read Through These; Admin Writes And Their Reads Stay On The Primary
+    mongo_public_read_preference: str = "primary"  # primary, primaryPreferred, secondary, secondaryPreferred, nearest
+    mongo_public_max_staleness_seconds: int | None = None  # Minimum 90 When Set
+    mongo_public_read_concern: str | None = None  # local, available, majority
     
     # JWT
     jwt_secret: str = "Anu8-Secret-@#$-Pranjal-Portfolio-Production"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 1440  # 24 Hours For Better Admin ExperienceQ
+    token_cache_size: int = 1024  # Verified Tokens Kept In Memory
+    token_cache_ttl_seconds: int = 300  # Upper Bound On How Long A Verification Is Reused
+    revocation_sync_seconds: float = 5.0  # How Soon Other Workers See A Logout
     
     # Admin
     admin_email: str = "admin@pranjal.com"
@@ -22,6 +33,20 @@ class Settings(BaseSettings):
     smtp_port: int = 587
     smtp_user: str = ""
     smtp_password: str = ""
+    smtp_timeout_seconds: float = 30.0
+    smtp_idle_seconds: float = 120.0  # Close The Reused Connection After This Long Without Mail
+    
+    # Contact Message Notifications (Sent From A Background Worker)
+    contact_notifications: bool = True
+    notification_email: str | None = None  # Recipient; Defaults To admin_email
+    notification_queue_size: int = 1000
+    notification_max_retries: int = 3
+    notification_retry_backoff_seconds: float = 2.0
+    notification_digest_window_seconds: float = 0.0  # Optionally Wait This Long For More Messages Before Sending
+    notification_digest_threshold: int = 3  # Batches This Large Are Sent As One Digest Email
+    notification_drain_seconds: float = 10.0  # Grace Period For Queued Mail On Shutdown
+    inbox_counts_ttl_seconds: float = 60.0  # Recount The Inbox Once Cached Counts Are This Old
+    profile_cache_ttl_seconds: float = 30.0  # Check For Profile Edits Made Through Other Workers This Often
     
     # URLs
     frontend_url: str = "http://localhost:3000"
@@ -34,9 +59,107 @@ class Settings(BaseSettings):
     cloudinary_api_key: str = os.getenv("CLOUDINARY_API_KEY", "")
     cloudinary_api_secret: str = os.getenv("CLOUDINARY_API_SECRET", "")
     
+    # Media Storage Backend: "cloudinary" Or "local"
+    storage_backend: str = "cloudinary"
+    media_root: str = "Uploads"  # Local Backend Only
+    media_url_prefix: str = "/Uploads"  # Local Backend Only
+    media_cache_max_age: int = 31536000  # Local Files Are Content-Addressed, So They Never Change
+    
+    # Media Uploads (Bounded Worker Pool So Uploads Never Block The Event Loop)
+    upload_max_workers: int = 4
+    upload_timeout_seconds: float = 120.0
+    upload_max_retries: int = 2
+    upload_retry_backoff_seconds: float = 1.0
+    upload_concurrency: int = 8  # Files Processed At Once By Batch Uploads
+    
+    # Background Media Jobs
+    job_workers: int = 2
+    job_retention_hours: int = 24  # Finished Jobs Are Deleted After This
+    job_progress_interval_seconds: float = 1.0
+    job_heartbeat_seconds: float = 15.0  # How Often A Worker Renews The Lease On Its Running Jobs
+    job_lease_seconds: float = 60.0  # Running Jobs Not Renewed For This Long Are Re-Queued
+    job_spool_directory: str = "Spool"  # Must Persist Across Restarts For Jobs To Resume
+    
+    # Streaming Uploads (Files Are Spooled To Disk In Fixed-Size Chunks)
+    upload_temp_directory: str | None = None  # None Uses The System Temp Directory
+    upload_read_chunk_size: int = 1024 * 1024  # 1 MB
+    upload_chunk_size: int = 6 * 1024 * 1024  # 6 MB (Cloudinary Minimum Is 5 MB)
+    max_image_upload_size: int = 25 * 1024 * 1024  # 25 MB
+    max_video_upload_size: int = 1024 * 1024 * 1024  # 1 GB
+    
+    # Responsive Image Variants (Rendered With Pillow In A Process Pool)
+    image_process_workers: int = 2
+    image_variant_widths: List[int] = [480, 960, 1600, 2400]
+    image_variant_quality: int = 82
+    image_thumbnail_size: int = 400
+    image_placeholder_size: int = 16  # Longest Edge Of The Inline Blurred Preview
+    
     # CORS - Allow All Localhost Ports For Development
     cors_origins: str = "http://localhost:3000,http://localhost:3001,http://localhost:5173,http://localhost:5174,http://localhost:4173,http://127.0.0.1:3000,http://127.0.0.1:3001,http://127.0.0.1:5173"
     
+    # Response Compression (Brotli Requires The Optional "brotli" Package)
+    compression_min_size: int = 1024  # Smaller Bodies Are Sent Uncompressed
+    gzip_level: int = 6
+    brotli_quality: int = 4  # On-The-Fly Quality; Precompressed Entries Use The Maximum
+    
+    # Metrics: Scrapers Authenticate With This Bearer Token (Admin Tokens Also Work)
+    metrics_token: str | None = None
+    
+    # Slow Query Log
+    slow_query_threshold_ms: float = 100.0
+    slow_query_max_shapes: int = 200  # Least Recently Seen Shapes Are Dropped Beyond This
+    slow_query_explain_interval_seconds: float = 600.0  # Minimum Gap Between explains Of One Shape
+    slow_query_explain_sample_rate: float = 0.2  # Chance Of Re-Explaining Once The Interval Has Passed
+    
+    # Event Loop Monitor
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_seconds: float = 0.1  # Heartbeat Period
+    loop_block_threshold_ms: float = 250.0  # Stalls Longer Than This Are Logged With A Stack
+    loop_block_strict: bool = False  # Development/Tests: Fail Requests That Block The Loop
+    loop_stall_history: int = 50
+    
+    # Request Profiler (Admins Send X-Profile: 1 Or ?__profile=1)
+    profiler_sample_rate: float = 0.0  # Fraction Of All Requests Profiled At Random
+    profiler_interval_ms: float = 1.0
+    profiler_max_concurrent: int = 2
+    profiler_history: int = 50
+    
+    # Request Time Budgets: "METHOD /path-prefix" -> Seconds (Longest Prefix Wins; Unlisted Routes Have None)
+    request_budgets: Dict[str, float] = {
+        "GET /api/photos": 3.0,
+        "GET /api/videos": 3.0,
+        "GET /api/edits": 3.0,
+        "GET /api/profile": 2.0,
+        "GET /api/contact": 5.0,
+        "GET /api/analytics": 5.0,
+        "POST /api/analytics/track": 2.0,
+        "POST /api/contact": 3.0,
+    }
+    request_budget_grace_seconds: float = 0.5  # Extra Time For Non-Database Work Before Cutting A Request Off
+    
+    # Database Circuit Breaker And Last-Known-Good Snapshots Of Public Reads
+    db_breaker_failure_threshold: int = 3  # Consecutive Connection Failures Before Failing Fast
+    db_probe_interval_seconds: float = 5.0  # How Often An Open Circuit Retries MongoDB
+    db_probe_timeout_seconds: float = 2.0
+    snapshot_directory: str = "Snapshots"  # Kept Across Restarts So An Outage At Boot Still Serves Content
+    snapshot_max_entries: int = 500  # Per Collection, Besides The Site's Own Reads; The Least Recently Refreshed Are Dropped
+    snapshot_flush_seconds: float = 30.0
+    
+    # Static Export Of Public GET Responses (nginx Serves Them From This Directory Via A Shared Volume)
+    static_export_enabled: bool = False  # Also Keeps The Files Current After Every Admin Write
+    static_export_directory: str = "Static"
+    static_export_debounce_seconds: float = 1.0  # Writes Within This Window Are Exported Together
+    
+    # Rate Limits For Unauthenticated Write Endpoints: "METHOD /path" -> "requests/seconds"
+    rate_limits: Dict[str, str] = {
+        "POST /api/analytics/track": "60/60",
+        "POST /api/contact": "5/300",
+    }
+    rate_limit_trust_forwarded: bool = False  # Only Behind A Proxy: Use X-Real-IP / The Proxy's X-Forwarded-For Entry
+    rate_limit_max_buckets: int = 10000  # Per Route; Bounds Memory Under Many Distinct Clients
+    rate_limit_idle_seconds: int = 600  # Buckets Idle This Long Are Evicted
+    rate_limit_sweep_seconds: int = 60
+    
     # Environment
     environment: str = "development"
     
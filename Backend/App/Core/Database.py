@@ -1,32 +1,116 @@
+import asyncio
+import contextvars
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Optional
+import pymongo
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
 from App.Core.Config import settings
+from App.Core.CircuitBreaker import CircuitBreaker, ServiceUnavailableError
+from App.Core.Metrics import MongoCommandMetrics, mongo_pool_stats
+from App.Core.SlowQueries import slow_query_log
 import logging
 
 logger = logging.getLogger(__name__)
 
 client: AsyncIOMotorClient = None
 database = None
+read_database = None
+
+# Open While MongoDB Is Unreachable; Callers Then Fail Fast Instead Of Waiting On Server Selection
+db_breaker = CircuitBreaker("mongodb", settings.db_breaker_failure_threshold)
+_probe_task: Optional[asyncio.Task] = None
+
+# Set While Rendering Output That Must Reflect The Latest Writes (The Static Export)
+_primary_reads: contextvars.ContextVar[bool] = contextvars.ContextVar("primary_reads", default=False)
+
+# Optional Wire Compressors And The Packages They Need
+COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": "zlib"}
+
+
+def _available_compressors() -> list:
+    """Drop Compressors Whose Module Is Missing Instead Of Letting The Driver Warn On Every Connect"""
+    available = []
+    for name in settings.mongo_compressors:
+        module = COMPRESSOR_MODULES.get(name)
+        if module is None:
+            logger.warning(f"Unknown MongoDB Compressor Ignored: {name}")
+            continue
+        try:
+            __import__(module)
+        except ImportError:
+            logger.warning(f"MongoDB Compressor {name} Needs The {module} Package; Skipping")
+            continue
+        available.append(name)
+    return available
+
+
+def _public_read_options() -> dict:
+    mode = read_pref_mode_from_name(settings.mongo_public_read_preference)
+    options = {
+        "read_preference": make_read_preference(mode, None, settings.mongo_public_max_staleness_seconds or -1)
+    }
+    if settings.mongo_public_read_concern:
+        options["read_concern"] = ReadConcern(settings.mongo_public_read_concern)
+    return options
 
 
 async def connect_to_mongo():
     """Connect To MongoDB With Proper Error Handling"""
-    global client, database
+    global client, database, read_database
+    if client is not None and database is None:
+        # Discard The Client Left Behind By A Failed Attempt
+        client.close()
     try:
+        pool_options = {
+            "maxPoolSize": settings.mongo_max_pool_size,
+            "minPoolSize": settings.mongo_min_pool_size,
+        }
+        if settings.mongo_max_idle_time_ms is not None:
+            pool_options["maxIdleTimeMS"] = settings.mongo_max_idle_time_ms
+        compressors = _available_compressors()
+        if compressors:
+            pool_options["compressors"] = ",".join(compressors)
+
         client = AsyncIOMotorClient(
             settings.mongodb_url,
             serverSelectionTimeoutMS=5000,
-            connectTimeoutMS=5000
+            connectTimeoutMS=5000,
+            event_listeners=[MongoCommandMetrics(), slow_query_log, mongo_pool_stats],
+            **pool_options
         )
+        slow_query_log.bind(client)
         # Test The Connection
         await client.admin.command('ping')
         database = client[settings.database_name]
+        read_database = database.with_options(**_public_read_options())
+        db_breaker.reset()
         logger.info(f"Successfully Connected To MongoDB: {settings.database_name}")
+        await ensure_indexes()
     except Exception as e:
+        db_breaker.trip(e)
         logger.error(f"Failed To Connect To MongoDB: {e}")
         logger.warning("Continuing Without MongoDB Connection - Some Features May Not Work")
         # Do Not Raise, Allow App To Start
 
 
+async def ensure_indexes():
+    """Create The Indexes Backing The List Endpoints' Filters And Sorts"""
+    try:
+        for collection in (database.photo_projects, database.video_projects, database.edit_projects):
+            await collection.create_index([("published", ASCENDING), ("category", ASCENDING), ("order", ASCENDING)])
+        await database.photo_projects.create_index([("captured_at", DESCENDING)])
+        await database.photo_projects.create_index([("camera", ASCENDING)])
+        await database.photo_projects.create_index([("orientation", ASCENDING)])
+        await database.video_projects.create_index([("duration", ASCENDING)])
+        await database.video_projects.create_index([("orientation", ASCENDING)])
+    except Exception as e:
+        logger.warning(f"Could Not Create Indexes: {e}")
+
+
 async def close_mongo_connection():
     """Close MongoDB Connection Gracefully"""
     global client
@@ -38,9 +122,86 @@ async def close_mongo_connection():
         logger.error(f"Error Closing MongoDB Connection: {e}")
 
 
+def is_outage(error: BaseException) -> bool:
+    """
+    True For Errors Meaning MongoDB Can't Be Reached (Counted Towards The Breaker).
+    Timeouts Of Operations That Did Reach A Server, And Pool Exhaustion, Are Load,
+    Not An Outage.
+    """
+    if isinstance(error, ServerSelectionTimeoutError):
+        return True
+    return isinstance(error, ConnectionFailure) and not error.timeout
+
+
+async def _probe_database(on_reconnect: Optional[Callable[[], Awaitable[None]]]):
+    while True:
+        await asyncio.sleep(settings.db_probe_interval_seconds)
+        if not db_breaker.is_open:
+            continue
+        if database is None:
+            await connect_to_mongo()
+        else:
+            try:
+                with pymongo.timeout(settings.db_probe_timeout_seconds):
+                    await client.admin.command("ping")
+                db_breaker.reset()
+            except Exception as e:
+                db_breaker.last_error = str(e)
+                logger.debug(f"MongoDB Probe Failed: {e}")
+        if not db_breaker.is_open and on_reconnect is not None:
+            try:
+                await on_reconnect()
+            except Exception as e:
+                logger.warning(f"Reloading Caches After Reconnect Failed: {e}")
+
+
+def start_database_probe(on_reconnect: Optional[Callable[[], Awaitable[None]]] = None):
+    """Retry MongoDB In The Background While The Breaker Is Open, Then Run on_reconnect"""
+    global _probe_task
+    _probe_task = asyncio.create_task(_probe_database(on_reconnect))
+
+
+async def stop_database_probe():
+    global _probe_task
+    if _probe_task is not None:
+        _probe_task.cancel()
+        try:
+            await _probe_task
+        except asyncio.CancelledError:
+            pass
+        _probe_task = None
+
+
 def get_database():
-    """Get Database Instance With Validation"""
+    """Get Database Instance With Validation (Fails Fast While The Breaker Is Open)"""
+    db_breaker.check()
     if database is None:
         logger.error("Database Not Initialized. Call connect_to_mongo() First.")
-        raise RuntimeError("Database Connection Not Established")
-    return database
\ No newline at end of file
+        raise ServiceUnavailableError("Database Connection Not Established")
+    return database
+
+
+def get_read_database():
+    """
+    Database Handle For Public GET Routes, Using The Public Read Preference And
+    Read Concern. Reads That Must See The Caller's Own Writes Use get_database(),
+    Or Run Inside reading_from_primary().
+    """
+    if read_database is None or _primary_reads.get():
+        return get_database()
+    db_breaker.check()
+    return read_database
+
+
+def reads_from_primary() -> bool:
+    return _primary_reads.get()
+
+
+@contextmanager
+def reading_from_primary():
+    """Send The Enclosed Public Reads (In This Task) To The Primary, Past Coalescing And Snapshots"""
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
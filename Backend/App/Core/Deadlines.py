@@ -0,0 +1,96 @@
+import asyncio
+import contextvars
+import json
+import logging
+import time
+from typing import Optional, Tuple
+import pymongo
+from pymongo.errors import PyMongoError, WaitQueueTimeoutError
+from App.Core.Config import settings
+from App.Core.Metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+# Absolute time.monotonic() Deadline Of The Current Request, If It Has A Budget
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+
+budget_exceeded = Counter("request_budget_exceeded_total", "Requests Cut Off By Their Time Budget", ("group", "status"))
+
+
+def remaining_budget() -> Optional[float]:
+    """Seconds Left In The Current Request's Budget, Or None When It Has No Budget"""
+    deadline = _deadline.get()
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def is_timeout(error: BaseException) -> bool:
+    """True For Driver Errors Caused By A Deadline (maxTimeMS, Pool Wait Or Socket Timeout)"""
+    return isinstance(error, PyMongoError) and error.timeout
+
+
+def _parse_budgets() -> Tuple[Tuple[str, str, float], ...]:
+    """Longest Prefix First, So "GET /api/photos/categories" Can Override "GET /api/photos" """
+    groups = []
+    for route, seconds in settings.request_budgets.items():
+        method, _, prefix = route.partition(" ")
+        groups.append((method.upper(), prefix.rstrip("/"), seconds))
+    return tuple(sorted(groups, key=lambda group: len(group[1]), reverse=True))
+
+
+class DeadlineMiddleware:
+    """
+    Gives Each Request In A Configured Route Group A Time Budget. Inside It,
+    pymongo.timeout() Makes Every Motor Call Send maxTimeMS Derived From The Time
+    Remaining (Motor Copies The Context Into Its Worker Threads), And Pool Checkouts
+    Give Up When The Budget Runs Out. A Request That Exceeds Its Budget Before
+    Responding Gets A Fast 504, Or 503 When It Was Stuck Waiting For A Connection.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.groups = _parse_budgets()
+
+    def budget_for(self, method: str, path: str) -> Tuple[Optional[str], Optional[float]]:
+        for group_method, prefix, seconds in self.groups:
+            if group_method == method and (path == prefix or path.startswith(prefix + "/")):
+                return f"{group_method} {prefix}", seconds
+        return None, None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        group, budget = self.budget_for(scope["method"], scope["path"].rstrip("/") or "/")
+        if not budget:
+            return await self.app(scope, receive, send)
+
+        started = [False]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                started[0] = True
+            await send(message)
+
+        token = _deadline.set(time.monotonic() + budget)
+        try:
+            with pymongo.timeout(budget):
+                async with asyncio.timeout(budget + settings.request_budget_grace_seconds):
+                    await self.app(scope, receive, send_wrapper)
+        except (PyMongoError, TimeoutError) as e:
+            if started[0] or (isinstance(e, PyMongoError) and not e.timeout):
+                raise
+            status = 503 if isinstance(e, WaitQueueTimeoutError) else 504
+            budget_exceeded.inc(group, str(status))
+            logger.warning(f"{scope['method']} {scope['path']} Exceeded Its {budget:.1f}s Budget ({type(e).__name__})")
+            await self._reject(send, status)
+        finally:
+            _deadline.reset(token)
+
+    async def _reject(self, send, status: int):
+        detail = "Service Busy, Try Again" if status == 503 else "Request Exceeded Its Time Budget"
+        body = json.dumps({"detail": detail}).encode()
+        headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        if status == 503:
+            headers.append((b"retry-after", b"1"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,160 @@
+import mimetypes
+import os
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional, Tuple
+import anyio.to_thread
+from fastapi import Request, Response
+from App.Core.Config import settings
+
+# Read Size For The Threaded Fallback (One pread Per Body Message)
+SEND_CHUNK_SIZE = 256 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def _etag(stat_result: os.stat_result) -> str:
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse A Single "bytes=" Range Into An Inclusive (start, end) Pair.
+    Multi-Range Requests Return None And Are Served In Full, Which RFC 9110 Allows.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first == "":
+            # Suffix Range: The Final N Bytes
+            length = int(last)
+            if length <= 0:
+                raise RangeNotSatisfiable()
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        raise RangeNotSatisfiable()
+    return start, min(end, size - 1)
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _if_range_matches(request: Request, etag: str, last_modified: str) -> bool:
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    return if_range.strip() in (etag, last_modified)
+
+
+class FileRangeResponse(Response):
+    """
+    Streams A Byte Range Of A File. Uses The ASGI "http.response.zerocopy"
+    Extension (sendfile) When The Server Offers It, Otherwise Reads Fixed-Size
+    Chunks With os.pread In A Worker Thread, So Disk Reads (Cold Or Slow Storage)
+    Never Block The Event Loop.
+
+    Uvicorn Does Not Offer zerocopy, So Under It Every Body Is Copied Through
+    Python In SEND_CHUNK_SIZE Reads. For Real Zero-Copy, Run A Server That
+    Implements The Extension Or Let nginx Serve media_root Directly.
+    """
+
+    def __init__(self, path: str, start: int, end: int, status_code: int, headers: dict, send_body: bool = True):
+        super().__init__(status_code=status_code, headers=headers)
+        self.path = path
+        self.start = start
+        self.end = end
+        self.send_body = send_body
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        count = self.end - self.start + 1
+        if not self.send_body or count <= 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        file = await anyio.to_thread.run_sync(open, self.path, "rb")
+        with file:
+            if "http.response.zerocopy" in scope.get("extensions", {}):
+                await send({
+                    "type": "http.response.zerocopy",
+                    "file": file,
+                    "offset": self.start,
+                    "count": count,
+                    "more_body": False
+                })
+                return
+
+            position = self.start
+            while position <= self.end:
+                length = min(SEND_CHUNK_SIZE, self.end + 1 - position)
+                chunk = await anyio.to_thread.run_sync(os.pread, file.fileno(), length, position)
+                if not chunk:
+                    # File Was Truncated Under Us; End The Body Rather Than Loop Forever
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+                position += len(chunk)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": position <= self.end
+                })
+
+
+async def file_response(request: Request, path: str) -> Response:
+    """
+    Build A Conditional, Range-Aware Response For A File On Disk. Raises
+    FileNotFoundError When The Path Is Missing Or Not A Regular File.
+    """
+    stat_result = await anyio.to_thread.run_sync(os.stat, path)
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise FileNotFoundError(path)
+    size = stat_result.st_size
+    etag = _etag(stat_result)
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    headers = {
+        "accept-ranges": "bytes",
+        "etag": etag,
+        "last-modified": last_modified,
+        "cache-control": f"public, max-age={settings.media_cache_max_age}",
+    }
+
+    if _not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    headers["content-type"] = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    send_body = request.method != "HEAD"
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if range_header and size > 0 and _if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            return Response(status_code=416, headers={**headers, "content-range": f"bytes */{size}"})
+
+    if byte_range is None:
+        headers["content-length"] = str(size)
+        return FileRangeResponse(path, 0, size - 1, 200, headers, send_body)
+
+    start, end = byte_range
+    headers["content-range"] = f"bytes {start}-{end}/{size}"
+    headers["content-length"] = str(end - start + 1)
+    return FileRangeResponse(path, start, end, 206, headers, send_body)
@@ -0,0 +1,168 @@
+import asyncio
+import base64
+import hashlib
+import io
+import logging
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Tuple
+from PIL import Image, ImageOps
+from App.Core.Config import settings
+from App.Core.Streaming import SpooledUpload
+from App.Core.MediaMetadata import extract_exif, orientation_of
+from App.Core.UploadService import upload_spooled
+from App.Core.Workers import run_in_process
+
+logger = logging.getLogger(__name__)
+
+# Pillow Format Name And Save Options Per Output Format
+OUTPUT_FORMATS = {
+    "webp": ("WEBP", {"method": 4}),
+    "jpeg": ("JPEG", {"optimize": True, "progressive": True}),
+}
+
+
+class InvalidImageError(Exception):
+    """Raised When An Uploaded File Cannot Be Decoded As An Image"""
+
+
+def _save(image: Image.Image, out_dir: str, name: str, fmt: str, quality: int) -> dict:
+    pil_format, options = OUTPUT_FORMATS[fmt]
+    path = os.path.join(out_dir, f"{name}.{fmt}")
+    image.save(path, pil_format, quality=quality, **options)
+    with open(path, "rb") as saved:
+        sha256 = hashlib.sha256(saved.read()).hexdigest()
+    return {
+        "path": path,
+        "width": image.width,
+        "height": image.height,
+        "format": fmt,
+        "size": os.path.getsize(path),
+        "sha256": sha256,
+    }
+
+
+def _open_rgb(source_path: str) -> Tuple[Image.Image, Dict]:
+    with Image.open(source_path) as opened:
+        exif = extract_exif(opened)
+        image = ImageOps.exif_transpose(opened)
+        return image.convert("RGB"), exif
+
+
+def analyze_image(image: Image.Image, placeholder_size: int) -> Dict:
+    """Compute Dimensions, Dominant Color And A Tiny Base64 Placeholder (LQIP)"""
+    sample = image.copy()
+    sample.thumbnail((64, 64))
+    quantized = sample.quantize(colors=5)
+    palette = quantized.getpalette()
+    _, index = max(quantized.getcolors())
+    red, green, blue = palette[index * 3:index * 3 + 3]
+
+    tiny = image.copy()
+    tiny.thumbnail((placeholder_size, placeholder_size))
+    buffer = io.BytesIO()
+    tiny.save(buffer, "WEBP", quality=40)
+    encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+
+    return {
+        "width": image.width,
+        "height": image.height,
+        "orientation": orientation_of(image.width, image.height),
+        "dominant_color": f"#{red:02x}{green:02x}{blue:02x}",
+        "placeholder": f"data:image/webp;base64,{encoded}",
+    }
+
+
+def describe_image(source_path: str, placeholder_size: int) -> Dict:
+    """Analyze An Image File Without Rendering Variants (Used By The Backfill)"""
+    image, exif = _open_rgb(source_path)
+    return {**analyze_image(image, placeholder_size), **exif}
+
+
+def render_variants(
+    source_path: str,
+    out_dir: str,
+    widths: List[int],
+    quality: int,
+    thumbnail_size: int,
+    placeholder_size: int
+) -> Dict:
+    """
+    Decodes An Image Once, Analyzes It And Writes Resized Variants In Every Output Format.
+    Runs In A Worker Process; Only Paths And Plain Dicts Cross The Boundary.
+    """
+    image, exif = _open_rgb(source_path)
+    metadata = {**analyze_image(image, placeholder_size), **exif}
+
+    # Widths Larger Than The Original Are Skipped; The Original Width Is Always Kept
+    targets = sorted({w for w in widths if w < image.width} | {image.width}, reverse=True)
+    variants = []
+    current = image
+    for width in targets:
+        if width != current.width:
+            height = max(1, round(current.height * width / current.width))
+            current = current.resize((width, height), Image.LANCZOS)
+        for fmt in OUTPUT_FORMATS:
+            variants.append(_save(current, out_dir, f"w{width}", fmt, quality))
+
+    thumb = ImageOps.fit(image, (thumbnail_size, thumbnail_size), Image.LANCZOS)
+    thumbnail = _save(thumb, out_dir, "thumb", "jpeg", quality)
+
+    return {"metadata": metadata, "variants": variants, "thumbnail": thumbnail}
+
+
+def build_srcset(variants: List[dict]) -> Dict[str, str]:
+    """Group Variant URLs Into One srcset String Per Format"""
+    srcset = {}
+    for fmt in OUTPUT_FORMATS:
+        entries = sorted((v for v in variants if v["format"] == fmt), key=lambda v: v["width"])
+        if entries:
+            srcset[fmt] = ", ".join(f"{v['url']} {v['width']}w" for v in entries)
+    return srcset
+
+
+async def process_photo(spooled: SpooledUpload, folder: str) -> dict:
+    """
+    Renders Responsive Variants Of An Uploaded Photo In The Process Pool,
+    Uploads Them Alongside The Original And Returns The Resulting URLs.
+    """
+    out_dir = tempfile.mkdtemp(prefix="variants-", dir=settings.upload_temp_directory)
+    try:
+        try:
+            rendered = await run_in_process(
+                render_variants,
+                spooled.path,
+                out_dir,
+                settings.image_variant_widths,
+                settings.image_variant_quality,
+                settings.image_thumbnail_size,
+                settings.image_placeholder_size
+            )
+        except (OSError, Image.DecompressionBombError) as e:
+            raise InvalidImageError(f"Could Not Process {spooled.filename}: {e}") from e
+
+        async def store(item: dict) -> str:
+            name = f"{os.path.splitext(spooled.filename)[0]}-{os.path.basename(item['path'])}"
+            variant_file = SpooledUpload(item["path"], item["size"], item["sha256"], name, f"image/{item['format']}")
+            return await upload_spooled(variant_file, f"{folder}/variants", "image")
+
+        image_url, thumbnail_url, *variant_urls = await asyncio.gather(
+            upload_spooled(spooled, folder, "image"),
+            store(rendered["thumbnail"]),
+            *(store(item) for item in rendered["variants"])
+        )
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    variants = [
+        {"url": url, "width": item["width"], "height": item["height"], "format": item["format"]}
+        for url, item in zip(variant_urls, rendered["variants"])
+    ]
+    return {
+        "image_url": image_url,
+        "thumbnail_url": thumbnail_url,
+        "variants": variants,
+        "srcset": build_srcset(variants),
+        **rendered["metadata"],
+    }
@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+from bson import ObjectId
+from pymongo import ReturnDocument
+from App.Core.Config import settings
+from App.Core.Database import get_database
+from App.Core.Metrics import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+# Job Handler: Receives The Job Document And A Progress Callback, Returns The Job Result
+JobHandler = Callable[[dict, Callable[[int, Optional[int]], None]], Awaitable[dict]]
+
+_handlers: Dict[str, JobHandler] = {}
+_queue: asyncio.Queue = None
+_workers = []
+# Jobs This Process Is Executing Right Now; Their Lease Is Renewed Until They Finish
+_running = set()
+# Owner Recorded On Claimed Jobs, So Other Processes Sharing The Collection Leave Them Alone
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+_background_tasks = set()
+
+jobs_finished = Counter("jobs_finished_total", "Background Jobs Finished By Kind And Outcome", ("kind", "status"))
+Gauge("job_queue_depth", "Jobs Waiting For A Worker", callback=lambda: _queue.qsize() if _queue else 0)
+
+
+def register_job_handler(kind: str, handler: JobHandler):
+    """Register The Coroutine That Runs Jobs Of The Given Kind"""
+    _handlers[kind] = handler
+
+
+def _serialize(job: dict) -> dict:
+    job = {k: v for k, v in job.items() if k != "params"}
+    job["_id"] = str(job["_id"])
+    return job
+
+
+async def enqueue_job(kind: str, params: dict) -> str:
+    """Persist A New Job And Queue It For A Worker. Returns The Job ID."""
+    if kind not in _handlers:
+        raise ValueError(f"No Handler Registered For Job Kind: {kind}")
+    if _queue is None:
+        raise RuntimeError("Job Workers Not Started")
+
+    db = get_database()
+    now = datetime.utcnow()
+    result = await db.media_jobs.insert_one({
+        "kind": kind,
+        "status": "queued",
+        "params": params,
+        "progress": {"done": 0, "total": None, "percent": 0},
+        "result": None,
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+    })
+    job_id = str(result.inserted_id)
+    await _queue.put(job_id)
+    logger.info(f"Queued {kind} Job {job_id}")
+    return job_id
+
+
+async def get_job(job_id: str) -> Optional[dict]:
+    """Get A Job's Public State (Without Its Internal Parameters)"""
+    job = await get_database().media_jobs.find_one({"_id": ObjectId(job_id)})
+    return _serialize(job) if job else None
+
+
+async def _finish(job_id: ObjectId, status: str, **fields):
+    now = datetime.utcnow()
+    # Only While Still The Owner; A Job Whose Lease Lapsed May Be Running Elsewhere By Now
+    await get_database().media_jobs.update_one(
+        {"_id": job_id, "worker_id": WORKER_ID},
+        {"$set": {
+            "status": status,
+            "updated_at": now,
+            "finished_at": now,
+            # Finished Jobs Are Removed By The TTL Index Once This Passes
+            "expires_at": now + timedelta(hours=settings.job_retention_hours),
+            **fields
+        }}
+    )
+
+
+def _progress_reporter(job_id: ObjectId):
+    """Build A Progress Callback That Writes To Mongo At Most Once Per Interval"""
+    state = {"last": 0.0}
+
+    def report(done: int, total: Optional[int]):
+        now = time.monotonic()
+        if now - state["last"] < settings.job_progress_interval_seconds and done != total:
+            return
+        state["last"] = now
+        percent = done * 100 // total if total else None
+        task = asyncio.create_task(get_database().media_jobs.update_one(
+            {"_id": job_id, "status": "running", "worker_id": WORKER_ID},
+            {"$set": {
+                "progress": {"done": done, "total": total, "percent": percent},
+                "updated_at": datetime.utcnow(),
+                "heartbeat_at": datetime.utcnow()
+            }}
+        ))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    return report
+
+
+async def _run_job(job_id: str):
+    db = get_database()
+    now = datetime.utcnow()
+    job = await db.media_jobs.find_one_and_update(
+        {"_id": ObjectId(job_id), "status": "queued"},
+        {"$set": {"status": "running", "worker_id": WORKER_ID, "started_at": now, "updated_at": now, "heartbeat_at": now}},
+        return_document=ReturnDocument.AFTER
+    )
+    if not job:
+        return  # Already Picked Up Or Removed
+
+    _running.add(job["_id"])
+    try:
+        result = await _handlers[job["kind"]](job, _progress_reporter(job["_id"]))
+    except Exception as e:
+        logger.error(f"Job {job_id} ({job['kind']}) Failed: {e}")
+        await _finish(job["_id"], "failed", error=str(e))
+        jobs_finished.inc(job["kind"], "failed")
+        return
+    finally:
+        _running.discard(job["_id"])
+
+    await _finish(job["_id"], "succeeded", result=result, **{"progress.percent": 100})
+    jobs_finished.inc(job["kind"], "succeeded")
+    logger.info(f"Job {job_id} ({job['kind']}) Succeeded")
+
+
+async def _worker(number: int):
+    while True:
+        job_id = await _queue.get()
+        try:
+            await _run_job(job_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Job Worker {number} Error On {job_id}: {e}")
+        finally:
+            _queue.task_done()
+
+
+async def _heartbeat():
+    """Renew The Lease On Every Job This Process Is Running"""
+    while True:
+        await asyncio.sleep(settings.job_heartbeat_seconds)
+        if not _running:
+            continue
+        try:
+            await get_database().media_jobs.update_many(
+                {"_id": {"$in": list(_running)}, "status": "running", "worker_id": WORKER_ID},
+                {"$set": {"heartbeat_at": datetime.utcnow()}}
+            )
+        except Exception as e:
+            logger.warning(f"Could Not Renew Job Leases: {e}")
+
+
+async def _recover_jobs():
+    """
+    Re-Queue Jobs That Were Queued, Or Running Under A Lease Nobody Renewed For
+    job_lease_seconds (Their Process Stopped). Jobs Other Workers Are Still
+    Running Keep Their Owner.
+    """
+    db = get_database()
+    expired = datetime.utcnow() - timedelta(seconds=settings.job_lease_seconds)
+    await db.media_jobs.update_many(
+        {
+            "status": "running",
+            "_id": {"$nin": list(_running)},
+            "$or": [{"heartbeat_at": {"$lt": expired}}, {"heartbeat_at": {"$exists": False}}],
+        },
+        {"$set": {"status": "queued", "updated_at": datetime.utcnow()}, "$unset": {"worker_id": ""}}
+    )
+    cursor = db.media_jobs.find({"status": "queued"}, {"_id": 1}).sort("created_at", 1)
+    recovered = 0
+    async for job in cursor:
+        await _queue.put(str(job["_id"]))
+        recovered += 1
+    if recovered:
+        logger.info(f"Recovered {recovered} Unfinished Job(s)")
+
+
+async def start_job_workers():
+    """Start The Job Workers And Resume Unfinished Jobs"""
+    global _queue
+    _queue = asyncio.Queue()
+    for number in range(settings.job_workers):
+        _workers.append(asyncio.create_task(_worker(number)))
+    _workers.append(asyncio.create_task(_heartbeat()))
+
+    await recover_jobs()
+    logger.info(f"Started {settings.job_workers} Job Worker(s)")
+
+
+async def recover_jobs():
+    """
+    Resume Unfinished Jobs. Runs At Startup And Again Whenever MongoDB Comes
+    Back, So Jobs Left Behind By A Boot Without The Database Still Run. Queue
+    Entries Are Safe To Duplicate: Only One Worker Can Claim A Queued Job.
+    """
+    if _queue is None:
+        return
+    try:
+        db = get_database()
+        await db.media_jobs.create_index("expires_at", expireAfterSeconds=0)
+        await db.media_jobs.create_index("status")
+        await _recover_jobs()
+    except Exception as e:
+        logger.warning(f"Could Not Recover Jobs: {e}")
+
+
+async def stop_job_workers():
+    """Cancel The Job Workers; Unfinished Jobs Resume On Next Startup"""
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
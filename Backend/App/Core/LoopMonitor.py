@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from datetime import datetime
+from typing import List, Optional
+from App.Core.Config import settings
+from App.Core.Metrics import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Lag Samples Kept For The Percentile Gauges (At The Default Interval, About One Minute)
+LAG_WINDOW = 600
+LAG_QUANTILES = (0.5, 0.9, 0.99, 1.0)
+
+
+class EventLoopBlockedError(RuntimeError):
+    """Raised In Strict Mode When A Request Blocked The Event Loop Past The Threshold"""
+
+
+class LoopMonitor:
+    """
+    Measures Event Loop Scheduling Lag With A Heartbeat Task, While A Watchdog
+    Thread Watches The Heartbeat. If The Loop Stops Beating For Longer Than
+    loop_block_threshold_ms, The Watchdog Captures The Loop Thread's Current
+    Stack (The Code That Is Blocking It) Via sys._current_frames().
+    """
+
+    def __init__(self):
+        self.lags = deque(maxlen=LAG_WINDOW)
+        self.stalls = deque(maxlen=settings.loop_stall_history)
+        # Tasks Caught Blocking The Loop -> Milliseconds Blocked (Strict Mode)
+        self.blocked_tasks: "weakref.WeakKeyDictionary[asyncio.Task, float]" = weakref.WeakKeyDictionary()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._beat = 0.0
+        self._reported_beat = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(f"Event Loop Monitor Started (Threshold {settings.loop_block_threshold_ms:.0f}ms{', Strict' if settings.loop_block_strict else ''})")
+
+    async def stop(self):
+        self._stop.set()
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._watchdog:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _heartbeat(self):
+        interval = settings.loop_monitor_interval_seconds
+        while True:
+            beat = time.monotonic()
+            self._beat = beat
+            await asyncio.sleep(interval)
+            lag = max(0.0, time.monotonic() - beat - interval)
+            self.lags.append(lag)
+            event_loop_lag.observe(lag)
+            if lag * 1000 >= settings.loop_block_threshold_ms:
+                self._finish_stall(beat, lag)
+
+    def _finish_stall(self, beat: float, lag: float):
+        """Once The Loop Resumes, Replace The Watchdog's Lower Bound With The Measured Lag"""
+        with self._lock:
+            if self.stalls and self.stalls[-1]["_beat"] == beat:
+                self.stalls[-1]["blocked_ms"] = round(lag * 1000, 1)
+                self.stalls[-1]["ongoing"] = False
+
+    def _watch(self):
+        interval = settings.loop_monitor_interval_seconds
+        threshold = settings.loop_block_threshold_ms / 1000
+        poll = min(interval, threshold / 2)
+        while not self._stop.wait(poll):
+            beat = self._beat
+            stalled = time.monotonic() - beat - interval
+            if stalled >= threshold and beat != self._reported_beat:
+                self._reported_beat = beat
+                self._capture(beat, stalled)
+
+    def _capture(self, beat: float, stalled: float):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        task = asyncio.current_task(self._loop)
+        stall = {
+            "detected_at": datetime.utcnow(),
+            "blocked_ms": round(stalled * 1000, 1),
+            "ongoing": True,
+            "task": task.get_name() if task else None,
+            "stack": stack,
+            "_beat": beat,
+        }
+        with self._lock:
+            self.stalls.append(stall)
+        if task is not None:
+            self.blocked_tasks[task] = stall["blocked_ms"]
+        event_loop_stalls.inc()
+        logger.warning(f"Event Loop Blocked For {stall['blocked_ms']:.0f}ms+ In {stall['task']}:\n{stack}")
+
+    def lag_quantiles(self) -> dict:
+        samples = sorted(self.lags)
+        if not samples:
+            return {}
+        return {(str(q),): samples[min(len(samples) - 1, int(q * len(samples)))] for q in LAG_QUANTILES}
+
+    def recent_stalls(self) -> List[dict]:
+        with self._lock:
+            return [{k: v for k, v in stall.items() if not k.startswith("_")} for stall in reversed(self.stalls)]
+
+
+loop_monitor = LoopMonitor()
+
+event_loop_lag = Histogram(
+    "event_loop_lag_seconds", "Event Loop Scheduling Lag Per Heartbeat",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+Gauge("event_loop_lag_quantile_seconds", "Event Loop Lag Percentiles Over The Recent Window", ("quantile",), callback=loop_monitor.lag_quantiles)
+event_loop_stalls = Counter("event_loop_stalls_total", "Times The Event Loop Was Blocked Past The Threshold")
+
+
+async def start_loop_monitor():
+    if settings.loop_monitor_enabled:
+        loop_monitor.start()
+
+
+async def stop_loop_monitor():
+    await loop_monitor.stop()
+
+
+class StrictLoopMiddleware:
+    """
+    Development/Test Mode: Fail Any Request Whose Task Blocked The Event Loop For
+    Longer Than loop_block_threshold_ms, So Blocking Calls Surface As Test Failures.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        await self.app(scope, receive, send)
+        blocked_ms = loop_monitor.blocked_tasks.pop(asyncio.current_task(), None)
+        if blocked_ms is not None:
+            raise EventLoopBlockedError(f"{scope['method']} {scope['path']} Blocked The Event Loop For {blocked_ms:.0f}ms+")
@@ -0,0 +1,41 @@
+import logging
+from datetime import datetime
+from typing import Optional
+from App.Core.Database import get_database
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_key(sha256: str, resource_type: str, backend: str) -> str:
+    # URLs Are Only Reusable Within The Storage Backend That Produced Them
+    return f"{backend}:{resource_type}:{sha256}"
+
+
+async def find_duplicate(sha256: str, resource_type: str, backend: str) -> Optional[str]:
+    """Return The Stored URL For Previously Uploaded Content, If Any"""
+    try:
+        db = get_database()
+        entry = await db.media_hashes.find_one({"_id": _hash_key(sha256, resource_type, backend)})
+    except Exception as e:
+        # Deduplication Is An Optimization; Never Fail The Upload Over It
+        logger.warning(f"Media Hash Lookup Failed: {e}")
+        return None
+    return entry["secure_url"] if entry else None
+
+
+async def remember_upload(sha256: str, resource_type: str, backend: str, secure_url: str, folder: str, size: int):
+    """Record The Hash -> URL Mapping For A Completed Upload"""
+    try:
+        db = get_database()
+        await db.media_hashes.update_one(
+            {"_id": _hash_key(sha256, resource_type, backend)},
+            {"$setOnInsert": {
+                "secure_url": secure_url,
+                "folder": folder,
+                "size": size,
+                "created_at": datetime.utcnow()
+            }},
+            upsert=True
+        )
+    except Exception as e:
+        logger.warning(f"Failed To Record Media Hash: {e}")
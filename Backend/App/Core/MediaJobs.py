@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from fastapi import UploadFile
+from fastapi.responses import JSONResponse
+from App.Core.ImageProcessing import process_photo
+from App.Core.Jobs import enqueue_job, register_job_handler
+from App.Core.MediaMetadata import probe_video_file
+from App.Core.Streaming import SpooledUpload, spool_upload
+from App.Core.UploadService import upload_spooled
+from App.Core.Config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _spooled_from_params(params: dict) -> SpooledUpload:
+    return SpooledUpload(
+        params["path"],
+        params["size"],
+        params["sha256"],
+        params["filename"],
+        params.get("content_type")
+    )
+
+
+async def _run_upload_job(job: dict, on_progress) -> dict:
+    params = job["params"]
+    spooled = _spooled_from_params(params)
+    try:
+        if job["kind"] == "photo":
+            result = await process_photo(spooled, folder=params["folder"])
+        else:
+            result = {}
+            if params["resource_type"] == "video":
+                result.update(await probe_video_file(spooled.path))
+            url = await upload_spooled(spooled, params["folder"], params["resource_type"], on_progress)
+            result[params["result_key"]] = url
+    except asyncio.CancelledError:
+        raise  # Keep The Spooled File So The Job Can Resume After A Restart
+    except BaseException:
+        spooled.cleanup()
+        raise
+    spooled.cleanup()
+    return result
+
+
+register_job_handler("photo", _run_upload_job)
+register_job_handler("media", _run_upload_job)
+
+
+async def enqueue_upload(
+    file: UploadFile,
+    folder: str,
+    resource_type: str,
+    result_key: str,
+    max_size: int,
+    kind: str = "media"
+) -> JSONResponse:
+    """
+    Spool An Upload To Persistent Disk And Hand It To The Job Queue.
+    Returns 202 Accepted With The Job ID; The Job Result Matches The
+    Body The Synchronous Endpoint Would Have Returned.
+    """
+    spooled = await spool_upload(file, max_size, directory=settings.job_spool_directory)
+    try:
+        job_id = await enqueue_job(kind, {
+            "path": spooled.path,
+            "size": spooled.size,
+            "sha256": spooled.sha256,
+            "filename": spooled.filename,
+            "content_type": spooled.content_type,
+            "folder": folder,
+            "resource_type": resource_type,
+            "result_key": result_key,
+        })
+    except BaseException:
+        spooled.cleanup()
+        raise
+    return JSONResponse(
+        status_code=202,
+        content={"job_id": job_id, "status": "queued", "status_url": f"/api/jobs/{job_id}"}
+    )
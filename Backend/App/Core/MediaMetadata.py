@@ -0,0 +1,157 @@
+import logging
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+from PIL import Image
+from App.Core.Workers import run_in_process
+
+logger = logging.getLogger(__name__)
+
+# EXIF Tag IDs (Base IFD And Exif Sub-IFD)
+EXIF_IFD = 0x8769
+TAG_MAKE = 271
+TAG_MODEL = 272
+TAG_DATETIME = 306
+TAG_DATETIME_ORIGINAL = 36867
+TAG_LENS_MODEL = 42036
+
+# Containers Using The ISO Base Media File Format Box Structure
+ISO_BMFF_EXTENSIONS = {".mp4", ".mov", ".m4v"}
+
+
+def orientation_of(width: Optional[int], height: Optional[int]) -> Optional[str]:
+    if not width or not height:
+        return None
+    if width == height:
+        return "square"
+    return "landscape" if width > height else "portrait"
+
+
+def _clean(value) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).replace("\x00", "").strip()
+    return text or None
+
+
+def _parse_exif_datetime(value) -> Optional[datetime]:
+    text = _clean(value)
+    if not text:
+        return None
+    try:
+        return datetime.strptime(text[:19], "%Y:%m:%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
+def extract_exif(image: Image.Image) -> Dict:
+    """Read Capture Time, Camera And Lens From An Opened Image's EXIF Data"""
+    try:
+        exif = image.getexif()
+        exif_ifd = exif.get_ifd(EXIF_IFD)
+    except Exception as e:
+        logger.debug(f"Unreadable EXIF: {e}")
+        return {}
+
+    make = _clean(exif.get(TAG_MAKE))
+    model = _clean(exif.get(TAG_MODEL))
+    # Many Models Already Start With The Make ("Canon EOS R5")
+    if make and model and model.lower().startswith(make.lower()):
+        camera = model
+    else:
+        camera = " ".join(part for part in (make, model) if part) or None
+
+    return {
+        "captured_at": _parse_exif_datetime(exif_ifd.get(TAG_DATETIME_ORIGINAL) or exif.get(TAG_DATETIME)),
+        "camera": camera,
+        "lens": _clean(exif_ifd.get(TAG_LENS_MODEL)),
+    }
+
+
+def _iter_boxes(file: BinaryIO, start: int, end: int):
+    """Yield (type, payload_start, payload_end) For Each Box Between start And end"""
+    position = start
+    while position + 8 <= end:
+        file.seek(position)
+        header = file.read(8)
+        if len(header) < 8:
+            return
+        size, box_type = struct.unpack(">I4s", header)
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", file.read(8))[0]
+            header_size = 16
+        elif size == 0:
+            size = end - position
+        if size < header_size:
+            return
+        yield box_type, position + header_size, min(position + size, end)
+        position += size
+
+
+def _find_box(file: BinaryIO, start: int, end: int, box_type: bytes):
+    for found, payload_start, payload_end in _iter_boxes(file, start, end):
+        if found == box_type:
+            return payload_start, payload_end
+    return None
+
+
+def probe_video(path: str) -> Dict:
+    """
+    Read Duration And Resolution From An MP4/MOV Container By Walking Its Box Tree.
+    Only Box Headers And The mvhd/tkhd Payloads Are Read, So Cost Is Independent
+    Of File Size. Other Containers Return An Empty Dict.
+    """
+    if Path(path).suffix.lower() not in ISO_BMFF_EXTENSIONS:
+        return {}
+
+    metadata = {}
+    with open(path, "rb") as file:
+        file.seek(0, 2)
+        moov = _find_box(file, 0, file.tell(), b"moov")
+        if not moov:
+            return {}
+
+        for box_type, start, end in _iter_boxes(file, *moov):
+            if box_type == b"mvhd":
+                file.seek(start)
+                version = file.read(1)[0]
+                if version == 1:
+                    file.seek(start + 4 + 16)
+                    timescale, duration = struct.unpack(">IQ", file.read(12))
+                else:
+                    file.seek(start + 4 + 8)
+                    timescale, duration = struct.unpack(">II", file.read(8))
+                if timescale:
+                    metadata["duration"] = round(duration / timescale, 3)
+
+            elif box_type == b"trak" and "width" not in metadata:
+                tkhd = _find_box(file, start, end, b"tkhd")
+                if not tkhd:
+                    continue
+                file.seek(tkhd[0])
+                version = file.read(1)[0]
+                # Display Matrix (a, b, u, c, d, v, x, y, w) Followed By Width And Height, 16.16 Fixed-Point
+                file.seek(tkhd[0] + (52 if version == 1 else 40))
+                a, b, _, c, d, *_ = struct.unpack(">9i", file.read(36))
+                width, height = struct.unpack(">II", file.read(8))
+                # Audio Tracks Have Zero Dimensions
+                if width and height:
+                    # Phones Store Portrait Video Landscape With A 90/270 Degree Matrix
+                    if abs(b) + abs(c) > abs(a) + abs(d):
+                        width, height = height, width
+                    metadata["width"] = width >> 16
+                    metadata["height"] = height >> 16
+
+    metadata["orientation"] = orientation_of(metadata.get("width"), metadata.get("height"))
+    return metadata
+
+
+async def probe_video_file(path: str) -> Dict:
+    """Probe A Video In The Process Pool; Unparseable Files Yield No Metadata"""
+    try:
+        return await run_in_process(probe_video, path)
+    except Exception as e:
+        logger.warning(f"Could Not Read Video Metadata From {path}: {e}")
+        return {}
@@ -0,0 +1,308 @@
+import bisect
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from pymongo import monitoring
+
+# Latency Buckets In Seconds (Upper Bounds), Sized For Web Requests And DB Calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+_registry: List["Metric"] = []
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), callback: Optional[Callable] = None):
+        """
+        callback, If Given, Is Called At Scrape Time And Returns Either A Number Or
+        A Dict Of Label-Value Tuples To Numbers. It Lets Modules Expose Counters
+        They Already Keep (E.g. Cache Hit Dicts) Without Touching Their Hot Paths.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def samples(self):
+        if self.callback is not None:
+            values = self.callback()
+            if not isinstance(values, dict):
+                values = {(): values}
+        else:
+            values = dict(self._values)
+        for labels, value in values.items():
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str):
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per Label Set: [Count Per Bucket..., +Inf Count, Sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self):
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        for labels, series in snapshot.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                yield f"{self.name}_bucket", _format_labels(self.labelnames, labels, f'le="{_format_value(bound)}"'), cumulative
+            yield f"{self.name}_sum", _format_labels(self.labelnames, labels), series[-1]
+            yield f"{self.name}_count", _format_labels(self.labelnames, labels), cumulative
+
+
+def render_metrics() -> str:
+    """Render Every Registered Metric In The Prometheus Text Exposition Format"""
+    lines = []
+    for metric in _registry:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{labels} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# HTTP Metrics
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP Request Latency By Route Template", ("method", "route", "status")
+)
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight", "HTTP Requests Currently Being Served", ("method",)
+)
+
+# MongoDB Metrics
+mongo_command_duration = Histogram(
+    "mongo_command_duration_seconds", "MongoDB Command Latency By Collection", ("collection", "command")
+)
+mongo_command_failures = Counter(
+    "mongo_command_failures_total", "MongoDB Commands That Returned An Error", ("collection", "command")
+)
+
+
+# Route Name And Path Parameter Names -> Full Route Template, Filled In As Routes Are First Hit
+_route_templates: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+
+
+def _route_template(scope) -> str:
+    """
+    The Matched Route Template ("/api/photos/{photo_id}"); Unmatched Requests
+    (404s, Scanners) Share One Label.
+    """
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    params = tuple(scope.get("path_params", {}))
+    key = (route.name, params)
+    template = _route_templates.get(key)
+    if template is None:
+        # route.path Lacks The Prefix Of An Included Router; Reversing The Route With
+        # Placeholder Values Yields The Full Path On Any FastAPI Version
+        try:
+            template = scope["app"].url_path_for(route.name, **{name: f"{{{name}}}" for name in params})
+        except Exception:
+            template = route.path
+        _route_templates[key] = template
+    return template
+
+
+class MetricsMiddleware:
+    """
+    ASGI Middleware Timing Each Request. Requests Are Labelled By Their Route
+    Template ("/api/photos/{photo_id}") So Label Cardinality Stays Bounded;
+    Unmatched Paths Share One Label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        status = ["500"]
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = str(message["status"])
+            await send(message)
+
+        http_requests_in_flight.inc(method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec(method)
+            http_request_duration.observe(time.perf_counter() - start, method, _route_template(scope), status[0])
+
+
+# Commands Whose Target Collection Is Not The Value Of The Command Name Key
+_COLLECTION_FIELDS = {"getMore": "collection"}
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    pymongo Command Listener Recording Per-Collection Latency. Motor Runs pymongo
+    In Worker Threads, So These Callbacks Must Stay Cheap And Thread-Safe.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Tuple[int, object], str] = {}
+
+    def started(self, event):
+        field = _COLLECTION_FIELDS.get(event.command_name, event.command_name)
+        collection = event.command.get(field)
+        self._pending[(event.request_id, event.connection_id)] = collection if isinstance(collection, str) else "-"
+
+    def _finish(self, event) -> str:
+        return self._pending.pop((event.request_id, event.connection_id), "-")
+
+    def succeeded(self, event):
+        collection = self._finish(event)
+        mongo_command_duration.observe(event.duration_micros / 1e6, collection, event.command_name)
+
+    def failed(self, event):
+        collection = self._finish(event)
+        mongo_command_duration.observe(event.duration_micros / 1e6, collection, event.command_name)
+        mongo_command_failures.inc(collection, event.command_name)
+
+
+class MongoPoolStats(monitoring.ConnectionPoolListener):
+    """Connection Pool Counters Per Server, For The Health Endpoint And /api/metrics"""
+
+    def __init__(self):
+        self._pools: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, address) -> dict:
+        key = f"{address[0]}:{address[1]}"
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = {
+                "open": 0,
+                "in_use": 0,
+                "waiting": 0,
+                "created": 0,
+                "closed": 0,
+                "checkout_failures": 0,
+                "cleared": 0,
+                "checkout_wait_ms_max": 0.0,
+            }
+        return pool
+
+    def _update(self, address, **deltas):
+        with self._lock:
+            pool = self._pool(address)
+            for field, delta in deltas.items():
+                pool[field] += delta
+
+    def pool_created(self, event):
+        with self._lock:
+            self._pool(event.address)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._update(event.address, cleared=1)
+
+    def pool_closed(self, event):
+        with self._lock:
+            self._pools.pop(f"{event.address[0]}:{event.address[1]}", None)
+
+    def connection_created(self, event):
+        self._update(event.address, open=1, created=1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._update(event.address, open=-1, closed=1)
+
+    def connection_check_out_started(self, event):
+        self._update(event.address, waiting=1)
+
+    def connection_check_out_failed(self, event):
+        self._update(event.address, waiting=-1, checkout_failures=1)
+
+    def connection_checked_out(self, event):
+        self._update(event.address, waiting=-1, in_use=1)
+        wait_ms = getattr(event, "duration", 0) * 1000
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["checkout_wait_ms_max"] = max(pool["checkout_wait_ms_max"], round(wait_ms, 2))
+
+    def connection_checked_in(self, event):
+        self._update(event.address, in_use=-1)
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {address: dict(pool) for address, pool in self._pools.items()}
+
+    def gauge(self, field: str) -> Dict[LabelValues, float]:
+        return {(address,): pool[field] for address, pool in self.snapshot().items()}
+
+
+mongo_pool_stats = MongoPoolStats()
+Gauge("mongo_pool_connections_open", "Open Connections Per MongoDB Server", ("server",), callback=lambda: mongo_pool_stats.gauge("open"))
+Gauge("mongo_pool_connections_in_use", "Checked-Out Connections Per MongoDB Server", ("server",), callback=lambda: mongo_pool_stats.gauge("in_use"))
+Gauge("mongo_pool_checkouts_waiting", "Operations Waiting For A Pooled Connection", ("server",), callback=lambda: mongo_pool_stats.gauge("waiting"))
+Counter("mongo_pool_checkout_failures_total", "Connection Checkouts That Failed Or Timed Out", ("server",), callback=lambda: mongo_pool_stats.gauge("checkout_failures"))
@@ -0,0 +1,221 @@
+import asyncio
+import logging
+import smtplib
+import ssl
+from email.message import EmailMessage
+from typing import List, Optional
+from App.Core.Config import settings
+from App.Core.Metrics import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+# Hosts That Accept Unauthenticated Mail (Local SMTP Stand-Ins For Development And Tests)
+LOCAL_SMTP_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+
+notifications_sent = Counter("notifications_total", "Notification Emails By Outcome", ("result",))
+Gauge("notification_queue_depth", "Contact Notifications Waiting To Be Sent", callback=lambda: _queue.qsize() if _queue else 0)
+
+
+class SmtpConnection:
+    """
+    A Single Reused SMTP Connection. Blocking smtplib Calls Are Only Ever Made
+    From The Notification Worker (Via asyncio.to_thread), One At A Time.
+    """
+
+    def __init__(self):
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        timeout = settings.smtp_timeout_seconds
+        if settings.smtp_port == 465:
+            smtp = smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port, timeout=timeout, context=ssl.create_default_context())
+        else:
+            smtp = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=timeout)
+            smtp.ehlo()
+            if smtp.has_extn("starttls"):
+                smtp.starttls(context=ssl.create_default_context())
+                smtp.ehlo()
+        if settings.smtp_user:
+            smtp.login(settings.smtp_user, settings.smtp_password)
+        logger.info(f"Connected To SMTP Server {settings.smtp_host}:{settings.smtp_port}")
+        return smtp
+
+    def send(self, message: EmailMessage):
+        if self._smtp is None:
+            self._smtp = self._connect()
+        try:
+            self._smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # The Server Dropped An Idle Connection; Reconnect Once And Resend
+            self._smtp = self._connect()
+            self._smtp.send_message(message)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            pass
+        self._smtp = None
+
+
+def notifications_enabled() -> bool:
+    if not settings.contact_notifications or not settings.smtp_host:
+        return False
+    return bool(settings.smtp_user) or settings.smtp_host in LOCAL_SMTP_HOSTS
+
+
+def _header_value(value: str) -> str:
+    """Fold Line Breaks Out Of Visitor-Supplied Text Before It Goes Into A Header"""
+    return " ".join(str(value).split())
+
+
+def _base_message(subject: str) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = _header_value(subject)
+    message["From"] = settings.smtp_user or settings.admin_email
+    message["To"] = settings.notification_email or settings.admin_email
+    return message
+
+
+def build_contact_email(contact: dict) -> EmailMessage:
+    message = _base_message(f"New Contact Message From {contact['name']}")
+    message["Reply-To"] = _header_value(contact["email"])
+    message.set_content(
+        f"Name: {contact['name']}\n"
+        f"Email: {contact['email']}\n"
+        f"Received: {contact['created_at']:%Y-%m-%d %H:%M} UTC\n\n"
+        f"{contact['message']}\n\n"
+        f"Inbox: {settings.admin_url}"
+    )
+    return message
+
+
+def build_digest_email(contacts: List[dict]) -> EmailMessage:
+    message = _base_message(f"{len(contacts)} New Contact Messages")
+    sections = [
+        f"From: {contact['name']} <{contact['email']}> ({contact['created_at']:%Y-%m-%d %H:%M} UTC)\n\n{contact['message']}"
+        for contact in contacts
+    ]
+    message.set_content("\n\n----------\n\n".join(sections) + f"\n\nInbox: {settings.admin_url}")
+    return message
+
+
+async def _send_with_retries(connection: SmtpConnection, message: EmailMessage):
+    for attempt in range(settings.notification_max_retries + 1):
+        try:
+            await asyncio.to_thread(connection.send, message)
+            notifications_sent.inc("sent")
+            return
+        except Exception as e:
+            if attempt == settings.notification_max_retries:
+                logger.error(f"Giving Up On Notification '{message['Subject']}': {e}")
+                notifications_sent.inc("failed")
+                return
+            delay = settings.notification_retry_backoff_seconds * (2 ** attempt)
+            logger.warning(f"Notification Send Failed ({e}); Retrying In {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+async def _collect_batch(first: dict) -> List[dict]:
+    """Gather Messages Already Queued, Plus Any Arriving Within The Digest Window Of The First One"""
+    batch = [first]
+    while not _queue.empty():
+        batch.append(_queue.get_nowait())
+    window = settings.notification_digest_window_seconds
+    if window <= 0:
+        return batch
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + window
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return batch
+        try:
+            batch.append(await asyncio.wait_for(_queue.get(), remaining))
+        except asyncio.TimeoutError:
+            return batch
+
+
+def _build_messages(batch: List[dict]) -> List[EmailMessage]:
+    """One Digest For A Large Batch, Else One Email Each; A Message That Can't Be Built Is Logged And Dropped"""
+    if len(batch) >= settings.notification_digest_threshold:
+        try:
+            return [build_digest_email(batch)]
+        except Exception as e:
+            logger.warning(f"Could Not Build Digest Email, Sending Messages Individually: {e}")
+    messages = []
+    for contact in batch:
+        try:
+            messages.append(build_contact_email(contact))
+        except Exception as e:
+            logger.error(f"Dropping Notification For Contact Message {contact.get('_id')}: {e}")
+            notifications_sent.inc("invalid")
+    return messages
+
+
+async def _notification_worker():
+    connection = SmtpConnection()
+    try:
+        while True:
+            try:
+                first = await asyncio.wait_for(_queue.get(), settings.smtp_idle_seconds)
+            except asyncio.TimeoutError:
+                # Release The Connection While The Inbox Is Quiet
+                await asyncio.to_thread(connection.close)
+                continue
+
+            batch = await _collect_batch(first)
+            try:
+                for message in _build_messages(batch):
+                    await _send_with_retries(connection, message)
+            finally:
+                for _ in batch:
+                    _queue.task_done()
+    finally:
+        await asyncio.to_thread(connection.close)
+
+
+def notify_contact_message(contact: dict):
+    """Queue An Email Notification For A New Contact Message (Never Blocks The Request)"""
+    if _queue is None:
+        return
+    try:
+        _queue.put_nowait(contact)
+    except asyncio.QueueFull:
+        logger.warning("Notification Queue Full; Dropping Contact Message Notification")
+        notifications_sent.inc("dropped")
+
+
+def start_notification_worker():
+    global _queue, _worker
+    if not notifications_enabled():
+        logger.info("SMTP Not Configured; Contact Message Notifications Disabled")
+        return
+    _queue = asyncio.Queue(maxsize=settings.notification_queue_size)
+    _worker = asyncio.create_task(_notification_worker())
+
+
+async def stop_notification_worker():
+    """Give Queued Notifications A Short Grace Period, Then Stop The Worker"""
+    global _queue, _worker
+    if _worker is None:
+        return
+    try:
+        await asyncio.wait_for(_queue.join(), settings.notification_drain_seconds)
+    except asyncio.TimeoutError:
+        logger.warning(f"Dropping {_queue.qsize()} Unsent Notification(s) On Shutdown")
+    _worker.cancel()
+    try:
+        await _worker
+    except asyncio.CancelledError:
+        pass
+    _queue = None
+    _worker = None
@@ -0,0 +1,175 @@
+import asyncio
+import itertools
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter as FrameCounter, deque
+from datetime import datetime
+from typing import List, Optional
+from urllib.parse import parse_qs
+from App.Core.Config import settings
+from App.Core.Security import decode_access_token
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_QUERY_FLAG = "__profile"
+
+# Pseudo-Frame For Samples Taken While The Request Was Awaiting (I/O, Threads, Other Tasks)
+AWAITING_FRAME = "<awaiting>"
+
+_profiles = deque(maxlen=settings.profiler_history)
+_profile_ids = itertools.count(1)
+_active = 0
+
+# Long Absolute Paths Are Shortened To Their Package-Relative Form In Frame Names
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PATH_ROOTS = sorted({_BACKEND_ROOT} | {path for path in sys.path if len(path) > 1}, key=len, reverse=True)
+
+
+def _short_path(filename: str) -> str:
+    for root in _PATH_ROOTS:
+        if filename.startswith(root):
+            return filename[len(root):].lstrip(os.sep)
+    return filename
+
+
+class RequestSampler:
+    """
+    Statistical Profiler For One Request. A Thread Samples The Event Loop Thread's
+    Stack Every profiler_interval_ms; Samples Are Attributed To The Request Only
+    While Its Task Is The One Running, Otherwise They Count As Awaiting. Stacks Are
+    Aggregated In Folded Format ("root;caller;callee count"), Ready For flamegraph.pl
+    Or speedscope.
+    """
+
+    def __init__(self, task: asyncio.Task, label: str):
+        self.task = task
+        self.label = label
+        self.loop = task.get_loop()
+        self.loop_thread_id = threading.get_ident()
+        self.stacks = FrameCounter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._code_names = {}
+
+    def _frame_name(self, code) -> str:
+        name = self._code_names.get(code)
+        if name is None:
+            name = self._code_names[code] = f"{code.co_name} ({_short_path(code.co_filename)})"
+        return name
+
+    def _run(self):
+        interval = settings.profiler_interval_ms / 1000
+        while not self._stop.wait(interval):
+            self.samples += 1
+            if asyncio.current_task(self.loop) is not self.task:
+                self.stacks[(self.label, AWAITING_FRAME)] += 1
+                continue
+            frame = sys._current_frames().get(self.loop_thread_id)
+            names = []
+            while frame is not None:
+                names.append(self._frame_name(frame.f_code))
+                frame = frame.f_back
+            names.append(self.label)
+            self.stacks[tuple(reversed(names))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self) -> str:
+        return "\n".join(f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+
+def _requested_by_admin(scope) -> bool:
+    flagged = False
+    token = None
+    for name, value in scope.get("headers", []):
+        if name == PROFILE_HEADER:
+            flagged = value not in (b"", b"0", b"false")
+        elif name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer":
+                token = credentials
+    if not flagged:
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        flagged = query.get(PROFILE_QUERY_FLAG, ["0"])[0] not in ("", "0", "false")
+    if not flagged or not token:
+        return False
+    payload = decode_access_token(token)
+    return payload is not None and payload.get("sub") == settings.admin_email
+
+
+class ProfilerMiddleware:
+    """
+    Profiles A Request When An Authenticated Admin Asks For It (X-Profile: 1 Header
+    Or ?__profile=1) Or When It Is Picked By settings.profiler_sample_rate. The Profile
+    ID Is Returned In The X-Profile-Id Response Header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        global _active
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        if _requested_by_admin(scope):
+            trigger = "admin"
+        elif settings.profiler_sample_rate > 0 and random.random() < settings.profiler_sample_rate:
+            trigger = "sampled"
+        else:
+            return await self.app(scope, receive, send)
+
+        if _active >= settings.profiler_max_concurrent:
+            return await self.app(scope, receive, send)
+
+        profile_id = next(_profile_ids)
+        label = f"{scope['method']} {scope['path']}"
+        status = [None]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                message = {**message, "headers": [*message.get("headers", []), (b"x-profile-id", str(profile_id).encode())]}
+            await send(message)
+
+        sampler = RequestSampler(asyncio.current_task(), label)
+        _active += 1
+        started_at = datetime.utcnow()
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            await asyncio.to_thread(sampler.stop)
+            _active -= 1
+            _profiles.append({
+                "id": profile_id,
+                "request": label,
+                "status": status[0],
+                "trigger": trigger,
+                "started_at": started_at,
+                "duration_ms": round(duration_ms, 2),
+                "samples": sampler.samples,
+                "folded": sampler.folded(),
+            })
+            logger.info(f"Profiled {label} ({trigger}) As Profile {profile_id}: {duration_ms:.0f}ms, {sampler.samples} Samples")
+
+
+def list_profiles() -> List[dict]:
+    return [{k: v for k, v in profile.items() if k != "folded"} for profile in reversed(_profiles)]
+
+
+def get_profile(profile_id: int) -> Optional[dict]:
+    return next((profile for profile in _profiles if profile["id"] == profile_id), None)
@@ -0,0 +1,140 @@
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+from App.Core.Config import settings
+from App.Core.Metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+rate_limited_requests = Counter("rate_limited_requests_total", "Requests Rejected With 429 By Route", ("route",))
+
+
+class _Bucket:
+    # Two Floats Per Client; __slots__ Keeps Each Entry Small Under Crawler Traffic
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class TokenBucketLimiter:
+    """
+    Token Buckets Keyed By Client, Refilling At capacity / period Tokens Per Second.
+    At Most max_buckets Are Held; Beyond That The Least Recently Used Bucket Is
+    Dropped, Which Only Ever Gives That Client A Fresh (Full) Bucket. Buckets Are
+    Kept In Access Order, So A Client Hitting The API Steadily Is Never The One Evicted.
+    """
+
+    def __init__(self, capacity: int, period: float, max_buckets: int):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.max_buckets = max_buckets
+        self.buckets: "OrderedDict[str, _Bucket]" = OrderedDict()
+
+    def acquire(self, key: str, now: float) -> float:
+        """Take One Token. Returns 0 If Allowed, Otherwise Seconds Until A Token Is Available."""
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if len(self.buckets) >= self.max_buckets:
+                self.buckets.popitem(last=False)
+            self.buckets[key] = _Bucket(self.capacity - 1, now)
+            return 0.0
+
+        self.buckets.move_to_end(key)
+        bucket.tokens = min(self.capacity, bucket.tokens + (now - bucket.updated) * self.rate)
+        bucket.updated = now
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0.0
+        return (1 - bucket.tokens) / self.rate
+
+    def evict_idle(self, now: float, idle_seconds: float) -> int:
+        """Drop Buckets Untouched For idle_seconds (They Would Be Full Again Anyway)"""
+        evicted = 0
+        # Least Recently Used First, So Stop At The First Bucket Still In Use
+        while self.buckets:
+            bucket = next(iter(self.buckets.values()))
+            if now - bucket.updated <= idle_seconds:
+                break
+            self.buckets.popitem(last=False)
+            evicted += 1
+        return evicted
+
+
+def parse_limit(limit: str) -> Tuple[int, float]:
+    """Parse "requests/seconds", E.g. "60/60" For 60 Requests Per Minute"""
+    requests, _, seconds = limit.partition("/")
+    return int(requests), float(seconds or 1)
+
+
+class RateLimitMiddleware:
+    """
+    ASGI Middleware Applying Per-IP Token Buckets To The Routes In settings.rate_limits
+    ("METHOD /path" -> "requests/seconds"). Other Routes Pass Through Untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.limiters: Dict[Tuple[str, str], TokenBucketLimiter] = {}
+        for route, limit in settings.rate_limits.items():
+            method, _, path = route.partition(" ")
+            capacity, period = parse_limit(limit)
+            self.limiters[(method.upper(), path.rstrip("/"))] = TokenBucketLimiter(capacity, period, settings.rate_limit_max_buckets)
+        self.last_sweep = time.monotonic()
+
+    def client_ip(self, scope) -> str:
+        """
+        The Peer Address, Or Behind A Trusted Proxy The Address It Saw: X-Real-IP (Set
+        By Frontend/nginx.conf) Or The Last X-Forwarded-For Entry, The One The Proxy
+        Appended. Earlier Entries Come From The Client And Can Be Anything.
+        """
+        if settings.rate_limit_trust_forwarded:
+            forwarded = None
+            for name, value in scope.get("headers", []):
+                if name == b"x-real-ip":
+                    return value.decode("latin-1").strip()
+                if name == b"x-forwarded-for":
+                    forwarded = value.decode("latin-1").rsplit(",", 1)[-1].strip()
+            if forwarded:
+                return forwarded
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def sweep(self, now: float):
+        if now - self.last_sweep < settings.rate_limit_sweep_seconds:
+            return
+        self.last_sweep = now
+        evicted = sum(limiter.evict_idle(now, settings.rate_limit_idle_seconds) for limiter in self.limiters.values())
+        if evicted:
+            logger.debug(f"Evicted {evicted} Idle Rate Limit Bucket(s)")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        limiter = self.limiters.get((scope["method"], scope["path"].rstrip("/")))
+        if limiter is None:
+            return await self.app(scope, receive, send)
+
+        now = time.monotonic()
+        self.sweep(now)
+        retry_after = limiter.acquire(self.client_ip(scope), now)
+        if retry_after == 0:
+            return await self.app(scope, receive, send)
+
+        rate_limited_requests.inc(f"{scope['method']} {scope['path'].rstrip('/')}")
+        body = json.dumps({"detail": "Too Many Requests"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(math.ceil(retry_after)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,11 +1,37 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from App.Core.Config import settings
+from App.Core.CircuitBreaker import ServiceUnavailableError
+from App.Core.Database import db_breaker, get_database
+from App.Core.Metrics import Counter, Gauge
+
+logger = logging.getLogger(__name__)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Verified Token -> (Claims, Cache Expiry As Unix Time), Least Recently Used First
+_token_cache: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+# Revoked Token ID (jti, Or A Claims Hash For Tokens Without One) -> Token Expiry As Unix Time
+_revoked_tokens: Dict[str, float] = {}
+# Revocations Made Since This Time Are Fetched By The Next Sync (None: Full Load)
+_revocations_synced_at: Optional[datetime] = None
+_revocation_sync_task: Optional[asyncio.Task] = None
+token_cache_stats = {"hits": 0, "misses": 0}
+
+Counter("token_cache_lookups_total", "Admin Token Verifications By Cache Result", ("result",),
+        callback=lambda: {("hit",): token_cache_stats["hits"], ("miss",): token_cache_stats["misses"]})
+Gauge("token_cache_entries", "Verified Admin Tokens Held In Memory", callback=lambda: len(_token_cache))
+Gauge("revoked_tokens", "Revoked Token IDs Held In Memory", callback=lambda: len(_revoked_tokens))
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -23,14 +49,139 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
-    to_encode.update({"exp": expire})
+    # jti Identifies The Token So It Can Be Revoked Before It Expires
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 
-def decode_access_token(token: str):
+def _verify_access_token(token: str) -> Optional[dict]:
     try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-        return payload
+        return jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+
+def _revocation_id(payload: dict) -> str:
+    """The Token's jti; Tokens Issued Before jti Existed Are Identified By A Hash Of Their Claims"""
+    jti = payload.get("jti")
+    if jti is not None:
+        return jti
+    claims = json.dumps(payload, sort_keys=True, default=str).encode()
+    return "sha256:" + hashlib.sha256(claims).hexdigest()
+
+
+def is_token_revoked(payload: dict) -> bool:
+    return bool(_revoked_tokens) and _revocation_id(payload) in _revoked_tokens
+
+
+def decode_access_token(token: str):
+    """
+    Verify A Token And Return Its Claims, Or None If Invalid, Expired Or Revoked.
+    Verified Claims Are Cached (LRU, Bounded By settings.token_cache_size) Until
+    The Earlier Of The Token's exp And settings.token_cache_ttl_seconds, So Bursts
+    Of Admin Requests Skip The HMAC Check And JSON Parse.
+    """
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        payload, cache_expiry = cached
+        if now < cache_expiry:
+            _token_cache.move_to_end(token)
+            token_cache_stats["hits"] += 1
+            return None if is_token_revoked(payload) else payload
+        del _token_cache[token]
+
+    token_cache_stats["misses"] += 1
+    payload = _verify_access_token(token)
+    if payload is None or is_token_revoked(payload):
+        return None
+
+    cache_expiry = now + settings.token_cache_ttl_seconds
+    if isinstance(payload.get("exp"), (int, float)):
+        cache_expiry = min(cache_expiry, payload["exp"])
+    _token_cache[token] = (payload, cache_expiry)
+    if len(_token_cache) > settings.token_cache_size:
+        _token_cache.popitem(last=False)
+    return payload
+
+
+def clear_token_cache():
+    _token_cache.clear()
+
+
+async def revoke_token(payload: dict):
+    """
+    Revoke A Verified Token Immediately And Persist The Revocation, Which Other
+    Workers Pick Up Within settings.revocation_sync_seconds. Raises
+    ServiceUnavailableError If It Could Not Be Persisted, So Callers Don't Report
+    A Logout That Only This Process Knows About.
+    """
+    revocation_id = _revocation_id(payload)
+    expires = float(payload.get("exp", time.time() + settings.access_token_expire_minutes * 60))
+    _prune_revoked_tokens()
+    _revoked_tokens[revocation_id] = expires
+    try:
+        await get_database().revoked_tokens.update_one(
+            {"_id": revocation_id},
+            {"$set": {"expires_at": datetime.utcfromtimestamp(expires), "revoked_at": datetime.utcnow()}},
+            upsert=True
+        )
+    except Exception as e:
+        logger.warning(f"Could Not Persist Token Revocation: {e}")
+        raise ServiceUnavailableError("Could Not Persist Token Revocation") from e
+
+
+def _prune_revoked_tokens():
+    # Expired Tokens Fail Verification Anyway, So Their Revocations Can Go
+    now = time.time()
+    for jti in [jti for jti, expires in _revoked_tokens.items() if expires <= now]:
+        del _revoked_tokens[jti]
+
+
+async def load_revoked_tokens():
+    """
+    Load Unexpired Revocations So Logouts Survive Restarts. The First Load Reads
+    Them All; Later Calls (The Periodic Sync) Only Fetch Ones Made Since The Last.
+    """
+    global _revocations_synced_at
+    try:
+        collection = get_database().revoked_tokens
+        query = {"expires_at": {"$gt": datetime.utcnow()}}
+        if _revocations_synced_at is None:
+            await collection.create_index("expires_at", expireAfterSeconds=0)
+            await collection.create_index("revoked_at")
+        else:
+            # Overlap The Window To Allow For Clock Differences Between Workers
+            query["revoked_at"] = {"$gte": _revocations_synced_at - timedelta(seconds=settings.revocation_sync_seconds)}
+        synced_at = datetime.utcnow()
+        async for entry in collection.find(query):
+            _revoked_tokens[entry["_id"]] = (entry["expires_at"] - datetime(1970, 1, 1)).total_seconds()
+        _revocations_synced_at = synced_at
+    except Exception as e:
+        logger.warning(f"Could Not Load Revoked Tokens: {e}")
+    _prune_revoked_tokens()
+
+
+async def _sync_revoked_tokens():
+    while True:
+        await asyncio.sleep(settings.revocation_sync_seconds)
+        if not db_breaker.is_open:
+            await load_revoked_tokens()
+
+
+def start_revocation_sync():
+    """Poll For Revocations Made By Other Workers"""
+    global _revocation_sync_task
+    _revocation_sync_task = asyncio.create_task(_sync_revoked_tokens())
+
+
+async def stop_revocation_sync():
+    global _revocation_sync_task
+    if _revocation_sync_task is not None:
+        _revocation_sync_task.cancel()
+        try:
+            await _revocation_sync_task
+        except asyncio.CancelledError:
+            pass
+        _revocation_sync_task = None
@@ -0,0 +1,68 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+from App.Core.Metrics import Counter, Gauge
+
+T = TypeVar("T")
+
+singleflight_requests = Counter(
+    "singleflight_requests_total", "Coalesced Reads By Group; role=leader Ran The Query, role=follower Shared It", ("group", "role")
+)
+
+_groups: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """
+    Coalesces Concurrent Identical Reads: The First Caller For A Key (The Leader)
+    Starts The Query, And Every Caller Arriving While It Is In Flight Awaits The
+    Same Result Instead Of Sending Its Own. The Key Is Forgotten As Soon As The
+    Query Finishes, So Nothing Is Cached Beyond The In-Flight Window.
+
+    Results Are Shared Between Callers, So Handlers Must Treat Them As Read-Only.
+    """
+
+    def __init__(self, group: str):
+        self.group = group
+        self.leaders = 0
+        self.followers = 0
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        _groups[group] = self
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            # Own Task, So A Leader Whose Client Disconnects Doesn't Cancel The Followers' Query
+            task = asyncio.ensure_future(self._run(key, fn))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.leaders += 1
+            singleflight_requests.inc(self.group, "leader")
+        else:
+            self.followers += 1
+            singleflight_requests.inc(self.group, "follower")
+        return await asyncio.shield(task)
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        return await fn()
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark The Exception Retrieved In Case Every Caller Went Away Before It Finished
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+def _coalescing_ratios() -> dict:
+    return {
+        (name,): group.followers / (group.leaders + group.followers)
+        for name, group in _groups.items() if group.leaders
+    }
+
+
+Gauge("singleflight_coalescing_ratio", "Share Of Reads Served By Another Request's In-Flight Query", ("group",), callback=_coalescing_ratios)
+Gauge("singleflight_in_flight", "Distinct Coalesced Reads Currently Running", ("group",),
+      callback=lambda: {(name,): group.in_flight() for name, group in _groups.items()})
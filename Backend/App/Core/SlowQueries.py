@@ -0,0 +1,232 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from pymongo import monitoring
+from App.Core.Config import settings
+from App.Core.Metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+# Commands That Can Be Passed To "explain"; The Value Of The Command Name Key Is The Collection
+EXPLAINABLE_COMMANDS = {"find", "aggregate", "count", "distinct", "update", "delete", "findAndModify"}
+
+# Session And Transport Fields That explain Rejects Or Ignores
+_NON_EXPLAIN_FIELDS = {"lsid", "txnNumber", "autocommit", "startTransaction", "readConcern", "writeConcern"}
+
+# Parts Of Each Command Whose Structure (Not Values) Identifies The Query
+_SHAPE_FIELDS = {
+    "find": ("filter", "sort"),
+    "count": ("query",),
+    "distinct": ("key", "query"),
+    "findAndModify": ("query", "sort"),
+}
+
+slow_queries = Counter("mongo_slow_queries_total", "MongoDB Commands Over The Slow Query Threshold", ("collection", "command"))
+
+
+def normalize(value):
+    """Replace Literal Values With "?" While Keeping Field Names And Operators"""
+    if isinstance(value, dict):
+        return {key: normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        # Arrays Of Conditions ($and/$or) Keep Their Structure; Arrays Of Values Collapse
+        shapes = [normalize(item) for item in value]
+        return shapes if any(isinstance(item, (dict, list)) for item in shapes) else "?"
+    return "?"
+
+
+def query_shape(command_name: str, command: dict) -> dict:
+    shape = {}
+    if command_name == "aggregate":
+        shape["pipeline"] = [
+            {stage: (normalize(spec) if stage in ("$match", "$sort") else "...") for stage, spec in step.items()}
+            for step in command.get("pipeline", [])
+        ]
+    elif command_name in ("update", "delete"):
+        statements = command.get("updates" if command_name == "update" else "deletes", [])
+        shape["q"] = normalize(statements[0].get("q", {})) if statements else {}
+    else:
+        for field in _SHAPE_FIELDS.get(command_name, ()):
+            if field in command:
+                shape[field] = command[field] if field in ("sort", "key") else normalize(command[field])
+    return shape
+
+
+def _walk_plan(stage: dict, stages: List[dict]):
+    stages.append(stage)
+    for key in ("inputStage", "queryPlan", "innerStage", "outerStage"):
+        if isinstance(stage.get(key), dict):
+            _walk_plan(stage[key], stages)
+    for child in stage.get("inputStages", []):
+        _walk_plan(child, stages)
+
+
+def _find_key(document, key: str):
+    """Depth-First Search For A Key (Aggregate Explains Nest The Planner Under Stages)"""
+    if isinstance(document, dict):
+        if key in document:
+            return document[key]
+        children = document.values()
+    elif isinstance(document, list):
+        children = document
+    else:
+        return None
+    for child in children:
+        found = _find_key(child, key)
+        if found is not None:
+            return found
+    return None
+
+
+def summarize_explain(explain: dict) -> dict:
+    """Reduce An executionStats Explain To Plan Type, Index And Work Done"""
+    planner = _find_key(explain, "queryPlanner") or {}
+    stages: List[dict] = []
+    if isinstance(planner.get("winningPlan"), dict):
+        _walk_plan(planner["winningPlan"], stages)
+    stage_names = [stage.get("stage") for stage in stages]
+    indexes = [stage["indexName"] for stage in stages if stage.get("indexName")]
+
+    if "COLLSCAN" in stage_names:
+        plan = "COLLSCAN"
+    elif "IXSCAN" in stage_names or "IDHACK" in stage_names or "EXPRESS_IXSCAN" in stage_names:
+        plan = "IXSCAN"
+    else:
+        plan = stage_names[0] if stage_names else "UNKNOWN"
+
+    stats = _find_key(explain, "executionStats") or {}
+    return {
+        "plan": plan,
+        "indexes": indexes,
+        "stages": [name for name in stage_names if name],
+        "docs_examined": stats.get("totalDocsExamined"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "returned": stats.get("nReturned"),
+        "execution_ms": stats.get("executionTimeMillis"),
+        "explained_at": datetime.utcnow(),
+    }
+
+
+class SlowQueryLog(monitoring.CommandListener):
+    """
+    Records MongoDB Commands Slower Than settings.slow_query_threshold_ms, Grouped By
+    Normalized Query Shape. Listener Callbacks Run On Motor's Worker Threads, So They
+    Only Hand Slow Commands Over To The Event Loop, Where All Bookkeeping And The
+    Sampled Background explain Happen.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Tuple[int, object], dict] = {}
+        self._shapes: Dict[str, dict] = {}
+        self._explaining = set()
+        self._tasks = set()
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, client):
+        """Attach The Motor Client Used For explain And The Loop Bookkeeping Runs On"""
+        self._client = client
+        self._loop = asyncio.get_running_loop()
+
+    # Listener Callbacks (Any Thread)
+
+    def started(self, event):
+        if event.command_name in EXPLAINABLE_COMMANDS:
+            self._pending[(event.request_id, event.connection_id)] = event.command
+
+    def succeeded(self, event):
+        command = self._pending.pop((event.request_id, event.connection_id), None)
+        if command is None or self._loop is None:
+            return
+        duration_ms = event.duration_micros / 1000
+        if duration_ms >= settings.slow_query_threshold_ms:
+            self._loop.call_soon_threadsafe(self._record, event.database_name, event.command_name, command, duration_ms)
+
+    def failed(self, event):
+        self._pending.pop((event.request_id, event.connection_id), None)
+
+    # Bookkeeping (Event Loop Thread)
+
+    def _record(self, database_name: str, command_name: str, command: dict, duration_ms: float):
+        collection = command.get(command_name)
+        if not isinstance(collection, str):
+            collection = "-"
+        shape = query_shape(command_name, command)
+        key = f"{database_name}.{collection}:{command_name}:{json.dumps(shape, sort_keys=True, default=str)}"
+        slow_queries.inc(collection, command_name)
+
+        entry = self._shapes.get(key)
+        if entry is None:
+            if len(self._shapes) >= settings.slow_query_max_shapes:
+                oldest = min(self._shapes, key=lambda k: self._shapes[k]["last_seen"])
+                del self._shapes[oldest]
+            entry = self._shapes[key] = {
+                "collection": collection,
+                "command": command_name,
+                "shape": shape,
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "first_seen": datetime.utcnow(),
+                "explain": None,
+                "_explained": 0.0,
+            }
+        entry["count"] += 1
+        entry["total_ms"] += duration_ms
+        entry["max_ms"] = max(entry["max_ms"], duration_ms)
+        entry["last_seen"] = datetime.utcnow()
+        logger.warning(f"Slow Query ({duration_ms:.0f}ms) On {collection}.{command_name}: {json.dumps(shape, default=str)}")
+
+        if self._should_explain(key, entry):
+            self._explaining.add(key)
+            task = asyncio.create_task(self._explain(key, database_name, command))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _should_explain(self, key: str, entry: dict) -> bool:
+        if self._client is None or key in self._explaining:
+            return False
+        if entry["explain"] is None:
+            return True
+        if time.monotonic() - entry["_explained"] < settings.slow_query_explain_interval_seconds:
+            return False
+        return random.random() < settings.slow_query_explain_sample_rate
+
+    async def _explain(self, key: str, database_name: str, command: dict):
+        explainable = {field: value for field, value in command.items() if not field.startswith("$") and field not in _NON_EXPLAIN_FIELDS}
+        # explain Accepts A Single Write Statement
+        for statements in ("updates", "deletes"):
+            if statements in explainable:
+                explainable[statements] = explainable[statements][:1]
+        try:
+            explain = await self._client[database_name].command({"explain": explainable, "verbosity": "executionStats"})
+            entry = self._shapes.get(key)
+            if entry is not None:
+                entry["explain"] = summarize_explain(explain)
+                entry["_explained"] = time.monotonic()
+        except Exception as e:
+            logger.debug(f"Could Not Explain Slow Query {key}: {e}")
+        finally:
+            self._explaining.discard(key)
+
+    def top(self, limit: int = 10, sort_by: str = "total_ms") -> List[dict]:
+        entries = sorted(self._shapes.values(), key=lambda entry: entry[sort_by], reverse=True)[:limit]
+        return [
+            {
+                **{k: v for k, v in entry.items() if not k.startswith("_")},
+                "total_ms": round(entry["total_ms"], 2),
+                "max_ms": round(entry["max_ms"], 2),
+                "avg_ms": round(entry["total_ms"] / entry["count"], 2),
+            }
+            for entry in entries
+        ]
+
+    def reset(self):
+        self._shapes.clear()
+
+
+slow_query_log = SlowQueryLog()
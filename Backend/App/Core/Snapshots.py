@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+from bson import json_util
+from pymongo.errors import ConnectionFailure
+from App.Core.Config import settings
+from App.Core.CircuitBreaker import ServiceUnavailableError
+from App.Core.Database import db_breaker, is_outage, reads_from_primary
+from App.Core.Deadlines import is_timeout
+from App.Core.Metrics import Counter
+from App.Core.Singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Motor Returns Naive UTC Datetimes; Reload Snapshots The Same Way So Responses Don't Change Shape
+_JSON_OPTIONS = json_util.RELAXED_JSON_OPTIONS.with_options(tz_aware=False)
+
+MISSING = object()
+
+stale_reads = Counter("stale_reads_total", "Public Reads Answered From The Last-Known-Good Snapshot", ("group", "reason"))
+
+
+class SnapshotStore:
+    """
+    Last-Known-Good Results Of Public Reads, Per Group And Read Key. Results Are
+    Held In Memory As Returned By The Driver (Shared, Read-Only) And Flushed To One
+    Extended JSON File Per Group Every snapshot_flush_seconds, So A Restart During
+    An Outage Still Has Content To Serve.
+
+    Pinned Entries (The Reads The Site Itself Makes) Are Never Evicted; Everything
+    Else Shares A Per-Group LRU Of max_entries, So Arbitrary Query Strings Can't
+    Push The Canonical Results Out.
+    """
+
+    def __init__(self, directory: str, max_entries: int):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._pinned: Dict[str, Dict[str, Any]] = {}
+        self._recent: Dict[str, "OrderedDict[str, Any]"] = {}
+        self._dirty = set()
+
+    def _path(self, group: str) -> str:
+        return os.path.join(self.directory, f"{group}.json")
+
+    def get(self, group: str, key: Hashable) -> Any:
+        name = repr(key)
+        pinned = self._pinned.get(group, {})
+        if name in pinned:
+            return pinned[name]
+        return self._recent.get(group, {}).get(name, MISSING)
+
+    def put(self, group: str, key: Hashable, value: Any, pinned: bool = False):
+        name = repr(key)
+        if pinned:
+            self._pinned.setdefault(group, {})[name] = value
+        else:
+            entries = self._recent.setdefault(group, OrderedDict())
+            entries[name] = value
+            entries.move_to_end(name)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+        self._dirty.add(group)
+
+    def discard(self, group: str, key: Hashable):
+        name = repr(key)
+        for entries in (self._pinned.get(group, {}), self._recent.get(group, {})):
+            if entries.pop(name, MISSING) is not MISSING:
+                self._dirty.add(group)
+
+    def load(self):
+        if not os.path.isdir(self.directory):
+            return
+        for filename in os.listdir(self.directory):
+            group, extension = os.path.splitext(filename)
+            if extension != ".json":
+                continue
+            try:
+                with open(self._path(group), encoding="utf-8") as f:
+                    entries = json_util.loads(f.read(), json_options=_JSON_OPTIONS)
+                self._pinned[group] = dict(entries["pinned"])
+                self._recent[group] = OrderedDict(entries["recent"])
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring Unreadable Snapshot {filename}: {e}")
+        counts = [f"{group} ({len(self._pinned[group])} Pinned, {len(self._recent[group])} Recent)" for group in self._pinned]
+        logger.info(f"Loaded Snapshots: {', '.join(counts) or 'None'}")
+
+    def _write(self, pending: List[Tuple[str, dict]]):
+        os.makedirs(self.directory, exist_ok=True)
+        for group, entries in pending:
+            path = self._path(group)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(json_util.dumps(entries, json_options=_JSON_OPTIONS))
+            os.replace(path + ".tmp", path)
+
+    async def flush(self):
+        if not self._dirty:
+            return
+        # Copy The Entry Lists On The Loop; Encoding And Disk I/O Happen In A Thread
+        pending = [
+            (group, {
+                "pinned": list(self._pinned.get(group, {}).items()),
+                "recent": list(self._recent.get(group, {}).items()),
+            })
+            for group in self._dirty
+        ]
+        self._dirty.clear()
+        try:
+            await asyncio.to_thread(self._write, pending)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could Not Write Snapshots: {e}")
+
+
+snapshots = SnapshotStore(settings.snapshot_directory, settings.snapshot_max_entries)
+_flush_task: Optional[asyncio.Task] = None
+
+
+def can_serve_stale(error: BaseException) -> bool:
+    """The Database Couldn't Answer (Down, Circuit Open Or Out Of Time), As Opposed To Rejecting The Query"""
+    return isinstance(error, (ConnectionFailure, ServiceUnavailableError)) or is_timeout(error)
+
+
+def site_reads(*list_defaults) -> Callable[[Hashable], bool]:
+    """
+    Pin Predicate For Routers Keyed ("list", published_only, category, ...), ("detail", id)
+    And Single Views Like ("categories",): Every Non-Detail Read, Plus Lists Whose
+    Parameters Other Than The Category Equal list_defaults (What The Site Requests)
+    """
+    def is_site_read(key: Hashable) -> bool:
+        if key[0] == "list":
+            return (key[1], *key[3:]) == list_defaults
+        return key[0] != "detail"
+    return is_site_read
+
+
+class StaleWhileUnavailable(SingleFlight):
+    """
+    Coalesced Public Reads That Fall Back To The Last-Known-Good Result When MongoDB
+    Is Down: While The Breaker Is Open They Don't Touch The Database At All, And A
+    Query That Fails With A Connection Error Or Timeout Is Answered From The
+    Snapshot. Without A Snapshot For The Key, The Original Error Propagates.
+    Inside reading_from_primary() The Query Runs On Its Own, Uncoalesced And Unsnapshotted.
+    """
+
+    def __init__(self, group: str, pinned: Callable[[Hashable], bool] = lambda key: False):
+        super().__init__(group)
+        self.pinned = pinned
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        if reads_from_primary():
+            # An In-Flight Or Snapshotted Result May Predate The Write Being Rendered
+            return await fn()
+        try:
+            db_breaker.check()
+            return await super().do(key, fn)
+        except Exception as e:
+            if not can_serve_stale(e):
+                raise
+            value = snapshots.get(self.group, key)
+            if value is MISSING:
+                raise
+            stale_reads.inc(self.group, "circuit_open" if isinstance(e, ServiceUnavailableError) else "error")
+            return value
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        # Runs Once Per Actual Query, However Many Callers Share It
+        try:
+            value = await fn()
+        except Exception as e:
+            if is_outage(e):
+                db_breaker.record_failure(e)
+            raise
+        db_breaker.record_success()
+        if value:
+            snapshots.put(self.group, key, value, pinned=self.pinned(key))
+        else:
+            # Misses And Empty Lists (Often Probes For Unknown IDs Or Categories) Aren't Kept,
+            # And An Older Snapshot Mustn't Bring Back Content That Has Since Been Removed
+            snapshots.discard(self.group, key)
+        return value
+
+
+async def _flush_periodically():
+    while True:
+        await asyncio.sleep(settings.snapshot_flush_seconds)
+        await snapshots.flush()
+
+
+def load_snapshots():
+    snapshots.load()
+
+
+def start_snapshot_flusher():
+    global _flush_task
+    _flush_task = asyncio.create_task(_flush_periodically())
+
+
+async def stop_snapshot_flusher():
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+    await snapshots.flush()
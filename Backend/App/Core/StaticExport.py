@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+from urllib.parse import quote_plus
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+from App.Core.Config import settings
+from App.Core.Compression import compress, supported_encodings
+from App.Core.Database import db_breaker, reading_from_primary
+from App.Core.Jobs import register_job_handler
+
+logger = logging.getLogger(__name__)
+
+# The Frontend's HTTP Client (axios) Leaves These Unescaped In Query Values And Sends
+# Spaces As "+"; Category Files Are Named The Same Way So nginx Can Map ?category=
+# Straight To A File Without Decoding It
+QUERY_SAFE_CHARACTERS = "!'()*:$,[]"
+
+FILE_EXTENSIONS = {"gzip": ".gz", "br": ".br"}
+
+
+class StaticCollection(NamedTuple):
+    model: type
+    list_items: Callable[..., Awaitable[list]]  # The Public List Handler, Called With category=
+    list_categories: Callable[[], Awaitable[dict]]  # The Public /categories Handler
+    extras: Dict[str, Callable[[], Awaitable[Any]]]  # Other Single-Document Views (E.g. "featured")
+
+
+_collections: Dict[str, StaticCollection] = {}
+_documents: Dict[str, Callable[[], bytes]] = {}
+_adapters: Dict[Any, TypeAdapter] = {}
+
+# Collections (Or Documents) Waiting For An Incremental Export -> Categories Touched
+_pending: Dict[str, Set[Optional[str]]] = {}
+_pending_everything: Set[str] = set()
+_export_task: Optional[asyncio.Task] = None
+
+
+def register_static_collection(
+    name: str,
+    model: type,
+    list_items: Callable[..., Awaitable[list]],
+    list_categories: Callable[[], Awaitable[dict]],
+    extras: Optional[Dict[str, Callable[[], Awaitable[Any]]]] = None
+):
+    """Export /api/{name} (Per Category), /api/{name}/categories And Any Extra Views As Files"""
+    _collections[name] = StaticCollection(model, list_items, list_categories, extras or {})
+
+
+def register_static_document(name: str, render: Callable[[], bytes]):
+    """Export /api/{name} From A Body The Router Already Holds Encoded"""
+    _documents[name] = render
+
+
+def category_filename(category: str) -> str:
+    return quote_plus(category, safe=QUERY_SAFE_CHARACTERS) + ".json"
+
+
+def _encode(value: Any, type_: Any) -> bytes:
+    adapter = _adapters.get(type_)
+    if adapter is None:
+        adapter = _adapters[type_] = TypeAdapter(type_)
+    return adapter.dump_json(adapter.validate_python(value), by_alias=True)
+
+
+def _write_file(relative_path: str, body: bytes):
+    """Write The JSON And Its Precompressed Variants Atomically (nginx gzip_static / brotli_static)"""
+    path = os.path.join(settings.static_export_directory, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    variants = {path: body}
+    for encoding in supported_encodings():
+        encoded_path = path + FILE_EXTENSIONS[encoding]
+        if len(body) >= settings.compression_min_size:
+            variants[encoded_path] = compress(body, encoding, level=11 if encoding == "br" else 9)
+        elif os.path.exists(encoded_path):
+            os.remove(encoded_path)
+    for target, data in variants.items():
+        with open(target + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(target + ".tmp", target)
+
+
+def _remove_file(relative_path: str):
+    path = os.path.join(settings.static_export_directory, relative_path)
+    for target in (path, *(path + extension for extension in FILE_EXTENSIONS.values())):
+        if os.path.exists(target):
+            os.remove(target)
+
+
+def _remove_other_categories(name: str, keep: Set[str]) -> int:
+    directory = os.path.join(settings.static_export_directory, "api", name, "category")
+    if not os.path.isdir(directory):
+        return 0
+    removed = 0
+    for filename in os.listdir(directory):
+        if filename.endswith(".json") and filename not in keep:
+            _remove_file(os.path.join("api", name, "category", filename))
+            removed += 1
+    return removed
+
+
+async def export_document(name: str) -> int:
+    await asyncio.to_thread(_write_file, os.path.join("api", f"{name}.json"), _documents[name]())
+    return 1
+
+
+async def export_collection(name: str, categories: Iterable[Optional[str]] = (), everything: bool = False) -> int:
+    """
+    Regenerate The Unfiltered List, The Categories, The Extra Views And The Lists Of
+    The Given Categories (Or Of Every Category). Returns The Number Of Files Written.
+    Reads Go Through The Public Handlers, But From The Primary So A Just-Made Write Is Seen.
+    """
+    with reading_from_primary():
+        return await _export_collection(name, categories, everything)
+
+
+async def _export_collection(name: str, categories: Iterable[Optional[str]], everything: bool) -> int:
+    collection = _collections[name]
+    directory = os.path.join("api", name)
+    written = 0
+
+    result = await collection.list_categories()
+    current = {category for category in result["categories"] if category}
+    await asyncio.to_thread(_write_file, os.path.join(directory, "categories.json"), _encode(result, dict))
+    written += 1
+
+    targets = current if everything else {category for category in categories if category}
+    for category in [None, *sorted(targets)]:
+        items = await collection.list_items(category=category)
+        if category is None:
+            path = os.path.join(directory, "index.json")
+        else:
+            path = os.path.join(directory, "category", category_filename(category))
+            if not items:
+                # Nothing Left In It; The Backend Answers The Empty List Itself
+                await asyncio.to_thread(_remove_file, path)
+                continue
+        await asyncio.to_thread(_write_file, path, _encode(items, List[collection.model]))
+        written += 1
+
+    for extra, read in collection.extras.items():
+        path = os.path.join(directory, f"{extra}.json")
+        try:
+            value = await read()
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise
+            await asyncio.to_thread(_remove_file, path)
+            continue
+        await asyncio.to_thread(_write_file, path, _encode(value, collection.model))
+        written += 1
+
+    if everything:
+        await asyncio.to_thread(_remove_other_categories, name, {category_filename(category) for category in current})
+    return written
+
+
+async def export_all(on_progress: Optional[Callable[[int, Optional[int]], None]] = None) -> dict:
+    """Render Every Public GET Response The Frontend Requests Into settings.static_export_directory"""
+    db_breaker.check()
+    steps = [*((name, True) for name in _documents), *((name, False) for name in _collections)]
+    written = 0
+    for done, (name, is_document) in enumerate(steps):
+        written += await export_document(name) if is_document else await export_collection(name, everything=True)
+        if on_progress:
+            on_progress(done + 1, len(steps))
+    logger.info(f"Static Export Wrote {written} File(s) To {settings.static_export_directory}")
+    return {"files": written, "directory": os.path.abspath(settings.static_export_directory)}
+
+
+async def _run_export_job(job: dict, on_progress) -> dict:
+    return await export_all(on_progress)
+
+
+register_job_handler("static_export", _run_export_job)
+
+
+async def _export_pending():
+    while _pending:
+        await asyncio.sleep(settings.static_export_debounce_seconds)
+        pending, everything = dict(_pending), set(_pending_everything)
+        _pending.clear()
+        _pending_everything.clear()
+        for name, categories in pending.items():
+            try:
+                if name in _documents:
+                    await export_document(name)
+                else:
+                    await export_collection(name, categories, everything=name in everything)
+            except Exception as e:
+                logger.warning(f"Static Export Of {name} Failed, Run A Full Export Once Resolved: {e}")
+
+
+def schedule_export(name: str, *categories: Optional[str], everything: bool = False):
+    """
+    Queue The Files A Write Affected For Regeneration. Exports Run Once Writes Have
+    Settled For static_export_debounce_seconds, So A Burst Of Edits Is Rendered Once.
+    """
+    global _export_task
+    if not settings.static_export_enabled:
+        return
+    _pending.setdefault(name, set()).update(categories)
+    if everything:
+        _pending_everything.add(name)
+    if _export_task is None or _export_task.done():
+        _export_task = asyncio.create_task(_export_pending())
+
+
+async def stop_static_export():
+    """Cancel A Pending Incremental Export; The Next Full Export Picks Up Its Changes"""
+    global _export_task
+    if _export_task is not None and not _export_task.done():
+        _export_task.cancel()
+        try:
+            await _export_task
+        except asyncio.CancelledError:
+            pass
+    _export_task = None
@@ -0,0 +1,251 @@
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Optional
+import cloudinary.exceptions
+import cloudinary.utils
+from App.Core.CloudinaryUtil import cloudinary
+from App.Core.Config import settings
+from App.Core.Streaming import ProgressCallback, SpooledUpload
+
+logger = logging.getLogger(__name__)
+
+# Cloudinary Errors That Will Not Succeed On Retry
+NON_RETRYABLE_ERRORS = (
+    cloudinary.exceptions.BadRequest,
+    cloudinary.exceptions.AuthorizationRequired,
+    cloudinary.exceptions.NotAllowed,
+    cloudinary.exceptions.NotFound,
+    cloudinary.exceptions.AlreadyExists,
+)
+
+_executor: ThreadPoolExecutor = None
+_storage = None
+
+
+class MediaUploadError(Exception):
+    """Raised When An Upload Fails After All Retries"""
+
+
+def get_upload_executor() -> ThreadPoolExecutor:
+    """Get The Shared Upload Executor, Creating It On First Use"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.upload_max_workers,
+            thread_name_prefix="media-upload"
+        )
+    return _executor
+
+
+def shutdown_upload_executor():
+    """Shut Down The Upload Executor Without Waiting For Queued Uploads"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def _run_with_retries(call, folder: str, rewind=None) -> dict:
+    """
+    Run A Blocking Cloudinary Call In The Upload Executor With Retries. The Call
+    Carries Its Own SDK timeout, So Each Attempt Has Finished (Or Failed) In Its
+    Thread Before The Next One Starts; Timing Out Only The Await Would Leave The
+    Upload Running And Let A Retry Create A Duplicate Asset.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_upload_executor()
+    attempts = settings.upload_max_retries + 1
+
+    for attempt in range(1, attempts + 1):
+        if rewind:
+            rewind()
+        try:
+            return await loop.run_in_executor(executor, call)
+        except NON_RETRYABLE_ERRORS as e:
+            logger.error(f"Upload To {folder} Rejected: {e}")
+            raise MediaUploadError(str(e)) from e
+        except (cloudinary.exceptions.Error, OSError) as e:
+            logger.warning(f"Upload To {folder} Failed (Attempt {attempt}/{attempts}): {e!r}")
+            if attempt == attempts:
+                raise MediaUploadError(f"Upload Failed After {attempts} Attempts") from e
+            await asyncio.sleep(settings.upload_retry_backoff_seconds * 2 ** (attempt - 1))
+
+
+class StorageBackend(ABC):
+    """Interface For Media Storage. save() Stores A Spooled File And Returns Its Public URL."""
+
+    name = "base"
+
+    @abstractmethod
+    async def save(
+        self,
+        spooled: SpooledUpload,
+        folder: str,
+        resource_type: str,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> str:
+        """Store The File Under folder And Return The URL It Is Served From"""
+
+
+class CloudinaryStorage(StorageBackend):
+    """Stores Media On Cloudinary; Videos Go Through The Chunked Upload API"""
+
+    name = "cloudinary"
+
+    async def save(self, spooled, folder, resource_type, on_progress=None) -> str:
+        if resource_type == "video":
+            result = await self.upload_large(
+                spooled.path,
+                folder=folder,
+                resource_type=resource_type,
+                filename=spooled.filename,
+                on_progress=on_progress
+            )
+        else:
+            result = await self.upload(spooled.path, folder=folder, resource_type=resource_type)
+            if on_progress:
+                on_progress(spooled.size, spooled.size)
+        return result.get("secure_url")
+
+    async def upload(self, file, folder: str, resource_type: str = "image") -> dict:
+        """
+        Uploads A File To Cloudinary Off The Event Loop And Returns The Upload Result.
+        file : Bytes, A File Path Or A File-Like Object
+        folder : Cloudinary Folder To Store The File
+        resource_type : "image" Or "video"
+        """
+        call = partial(
+            cloudinary.uploader.upload,
+            file,
+            folder=folder,
+            resource_type=resource_type,
+            timeout=settings.upload_timeout_seconds
+        )
+        rewind = (lambda: file.seek(0)) if hasattr(file, "seek") else None
+        return await _run_with_retries(call, folder, rewind)
+
+    async def upload_large(
+        self,
+        path: str,
+        folder: str,
+        resource_type: str = "video",
+        filename: str = "upload",
+        on_progress: Optional[ProgressCallback] = None
+    ) -> dict:
+        """
+        Uploads A Spooled File Through Cloudinary's Chunked Upload API.
+        Only One Chunk (settings.upload_chunk_size) Is Held In Memory At A Time
+        And A Failed Chunk Is Retried On Its Own Instead Of Restarting The Upload.
+        """
+        loop = asyncio.get_running_loop()
+        executor = get_upload_executor()
+        total = os.path.getsize(path)
+        upload_id = cloudinary.utils.random_public_id()
+        options = {
+            "folder": folder,
+            "resource_type": resource_type,
+            "timeout": settings.upload_timeout_seconds
+        }
+        offset = 0
+        result = None
+
+        with open(path, "rb") as source:
+            while offset < total:
+                chunk = await loop.run_in_executor(executor, source.read, settings.upload_chunk_size)
+                if not chunk:
+                    break
+                headers = {
+                    "Content-Range": f"bytes {offset}-{offset + len(chunk) - 1}/{total}",
+                    "X-Unique-Upload-Id": upload_id
+                }
+                call = partial(
+                    cloudinary.uploader.upload_large_part,
+                    (filename, chunk),
+                    http_headers=headers,
+                    **options
+                )
+                result = await _run_with_retries(call, folder)
+                options["public_id"] = result.get("public_id")
+                offset += len(chunk)
+                if on_progress:
+                    on_progress(offset, total)
+
+        if result is None:
+            raise MediaUploadError("Cannot Upload An Empty File")
+        return result
+
+
+class LocalStorage(StorageBackend):
+    """
+    Stores Media On The Local Filesystem Under settings.media_root.
+    Files Are Content-Addressed And Sharded By Hash Prefix
+    (folder/ab/cd/abcd....ext) So No Directory Grows Unbounded,
+    And Every Write Lands Atomically Through A Temp File And os.replace.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str, url_prefix: str):
+        self.root = Path(root).resolve()
+        self.url_prefix = url_prefix.rstrip("/")
+
+    def relative_path(self, spooled: SpooledUpload, folder: str) -> str:
+        digest = spooled.sha256
+        ext = Path(spooled.filename).suffix.lower()
+        return f"{folder.strip('/')}/{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+    def resolve(self, relative_path: str) -> Path:
+        """Map A Relative Media Path To Disk, Refusing Anything Outside The Root"""
+        path = (self.root / relative_path).resolve()
+        if not path.is_relative_to(self.root):
+            raise ValueError("Path Escapes Media Root")
+        return path
+
+    def _write(self, source: str, target: Path):
+        if target.exists():
+            return  # Same Hash, Same Content
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".incoming-", dir=target.parent)
+        try:
+            with os.fdopen(fd, "wb") as out_file, open(source, "rb") as in_file:
+                # copyfileobj Streams In Fixed-Size Chunks (sendfile On Linux Where Possible)
+                shutil.copyfileobj(in_file, out_file, settings.upload_read_chunk_size)
+                out_file.flush()
+                os.fsync(out_file.fileno())
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    async def save(self, spooled, folder, resource_type, on_progress=None) -> str:
+        relative_path = self.relative_path(spooled, folder)
+        target = self.resolve(relative_path)
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(get_upload_executor(), self._write, spooled.path, target)
+        except OSError as e:
+            raise MediaUploadError(f"Could Not Store {spooled.filename}: {e}") from e
+        if on_progress:
+            on_progress(spooled.size, spooled.size)
+        return f"{settings.backend_url.rstrip('/')}{self.url_prefix}/{relative_path}"
+
+
+def get_storage() -> StorageBackend:
+    """Get The Storage Backend Selected By settings.storage_backend"""
+    global _storage
+    if _storage is None:
+        if settings.storage_backend == "local":
+            _storage = LocalStorage(settings.media_root, settings.media_url_prefix)
+        elif settings.storage_backend == "cloudinary":
+            _storage = CloudinaryStorage()
+        else:
+            raise ValueError(f"Unknown Storage Backend: {settings.storage_backend}")
+    return _storage
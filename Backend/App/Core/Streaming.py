@@ -0,0 +1,99 @@
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+import aiofiles
+from fastapi import UploadFile
+from App.Core.Config import settings
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class UploadTooLargeError(Exception):
+    """Raised While Streaming When An Upload Exceeds Its Size Limit"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        super().__init__(f"File Too Large. Max Size: {max_size} Bytes")
+
+
+class SpooledUpload:
+    """An Upload Streamed To A Temporary File On Disk"""
+
+    def __init__(self, path: str, size: int, sha256: str, filename: str, content_type: Optional[str]):
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+        self.filename = filename
+        self.content_type = content_type
+
+    def cleanup(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cleanup()
+
+
+def log_progress(label: str, step_percent: int = 10) -> ProgressCallback:
+    """Build A Progress Callback That Logs Every step_percent Percent"""
+    state = {"next": step_percent}
+
+    def report(done: int, total: Optional[int]):
+        if not total:
+            return
+        percent = done * 100 // total
+        if percent >= state["next"] or done == total:
+            logger.info(f"{label}: {percent}% ({done}/{total} Bytes)")
+            state["next"] = (percent // step_percent + 1) * step_percent
+
+    return report
+
+
+async def spool_upload(
+    file: UploadFile,
+    max_size: int,
+    on_progress: Optional[ProgressCallback] = None,
+    directory: Optional[str] = None
+) -> SpooledUpload:
+    """
+    Streams An UploadFile To A Temporary File In Fixed-Size Chunks.
+    Memory Use Is Bounded By settings.upload_read_chunk_size And The Size Limit
+    Is Enforced While Streaming, So Oversized Files Are Rejected Early.
+    The SHA-256 Of The Content Is Computed On The Same Pass.
+    directory Overrides settings.upload_temp_directory (E.g. For Files That Must Survive A Restart).
+    """
+    suffix = Path(file.filename or "").suffix.lower()
+    directory = directory or settings.upload_temp_directory
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix="upload-", suffix=suffix, dir=directory)
+    os.close(fd)
+
+    total = file.size
+    size = 0
+    digest = hashlib.sha256()
+    try:
+        async with aiofiles.open(path, "wb") as out_file:
+            while chunk := await file.read(settings.upload_read_chunk_size):
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(max_size)
+                digest.update(chunk)
+                await out_file.write(chunk)
+                if on_progress:
+                    on_progress(size, total)
+    except BaseException:
+        os.remove(path)
+        raise
+
+    return SpooledUpload(path, size, digest.hexdigest(), file.filename or "upload", file.content_type)
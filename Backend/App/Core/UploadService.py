@@ -0,0 +1,57 @@
+import logging
+from typing import Optional
+from fastapi import UploadFile
+from App.Core.Config import settings
+from App.Core.MediaDedup import find_duplicate, remember_upload
+from App.Core.MediaMetadata import probe_video_file
+from App.Core.Metrics import Counter
+from App.Core.Storage import get_storage
+from App.Core.Streaming import ProgressCallback, SpooledUpload, log_progress, spool_upload
+
+logger = logging.getLogger(__name__)
+
+media_uploads = Counter("media_uploads_total", "Media Uploads By Backend, Type And Outcome", ("backend", "resource_type", "result"))
+
+
+async def upload_spooled(
+    spooled: SpooledUpload,
+    folder: str,
+    resource_type: str,
+    on_progress: Optional[ProgressCallback] = None
+) -> str:
+    """
+    Stores A Spooled File Through The Configured Storage Backend And Returns Its URL.
+    Content That Was Uploaded Before (Same SHA-256) Returns The Existing URL
+    Without Any Network Transfer.
+    """
+    storage = get_storage()
+    existing_url = await find_duplicate(spooled.sha256, resource_type, storage.name)
+    if existing_url:
+        logger.info(f"Skipping Duplicate Upload Of {spooled.filename} ({spooled.sha256[:12]})")
+        if on_progress:
+            on_progress(spooled.size, spooled.size)
+        media_uploads.inc(storage.name, resource_type, "deduplicated")
+        return existing_url
+
+    url = await storage.save(spooled, folder, resource_type, on_progress)
+    await remember_upload(spooled.sha256, resource_type, storage.name, url, folder, spooled.size)
+    media_uploads.inc(storage.name, resource_type, "stored")
+    return url
+
+
+async def upload_image(file: UploadFile, folder: str = "profile_images") -> str:
+    """Streams An Image Upload To Disk, Then Stores It And Returns The URL"""
+    with await spool_upload(file, settings.max_image_upload_size) as spooled:
+        return await upload_spooled(spooled, folder, "image")
+
+
+async def upload_video(file: UploadFile, folder: str) -> dict:
+    """
+    Streams A Video Upload To Disk, Then Stores It.
+    Returns The URL As video_url Plus Container Metadata (duration, width, height, orientation).
+    """
+    label = f"Upload {file.filename} To {folder}"
+    with await spool_upload(file, settings.max_video_upload_size, log_progress(f"{label} (Receiving)")) as spooled:
+        metadata = await probe_video_file(spooled.path)
+        url = await upload_spooled(spooled, folder, "video", log_progress(f"{label} (Sending)"))
+    return {"video_url": url, **metadata}
@@ -0,0 +1,36 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from App.Core.Config import settings
+
+_process_pool: ProcessPoolExecutor = None
+
+# Children Must Not Be Forked From This Process: By The Time The Pool Starts, Motor,
+# Upload And Watchdog Threads Are Running, And A Child Could Inherit One Of Their
+# Locks (Logging's, Say) Held Forever. A Fork Server Forks From A Clean Process.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get The Shared Media Process Pool, Creating It On First Use"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.image_process_workers,
+            mp_context=multiprocessing.get_context(_START_METHOD)
+        )
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """Shut Down The Media Process Pool"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+async def run_in_process(func, *args):
+    """Run A CPU-Bound Function In The Process Pool Without Blocking The Event Loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), func, *args)
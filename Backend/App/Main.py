@@ -1,36 +1,82 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from App.Core.Config import settings
-from App.Core.Database import connect_to_mongo, close_mongo_connection
-from App.Api import Auth as auth, Profile as profile, Photos as photos, Videos as videos, Edits as edits, Contact as contact, Analytics as analytics
+from App.Core.Database import connect_to_mongo, close_mongo_connection, db_breaker, start_database_probe, stop_database_probe
+from App.Core.CircuitBreaker import ServiceUnavailableError
+from App.Core.Snapshots import load_snapshots, start_snapshot_flusher, stop_snapshot_flusher
+from App.Core.StaticExport import stop_static_export
+from App.Core.Storage import MediaUploadError, shutdown_upload_executor
+from App.Core.Streaming import UploadTooLargeError
+from App.Core.ImageProcessing import InvalidImageError
+from App.Core.Workers import shutdown_process_pool
+from App.Core.Jobs import recover_jobs, start_job_workers, stop_job_workers
+from App.Core.Security import load_revoked_tokens, start_revocation_sync, stop_revocation_sync
+from App.Core.RateLimit import RateLimitMiddleware
+from App.Core.Compression import CompressionMiddleware
+from App.Core.Metrics import MetricsMiddleware, mongo_pool_stats
+from App.Core.Profiler import ProfilerMiddleware
+from App.Core.Deadlines import DeadlineMiddleware
+from App.Core.LoopMonitor import StrictLoopMiddleware, start_loop_monitor, stop_loop_monitor
+from App.Core.Notifications import start_notification_worker, stop_notification_worker
+import App.Core.MediaJobs  # Registers The Upload Job Handlers
+from App.Api.Contact import load_inbox_counts
+from App.Api.Profile import load_profile_cache
+from App.Api import Auth as auth, Profile as profile, Photos as photos, Videos as videos, Edits as edits, Contact as contact, Analytics as analytics, Upload as upload, Media as media, Jobs as jobs, Metrics as metrics, Diagnostics as diagnostics
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+async def load_caches():
+    """Reload State Built From MongoDB (Caches, Unfinished Jobs); Rerun Whenever It Comes Back"""
+    await load_revoked_tokens()
+    await load_inbox_counts()
+    await load_profile_cache()
+    await recover_jobs()
+
+
 # Lifespan Context Manager (Replaces Deprecated on_event)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Up Pranjal Portfolio API...")
+    load_snapshots()
     try:
         await connect_to_mongo()
         logger.info("Successfully Connected To MongoDB")
     except Exception as e:
         logger.error(f"Failed To Connect To MongoDB: {e}")
         raise
+    await load_caches()
+    start_database_probe(on_reconnect=load_caches)
+    start_snapshot_flusher()
+    start_revocation_sync()
+    await start_job_workers()
+    start_notification_worker()
+    await start_loop_monitor()
     
     yield
     
     # Shutdown
     logger.info("Shutting Down Pranjal Portfolio API...")
+    await stop_loop_monitor()
+    await stop_job_workers()
+    await stop_notification_worker()
+    await stop_database_probe()
+    await stop_snapshot_flusher()
+    await stop_revocation_sync()
+    await stop_static_export()
     try:
         await close_mongo_connection()
         logger.info("Successfully Closed MongoDB Connection")
     except Exception as e:
         logger.error(f"Error Closing MongoDB Connection: {e}")
+    shutdown_upload_executor()
+    shutdown_process_pool()
 
 app = FastAPI(
     title="Pranjal Portfolio API",
@@ -39,6 +85,16 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Per-Route-Group Time Budgets (Innermost, So Their 503/504s Pass Through CORS And Metrics)
+app.add_middleware(DeadlineMiddleware)
+
+# Strict Mode Turns Event Loop Stalls Into Request Failures (Development And Tests Only)
+if settings.loop_block_strict:
+    app.add_middleware(StrictLoopMiddleware)
+
+# Per-IP Token Buckets For Public Write Endpoints (Added First So CORS Wraps The 429s)
+app.add_middleware(RateLimitMiddleware)
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -48,6 +104,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compression Runs Outside The Other Middleware So It Sees The Final Headers
+app.add_middleware(CompressionMiddleware)
+
+# Request Timing Wraps Everything, Including Compression
+app.add_middleware(MetricsMiddleware)
+
+# On-Demand Sampling Profiler (Outermost So Profiles Cover The Whole Stack)
+app.add_middleware(ProfilerMiddleware)
+
+# Upload Failures Surface As Bad Gateway Instead Of A Generic 500
+@app.exception_handler(MediaUploadError)
+async def media_upload_error_handler(request: Request, exc: MediaUploadError):
+    return JSONResponse(status_code=502, content={"detail": f"Media Upload Failed: {exc}"})
+
+
+@app.exception_handler(UploadTooLargeError)
+async def upload_too_large_handler(request: Request, exc: UploadTooLargeError):
+    return JSONResponse(status_code=413, content={"detail": str(exc)})
+
+
+# MongoDB Down Or Its Circuit Open: Tell Clients To Come Back Rather Than A Generic 500
+@app.exception_handler(ServiceUnavailableError)
+async def service_unavailable_handler(request: Request, exc: ServiceUnavailableError):
+    retry_after = str(max(1, round(settings.db_probe_interval_seconds)))
+    return JSONResponse(status_code=503, content={"detail": "Service Temporarily Unavailable"}, headers={"Retry-After": retry_after})
+
+
+@app.exception_handler(InvalidImageError)
+async def invalid_image_handler(request: Request, exc: InvalidImageError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
 # Health Check
 @app.get("/")
 async def root():
@@ -60,7 +148,19 @@ async def root():
 
 @app.get("/api/health")
 async def health():
-    return {"status": "healthy"}
+    """Public Liveness; Error Text And Server Addresses Are At /api/diagnostics/database"""
+    database = db_breaker.snapshot()
+    servers = mongo_pool_stats.snapshot().values()
+    return {
+        "status": "healthy",
+        "database": {"state": database["state"], "consecutive_failures": database["consecutive_failures"]},
+        "mongo_pool": {
+            "max_size": settings.mongo_max_pool_size,
+            "min_size": settings.mongo_min_pool_size,
+            "servers": len(servers),
+            **{field: sum(pool[field] for pool in servers) for field in ("open", "in_use", "waiting")},
+        },
+    }
 
 
 # Include Routers
@@ -70,5 +170,9 @@ app.include_router(photos.router, prefix="/api/photos", tags=["Photography"])
 app.include_router(videos.router, prefix="/api/videos", tags=["Videography"])
 app.include_router(edits.router, prefix="/api/edits", tags=["Video Editing"])
 app.include_router(contact.router, prefix="/api/contact", tags=["Contact"])
-# Upload Router Removed - All Media Now Handled Via Google Drive
-app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
\ No newline at end of file
+app.include_router(upload.router, prefix="/api/upload", tags=["Upload"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["Jobs"])
+app.include_router(metrics.router, prefix="/api/metrics", tags=["Metrics"])
+app.include_router(diagnostics.router, prefix="/api/diagnostics", tags=["Diagnostics"])
+app.include_router(media.router, prefix=settings.media_url_prefix, tags=["Media"])
\ No newline at end of file
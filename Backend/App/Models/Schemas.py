@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, EmailStr, field_serializer, field_validator
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from bson import ObjectId
 
@@ -65,12 +65,29 @@ class Profile(ProfileBase):
 
 
 # Photo Project Models
+class ImageVariant(BaseModel):
+    url: str
+    width: int
+    height: int
+    format: str  # webp, jpeg
+
+
 class PhotoProjectBase(BaseModel):
     title: str
     description: str
     category: str
     image_url: str  # Cloudinary URL
     thumbnail_url: Optional[str] = None  # Cloudinary URL
+    variants: List[ImageVariant] = []  # Resized Renditions Of image_url
+    srcset: Dict[str, str] = {}  # Format -> srcset String
+    width: Optional[int] = None
+    height: Optional[int] = None
+    dominant_color: Optional[str] = None  # "#rrggbb"
+    placeholder: Optional[str] = None  # Base64 Data URI Low-Quality Preview
+    orientation: Optional[str] = None  # landscape, portrait, square
+    captured_at: Optional[datetime] = None  # From EXIF
+    camera: Optional[str] = None  # From EXIF
+    lens: Optional[str] = None  # From EXIF
     tags: List[str] = []
     published: bool = True
     order: int = 0
@@ -86,6 +103,16 @@ class PhotoProjectUpdate(BaseModel):
     category: Optional[str] = None
     image_url: Optional[str] = None
     thumbnail_url: Optional[str] = None
+    variants: Optional[List[ImageVariant]] = None
+    srcset: Optional[Dict[str, str]] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    dominant_color: Optional[str] = None
+    placeholder: Optional[str] = None
+    orientation: Optional[str] = None
+    captured_at: Optional[datetime] = None
+    camera: Optional[str] = None
+    lens: Optional[str] = None
     tags: Optional[List[str]] = None
     published: Optional[bool] = None
     order: Optional[int] = None
@@ -116,6 +143,10 @@ class VideoProjectBase(BaseModel):
     video_url: str  # Cloudinary URL, YouTube, Vimeo
     thumbnail_url: Optional[str] = None  # Cloudinary URL
     category: Optional[str] = None
+    duration: Optional[float] = None  # Seconds, From The Container
+    width: Optional[int] = None
+    height: Optional[int] = None
+    orientation: Optional[str] = None  # landscape, portrait, square
     tags: List[str] = []
     published: bool = True
     order: int = 0
@@ -132,6 +163,10 @@ class VideoProjectUpdate(BaseModel):
     video_url: Optional[str] = None
     thumbnail_url: Optional[str] = None
     category: Optional[str] = None
+    duration: Optional[float] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    orientation: Optional[str] = None
     tags: Optional[List[str]] = None
     published: Optional[bool] = None
     order: Optional[int] = None
@@ -232,6 +267,10 @@ class ContactMessage(ContactMessageBase):
         arbitrary_types_allowed = True
 
 
+class ContactMessageIds(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=500)
+
+
 # Auth Models
 class UserLogin(BaseModel):
     email: EmailStr
@@ -0,0 +1,65 @@
+"""
+Backfill Dimensions, Dominant Color And Placeholder For Existing Photos.
+Run From The Backend Directory: python Backfill_Photos.py [--force]
+"""
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import urllib.request
+from datetime import datetime
+from App.Core.Config import settings
+from App.Core.Database import connect_to_mongo, close_mongo_connection, get_database
+from App.Core.ImageProcessing import describe_image
+from App.Core.Workers import run_in_process, shutdown_process_pool
+
+
+def download(url: str, path: str):
+    with urllib.request.urlopen(url, timeout=settings.upload_timeout_seconds) as response, open(path, "wb") as out_file:
+        shutil.copyfileobj(response, out_file)
+
+
+async def backfill_photo(photo: dict, work_dir: str) -> bool:
+    path = os.path.join(work_dir, str(photo["_id"]))
+    try:
+        await asyncio.to_thread(download, photo["image_url"], path)
+        metadata = await run_in_process(describe_image, path, settings.image_placeholder_size)
+    except Exception as e:
+        print(f"Skipping {photo['_id']} ({photo.get('title', '')}): {e}")
+        return False
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+    metadata["updated_at"] = datetime.utcnow()
+    await get_database().photo_projects.update_one({"_id": photo["_id"]}, {"$set": metadata})
+    print(f"Updated {photo['_id']} ({photo.get('title', '')}): {metadata['width']}x{metadata['height']}")
+    return True
+
+
+async def backfill(force: bool = False):
+    await connect_to_mongo()
+    db = get_database()
+    query = {} if force else {"placeholder": None}
+    photos = await db.photo_projects.find(query, {"image_url": 1, "title": 1}).to_list(length=None)
+    print(f"Backfilling {len(photos)} Photo(s)...")
+
+    work_dir = tempfile.mkdtemp(prefix="backfill-", dir=settings.upload_temp_directory)
+    semaphore = asyncio.Semaphore(settings.image_process_workers * 2)
+
+    async def run(photo):
+        async with semaphore:
+            return await backfill_photo(photo, work_dir)
+
+    try:
+        results = await asyncio.gather(*(run(photo) for photo in photos))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        shutdown_process_pool()
+        await close_mongo_connection()
+    print(f"Done: {sum(results)} Updated, {len(results) - sum(results)} Skipped.")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill(force="--force" in sys.argv))
@@ -0,0 +1,86 @@
+"""
+Micro-Benchmark: Bytes Saved And CPU Cost Of Compressing Typical API Payloads.
+Run From The Backend Directory: python -m Benchmarks.Bench_Compression
+"""
+import json
+import random
+import timeit
+from datetime import datetime
+from App.Core.Compression import brotli, compress
+
+ITERATIONS = 200
+
+
+def photo(index: int) -> dict:
+    base = f"https://res.cloudinary.com/demo/image/upload/photo_images/{random.getrandbits(64):016x}"
+    variants = [
+        {"url": f"{base}_{width}.{fmt}", "width": width, "height": width * 2 // 3, "format": fmt}
+        for fmt in ("webp", "jpeg") for width in (480, 960, 1600, 2400)
+    ]
+    return {
+        "_id": f"{random.getrandbits(96):024x}",
+        "title": f"Golden Hour Portrait {index}",
+        "description": "Natural Light Portrait Session Shot On Location During Golden Hour.",
+        "category": random.choice(["Portrait", "Wedding", "Street", "Landscape"]),
+        "image_url": f"{base}.jpg",
+        "thumbnail_url": f"{base}_thumb.webp",
+        "variants": variants,
+        "srcset": {fmt: ", ".join(f"{v['url']} {v['width']}w" for v in variants if v["format"] == fmt) for fmt in ("webp", "jpeg")},
+        "width": 6000,
+        "height": 4000,
+        "dominant_color": f"#{random.getrandbits(24):06x}",
+        "placeholder": "data:image/webp;base64," + "".join(random.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/", k=120)),
+        "orientation": "landscape",
+        "camera": "Sony ILCE-7M4",
+        "lens": "FE 85mm F1.8",
+        "captured_at": datetime(2024, 5, 1, 18, 30).isoformat(),
+        "featured": index < 6,
+        "published": True,
+        "order": index,
+        "created_at": datetime(2024, 5, 2).isoformat(),
+        "updated_at": datetime(2024, 5, 2).isoformat(),
+    }
+
+
+def video(index: int) -> dict:
+    return {
+        "_id": f"{random.getrandbits(96):024x}",
+        "title": f"Brand Film {index}",
+        "description": "Short-Form Commercial Cut For Social Media With Color Grade And Sound Design.",
+        "category": "Commercial",
+        "video_url": f"https://res.cloudinary.com/demo/video/upload/video_files/{random.getrandbits(64):016x}.mp4",
+        "thumbnail_url": f"https://res.cloudinary.com/demo/image/upload/video_thumbnails/{random.getrandbits(64):016x}.jpg",
+        "duration": 62.5,
+        "width": 1920,
+        "height": 1080,
+        "orientation": "landscape",
+        "published": True,
+        "order": index,
+        "created_at": datetime(2024, 5, 2).isoformat(),
+    }
+
+
+def main():
+    random.seed(1)
+    payloads = {
+        "Photo List (50)": [photo(i) for i in range(50)],
+        "Photo List (10)": [photo(i) for i in range(10)],
+        "Video List (20)": [video(i) for i in range(20)],
+        "Single Photo": photo(0),
+    }
+    codecs = [("gzip", 1), ("gzip", 6), ("gzip", 9)]
+    if brotli is not None:
+        codecs += [("br", 4), ("br", 11)]
+
+    print(f"{'Payload':<18}{'Codec':<9}{'Raw':>9}{'Encoded':>9}{'Saved':>8}{'CPU/Resp':>11}")
+    for name, payload in payloads.items():
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        for encoding, level in codecs:
+            encoded = compress(body, encoding, level)
+            seconds = timeit.timeit(lambda: compress(body, encoding, level), number=ITERATIONS) / ITERATIONS
+            saved = 1 - len(encoded) / len(body)
+            print(f"{name:<18}{encoding + '-' + str(level):<9}{len(body):>9}{len(encoded):>9}{saved:>8.1%}{seconds * 1e6:>9.0f}us")
+
+
+if __name__ == "__main__":
+    main()
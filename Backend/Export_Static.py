@@ -0,0 +1,30 @@
+"""
+Render The Public API (Profile, Lists Per Category, Categories, Featured) To
+Precompressed Static JSON Files For nginx.
+Run From The Backend Directory: python Export_Static.py [--output DIRECTORY]
+"""
+import asyncio
+import sys
+from App.Core.Config import settings
+from App.Core.Database import connect_to_mongo, close_mongo_connection
+from App.Core.StaticExport import export_all
+from App.Api.Profile import load_profile_cache
+from App.Api import Photos, Videos, Edits  # Register Their Static Views
+
+
+async def export():
+    await connect_to_mongo()
+    try:
+        await load_profile_cache()
+        result = await export_all(lambda done, total: print(f"Exported {done}/{total}"))
+    finally:
+        await close_mongo_connection()
+    print(f"Done: {result['files']} File(s) Written To {result['directory']}")
+    if not settings.static_export_enabled:
+        print("Note: STATIC_EXPORT_ENABLED Is Off, So Admin Edits Won't Refresh These Files")
+
+
+if __name__ == "__main__":
+    if "--output" in sys.argv:
+        settings.static_export_directory = sys.argv[sys.argv.index("--output") + 1]
+    asyncio.run(export())
@@ -0,0 +1,120 @@
+"""
+Circuit Breaker Transitions, Including The Background Probe That Closes It.
+Run From The Backend Directory: python -m pytest
+"""
+import asyncio
+import pytest
+from App.Core import Database
+from App.Core.CircuitBreaker import CircuitBreaker, ServiceUnavailableError
+from App.Core.Config import settings
+
+
+def test_stays_closed_below_threshold():
+    breaker = CircuitBreaker("test_below", failure_threshold=3)
+    breaker.record_failure(ConnectionError("1"))
+    breaker.record_failure(ConnectionError("2"))
+    breaker.check()
+    assert breaker.snapshot()["state"] == "closed"
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker("test_success", failure_threshold=2)
+    breaker.record_failure(ConnectionError("1"))
+    breaker.record_success()
+    breaker.record_failure(ConnectionError("2"))
+    assert not breaker.is_open
+
+
+def test_opens_at_threshold_and_fails_fast():
+    breaker = CircuitBreaker("test_open", failure_threshold=2)
+    breaker.record_failure(ConnectionError("1"))
+    breaker.record_failure(ConnectionError("Connection Refused"))
+    assert breaker.is_open
+    with pytest.raises(ServiceUnavailableError, match="Connection Refused"):
+        breaker.check()
+
+
+def test_reset_closes():
+    breaker = CircuitBreaker("test_reset", failure_threshold=1)
+    breaker.trip(ConnectionError("Down"))
+    breaker.reset()
+    breaker.check()
+    assert breaker.snapshot() == {"state": "closed", "opened_at": None, "consecutive_failures": 0, "last_error": "Down"}
+
+
+class FakeAdmin:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.pings = 0
+
+    async def command(self, name):
+        self.pings += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if outcome is not None:
+            raise outcome
+        return {"ok": 1}
+
+
+class FakeClient:
+    def __init__(self, outcomes):
+        self.admin = FakeAdmin(outcomes)
+
+
+@pytest.fixture
+def probe(monkeypatch):
+    """Run The Database Probe Against A Fake Client With Its Own Breaker"""
+    breaker = CircuitBreaker("test_probe", failure_threshold=1)
+    monkeypatch.setattr(Database, "db_breaker", breaker)
+    monkeypatch.setattr(Database, "database", object())
+    monkeypatch.setattr(settings, "db_probe_interval_seconds", 0)
+    return breaker
+
+
+def run_probe(until, on_reconnect=None, timeout: float = 1.0):
+    async def scenario():
+        task = asyncio.create_task(Database._probe_database(on_reconnect))
+        try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while not until() and loop.time() < deadline:
+                await asyncio.sleep(0.001)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_probe_leaves_a_closed_circuit_alone(probe, monkeypatch):
+    client = FakeClient([])
+    monkeypatch.setattr(Database, "client", client)
+    run_probe(until=lambda: False, timeout=0.02)
+    assert client.admin.pings == 0
+
+
+def test_failed_probe_keeps_the_circuit_open(probe, monkeypatch):
+    client = FakeClient([ConnectionError("Still Down")] * 100)
+    monkeypatch.setattr(Database, "client", client)
+    probe.trip(ConnectionError("Down"))
+
+    run_probe(until=lambda: client.admin.pings >= 3)
+
+    assert probe.is_open
+    assert probe.last_error == "Still Down"
+
+
+def test_successful_probe_closes_the_circuit_and_reloads(probe, monkeypatch):
+    client = FakeClient([ConnectionError("Still Down"), None])
+    monkeypatch.setattr(Database, "client", client)
+    probe.trip(ConnectionError("Down"))
+    reloads = []
+
+    async def on_reconnect():
+        reloads.append(1)
+
+    run_probe(until=lambda: reloads, on_reconnect=on_reconnect)
+
+    assert not probe.is_open
+    assert client.admin.pings == 2
+    assert reloads == [1]
+    probe.check()
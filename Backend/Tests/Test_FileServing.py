@@ -0,0 +1,69 @@
+"""
+Range Header Parsing And Range Responses.
+Run From The Backend Directory: python -m pytest
+"""
+import asyncio
+import pytest
+from starlette.requests import Request
+from App.Core.FileServing import RangeNotSatisfiable, _parse_range, file_response
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", (0, 9)),
+    ("bytes=90-", (90, 99)),
+    ("bytes=90-200", (90, 99)),
+    ("bytes=-10", (90, 99)),
+    ("bytes=-500", (0, 99)),
+])
+def test_satisfiable_ranges(header, expected):
+    assert _parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=150-200", "bytes=50-40", "bytes=-0"])
+def test_unsatisfiable_ranges(header):
+    with pytest.raises(RangeNotSatisfiable):
+        _parse_range(header, 100)
+
+
+@pytest.mark.parametrize("header", ["bytes=0-1,5-6", "items=0-9", "bytes=a-b", "bytes=-x"])
+def test_unsupported_ranges_serve_the_whole_file(header):
+    assert _parse_range(header, 100) is None
+
+
+def make_request(headers: dict, method: str = "GET") -> Request:
+    return Request({
+        "type": "http",
+        "method": method,
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+@pytest.fixture
+def media_file(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(bytes(range(100)))
+    return str(path)
+
+
+def test_out_of_range_request_gets_416(media_file):
+    response = asyncio.run(file_response(make_request({"Range": "bytes=100-"}), media_file))
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */100"
+
+
+def test_suffix_range_gets_206(media_file):
+    response = asyncio.run(file_response(make_request({"Range": "bytes=-10"}), media_file))
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 90-99/100"
+    assert response.headers["content-length"] == "10"
+
+
+def test_stale_if_range_serves_the_whole_file(media_file):
+    response = asyncio.run(file_response(make_request({"Range": "bytes=-10", "If-Range": '"other"'}), media_file))
+    assert response.status_code == 200
+    assert response.headers["content-length"] == "100"
+
+
+def test_directory_is_not_served(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(file_response(make_request({}), str(tmp_path)))
@@ -0,0 +1,64 @@
+"""
+Token-Bucket Refill And Bucket Eviction.
+Run From The Backend Directory: python -m pytest
+"""
+import pytest
+from App.Core.RateLimit import TokenBucketLimiter, parse_limit
+
+
+def test_parse_limit():
+    assert parse_limit("60/60") == (60, 60.0)
+    assert parse_limit("5") == (5, 1.0)
+
+
+def test_bucket_allows_capacity_then_reports_wait():
+    limiter = TokenBucketLimiter(capacity=3, period=3, max_buckets=10)
+    assert [limiter.acquire("client", 0) for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire("client", 0) == pytest.approx(1.0)
+
+
+def test_bucket_refills_at_capacity_per_period():
+    limiter = TokenBucketLimiter(capacity=3, period=3, max_buckets=10)
+    for _ in range(3):
+        limiter.acquire("client", 0)
+    assert limiter.acquire("client", 0.5) == pytest.approx(0.5)
+    # Two Seconds Refill Two Tokens
+    assert limiter.acquire("client", 2.5) == 0
+    assert limiter.acquire("client", 2.5) == 0
+    assert limiter.acquire("client", 2.5) > 0
+
+
+def test_bucket_refill_is_capped_at_capacity():
+    limiter = TokenBucketLimiter(capacity=2, period=1, max_buckets=10)
+    limiter.acquire("client", 0)
+    assert [limiter.acquire("client", 1000) for _ in range(2)] == [0, 0]
+    assert limiter.acquire("client", 1000) > 0
+
+
+def test_clients_have_separate_buckets():
+    limiter = TokenBucketLimiter(capacity=1, period=60, max_buckets=10)
+    assert limiter.acquire("a", 0) == 0
+    assert limiter.acquire("a", 0) > 0
+    assert limiter.acquire("b", 0) == 0
+
+
+def test_full_table_evicts_least_recently_used_bucket():
+    limiter = TokenBucketLimiter(capacity=2, period=60, max_buckets=3)
+    limiter.acquire("steady", 0)
+    limiter.acquire("a", 1)
+    limiter.acquire("b", 2)
+    limiter.acquire("steady", 3)  # Now The Most Recently Used
+
+    limiter.acquire("c", 4)
+
+    assert list(limiter.buckets) == ["b", "steady", "c"]
+    # The Steady Client Kept Its (Empty) Bucket Instead Of Getting A Fresh One
+    assert limiter.acquire("steady", 4) > 0
+
+
+def test_evict_idle_drops_only_idle_buckets():
+    limiter = TokenBucketLimiter(capacity=2, period=60, max_buckets=10)
+    limiter.acquire("old", 0)
+    limiter.acquire("recent", 90)
+    assert limiter.evict_idle(now=100, idle_seconds=50) == 1
+    assert list(limiter.buckets) == ["recent"]
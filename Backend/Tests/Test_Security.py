@@ -0,0 +1,113 @@
+"""
+Verified-Token Cache And Revocation.
+Run From The Backend Directory: python -m pytest
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+import pytest
+from jose import jwt
+from App.Core import Security
+from App.Core.CircuitBreaker import ServiceUnavailableError
+from App.Core.Config import settings
+
+
+class FakeRevocations:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.saved = {}
+
+    async def update_one(self, query, update, upsert=False):
+        if self.fail:
+            raise ConnectionError("MongoDB Down")
+        self.saved[query["_id"]] = update["$set"]
+
+
+class FakeDatabase:
+    def __init__(self, fail: bool = False):
+        self.revoked_tokens = FakeRevocations(fail)
+
+
+@pytest.fixture(autouse=True)
+def clean_state(monkeypatch):
+    Security.clear_token_cache()
+    Security._revoked_tokens.clear()
+    Security.token_cache_stats.update(hits=0, misses=0)
+    monkeypatch.setattr(settings, "token_cache_ttl_seconds", 300)
+    yield
+    Security.clear_token_cache()
+    Security._revoked_tokens.clear()
+
+
+def make_token(expires_in: float = 3600) -> str:
+    return Security.create_access_token({"sub": "admin@example.com"}, expires_delta=timedelta(seconds=expires_in))
+
+
+def test_cached_token_skips_verification(monkeypatch):
+    token = make_token()
+    assert Security.decode_access_token(token)["sub"] == "admin@example.com"
+
+    def verify_again(token):
+        raise AssertionError("Cached Token Was Verified Again")
+
+    monkeypatch.setattr(Security, "_verify_access_token", verify_again)
+    assert Security.decode_access_token(token)["sub"] == "admin@example.com"
+    assert Security.token_cache_stats == {"hits": 1, "misses": 1}
+
+
+def test_cache_entry_expires_after_ttl(monkeypatch):
+    monkeypatch.setattr(settings, "token_cache_ttl_seconds", 10)
+    token = make_token()
+    now = time.time()
+    monkeypatch.setattr(Security.time, "time", lambda: now)
+    Security.decode_access_token(token)
+
+    monkeypatch.setattr(Security.time, "time", lambda: now + 11)
+    assert Security.decode_access_token(token) is not None
+    assert Security.token_cache_stats == {"hits": 0, "misses": 2}
+
+
+def test_cache_expiry_never_outlives_the_token():
+    token = make_token(expires_in=5)
+    payload = Security.decode_access_token(token)
+    _, cache_expiry = Security._token_cache[token]
+    assert cache_expiry == payload["exp"]
+
+
+def test_invalid_token_is_not_cached():
+    assert Security.decode_access_token("not-a-token") is None
+    assert not Security._token_cache
+
+
+def test_revoked_token_is_rejected_from_cache(monkeypatch):
+    database = FakeDatabase()
+    monkeypatch.setattr(Security, "get_database", lambda: database)
+    token = make_token()
+    payload = Security.decode_access_token(token)
+
+    asyncio.run(Security.revoke_token(payload))
+
+    assert Security.decode_access_token(token) is None
+    assert Security.token_cache_stats["hits"] == 1
+    assert payload["jti"] in database.revoked_tokens.saved
+
+
+def test_token_without_jti_can_be_revoked(monkeypatch):
+    monkeypatch.setattr(Security, "get_database", lambda: FakeDatabase())
+    expires = datetime.utcnow() + timedelta(hours=1)
+    token = jwt.encode({"sub": "admin@example.com", "exp": expires}, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+    payload = Security.decode_access_token(token)
+    assert "jti" not in payload
+
+    asyncio.run(Security.revoke_token(payload))
+
+    assert Security.decode_access_token(token) is None
+    # Other Tokens Are Unaffected
+    assert Security.decode_access_token(make_token()) is not None
+
+
+def test_unpersisted_revocation_raises(monkeypatch):
+    monkeypatch.setattr(Security, "get_database", lambda: FakeDatabase(fail=True))
+    payload = Security.decode_access_token(make_token())
+    with pytest.raises(ServiceUnavailableError):
+        asyncio.run(Security.revoke_token(payload))
@@ -0,0 +1,96 @@
+"""
+Coalescing Of Concurrent Identical Reads.
+Run From The Backend Directory: python -m pytest
+"""
+import asyncio
+import pytest
+from App.Core.Singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_query():
+    group = SingleFlight("test_shared")
+    calls = []
+
+    async def query():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["result"]
+
+    async def scenario():
+        return await asyncio.gather(*(group.do("key", query) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert (group.leaders, group.followers) == (1, 4)
+    assert group.in_flight() == 0
+
+
+def test_different_keys_run_separately():
+    group = SingleFlight("test_keys")
+
+    async def query(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    async def scenario():
+        return await asyncio.gather(group.do("a", lambda: query("a")), group.do("b", lambda: query("b")))
+
+    assert asyncio.run(scenario()) == ["a", "b"]
+    assert group.leaders == 2
+
+
+def test_sequential_calls_are_not_cached():
+    group = SingleFlight("test_sequential")
+    calls = []
+
+    async def query():
+        calls.append(1)
+        return len(calls)
+
+    async def scenario():
+        return [await group.do("key", query), await group.do("key", query)]
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_error_reaches_every_caller_and_is_not_remembered():
+    group = SingleFlight("test_errors")
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("Query Failed")
+
+    async def succeeding():
+        return "ok"
+
+    async def scenario():
+        results = await asyncio.gather(*(group.do("key", failing) for _ in range(3)), return_exceptions=True)
+        return results, await group.do("key", succeeding)
+
+    results, retried = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert retried == "ok"
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    group = SingleFlight("test_cancel")
+
+    async def query():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def scenario():
+        leader = asyncio.create_task(group.do("key", query))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(group.do("key", query))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(scenario()) == "done"
@@ -18,6 +18,20 @@ const getThumbnailUrl = (photo, size = 800) => {
   return getFullImageUrl(photo);
 };
 
+// Rendered Width Of A Grid Cell, Used To Pick The Right Variant From srcset
+const GRID_IMAGE_SIZES = '(max-width: 768px) 100vw, (max-width: 1200px) 50vw, 33vw';
+
+// Placeholder Shown Until The Real Image Arrives (Dominant Color + Blurred Preview)
+const getPlaceholderStyle = (photo) => {
+  if (!photo.placeholder && !photo.dominant_color) return undefined;
+  return {
+    backgroundColor: photo.dominant_color,
+    backgroundImage: photo.placeholder ? `url(${photo.placeholder})` : undefined,
+    backgroundSize: 'cover',
+    backgroundPosition: 'center'
+  };
+};
+
 export default function Photography() {
   const [photos, setPhotos] = useState([]);
   const [categories, setCategories] = useState([]);
@@ -115,12 +129,22 @@ export default function Photography() {
                   viewport={{ once: true }}
                   whileHover={{ y: -5 }}
                   onClick={() => setSelectedPhoto(photo)}
+                  style={getPlaceholderStyle(photo)}
                 >
-                  <img
-                    src={getThumbnailUrl(photo)}
-                    alt={photo.title}
-                    loading="lazy"
-                  />
+                  <picture>
+                    {photo.srcset?.webp && (
+                      <source type="image/webp" srcSet={photo.srcset.webp} sizes={GRID_IMAGE_SIZES} />
+                    )}
+                    <img
+                      src={getThumbnailUrl(photo)}
+                      srcSet={photo.srcset?.jpeg}
+                      sizes={GRID_IMAGE_SIZES}
+                      width={photo.width}
+                      height={photo.height}
+                      alt={photo.title}
+                      loading="lazy"
+                    />
+                  </picture>
                   <div className="photo-overlay">
                     <h3>{photo.title}</h3>
                     <p>{photo.category}</p>